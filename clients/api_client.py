@@ -1,13 +1,159 @@
-from typing import Any
+import time
+from typing import Any, Callable, NamedTuple, TypeVar
 
-from httpx import Client, URL, Response, QueryParams
-from httpx._types import RequestData, RequestFiles
+from httpx import AsyncClient, Client, URL, Response, QueryParams
+from httpx._types import RequestContent, RequestData, RequestFiles
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+from tools.assertions.schema import validate_json_schema
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class RequestRecord(NamedTuple):
+    """
+    Описание выполненного запроса, которое получают подписчики request_listeners.
+    """
+
+    method: str
+    path: str
+    status_code: int | None
+    elapsed: float
+    error: BaseException | None = None
+    # Полный ответ вместе с исходным запросом (None, если запрос завершился ошибкой)
+    response: Response | None = None
+
+
+RequestListener = Callable[[RequestRecord], None]
+
+# Подписчики на выполненные запросы (метрики, нагрузочные отчёты и т.п.)
+request_listeners: list[RequestListener] = []
+
+
+def add_request_listener(listener: RequestListener) -> None:
+    """
+    Подписывает функцию на все запросы, выполняемые через APIClient и AsyncAPIClient.
+
+    :param listener: Функция, которая получает RequestRecord после каждого запроса.
+    """
+    request_listeners.append(listener)
+
+
+def remove_request_listener(listener: RequestListener) -> None:
+    """
+    Отписывает функцию от запросов.
+
+    :param listener: Ранее добавленная функция.
+    """
+    request_listeners.remove(listener)
+
+
+def notify_request_listeners(
+    method: str,
+    url: URL | str,
+    started_at: float,
+    response: Response | None = None,
+    error: BaseException | None = None,
+) -> None:
+    record = RequestRecord(
+        method=method,
+        path=response.request.url.path if response is not None else URL(url).path,
+        status_code=response.status_code if response is not None else None,
+        elapsed=time.perf_counter() - started_at,
+        error=error,
+        response=response,
+    )
+    for listener in request_listeners:
+        listener(record)
+
+
+def encode_json_body(model: BaseModel) -> bytes:
+    """
+    Функция сериализует модель запроса сразу в JSON-байты, минуя промежуточный словарь.
+
+    :param model: Pydantic-модель тела запроса.
+    :return: Тело запроса в формате JSON.
+    """
+    return model.model_dump_json(by_alias=True).encode()
+
+
+def prepare_request_kwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """
+    Функция заменяет pydantic-модель в параметре json на готовые JSON-байты.
+
+    :param kwargs: Параметры запроса httpx.
+    :return: Параметры запроса, в которых модель передана как content с заголовком JSON.
+    """
+    body = kwargs.get("json")
+    if not isinstance(body, BaseModel):
+        return kwargs
+
+    return {
+        **kwargs,
+        "json": None,
+        "content": encode_json_body(body),
+        "headers": {**(kwargs.get("headers") or {}), **JSON_HEADERS},
+    }
+
+
+def parse_response(
+    response: Response, model: type[ModelT], validate_schema: bool = True
+) -> tuple[ModelT, Any]:
+    """
+    Функция один раз декодирует тело ответа и проверяет по нему модель и JSON-схему.
+
+    Байты ответа разбираются быстрым JSON-парсером pydantic-core без промежуточной строки,
+    после чего один и тот же объект используется и для pydantic-модели, и для JSON-схемы.
+
+    :param response: Ответ сервера.
+    :param model: Pydantic-модель ответа.
+    :param validate_schema: Проверять ли JSON-схему модели.
+    :return: Модель ответа и разобранный JSON.
+    :raises pydantic.ValidationError: Если ответ не соответствует модели.
+    :raises jsonschema.exceptions.ValidationError: Если ответ не соответствует JSON-схеме.
+    """
+    data = from_json(response.content)
+    response_data = model.model_validate(data)
+
+    if validate_schema:
+        validate_json_schema(data, model)
+
+    return response_data, data
 
 
 class APIClient:
     def __init__(self, client: Client):
         self.client = client
 
+    # Помощник для разбора ответов доступен прямо из клиента
+    parse_response = staticmethod(parse_response)
+
+    def request(self, method: str, url: URL | str, **kwargs: Any) -> Response:
+        """
+        Выполняет HTTP-запрос и сообщает о нём подписчикам request_listeners.
+
+        :param method: HTTP-метод.
+        :param url: URL-адрес эндпоинта.
+        :param kwargs: Параметры запроса httpx (params, json, data, files, content, headers).
+        :return: Объект Response с данными ответа.
+        """
+        kwargs = prepare_request_kwargs(kwargs)
+        if not request_listeners:
+            return self.client.request(method, url, **kwargs)
+
+        started_at = time.perf_counter()
+        try:
+            response = self.client.request(method, url, **kwargs)
+        except Exception as error:
+            notify_request_listeners(method, url, started_at, error=error)
+            raise
+
+        notify_request_listeners(method, url, started_at, response=response)
+        return response
+
     def get(self, url: URL | str, params: QueryParams | None = None) -> Response:
         """
         Выполняет GET-запрос.
@@ -16,7 +162,7 @@ class APIClient:
         :param params: GET-параметры запроса (например, ?key=value).
         :return: Объект Response с данными ответа.
         """
-        return self.client.get(url, params=params)
+        return self.request("GET", url, params=params)
 
     def post(
         self,
@@ -24,27 +170,39 @@ class APIClient:
         json: Any | None = None,
         data: RequestData | None = None,
         files: RequestFiles | None = None,
+        content: RequestContent | None = None,
+        headers: dict[str, str] | None = None,
     ) -> Response:
         """
         Выполняет POST-запрос.
 
         :param url: URL-адрес эндпоинта.
-        :param json: Данные в формате JSON.
+        :param json: Данные в формате JSON или pydantic-модель, которая сразу сериализуется в байты.
         :param data: Форматированные данные формы (например, application/x-www-form-urlencoded).
         :param files: Файлы для загрузки на сервер.
+        :param content: Готовое тело запроса (байты или поток байтов).
+        :param headers: Дополнительные заголовки запроса.
         :return: Объект Response с данными ответа.
         """
-        return self.client.post(url, json=json, data=data, files=files)
+        return self.request(
+            "POST",
+            url,
+            json=json,
+            data=data,
+            files=files,
+            content=content,
+            headers=headers,
+        )
 
     def patch(self, url: URL | str, json: Any | None = None) -> Response:
         """
         Выполняет PATCH-запрос (частичное обновление данных).
 
         :param url: URL-адрес эндпоинта.
-        :param json: Данные для обновления в формате JSON.
+        :param json: Данные для обновления в формате JSON или pydantic-модель.
         :return: Объект Response с данными ответа.
         """
-        return self.client.patch(url, json=json)
+        return self.request("PATCH", url, json=json)
 
     def delete(self, url: URL | str) -> Response:
         """
@@ -53,4 +211,94 @@ class APIClient:
         :param url: URL-адрес эндпоинта.
         :return: Объект Response с данными ответа.
         """
-        return self.client.delete(url)
+        return self.request("DELETE", url)
+
+
+class AsyncAPIClient:
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    # Помощник для разбора ответов доступен прямо из клиента
+    parse_response = staticmethod(parse_response)
+
+    async def request(self, method: str, url: URL | str, **kwargs: Any) -> Response:
+        """
+        Выполняет асинхронный HTTP-запрос и сообщает о нём подписчикам request_listeners.
+
+        :param method: HTTP-метод.
+        :param url: URL-адрес эндпоинта.
+        :param kwargs: Параметры запроса httpx (params, json, data, files, content, headers).
+        :return: Объект Response с данными ответа.
+        """
+        kwargs = prepare_request_kwargs(kwargs)
+        if not request_listeners:
+            return await self.client.request(method, url, **kwargs)
+
+        started_at = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except Exception as error:
+            notify_request_listeners(method, url, started_at, error=error)
+            raise
+
+        notify_request_listeners(method, url, started_at, response=response)
+        return response
+
+    async def get(self, url: URL | str, params: QueryParams | None = None) -> Response:
+        """
+        Выполняет асинхронный GET-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :return: Объект Response с данными ответа.
+        """
+        return await self.request("GET", url, params=params)
+
+    async def post(
+        self,
+        url: URL | str,
+        json: Any | None = None,
+        data: RequestData | None = None,
+        files: RequestFiles | None = None,
+        content: RequestContent | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Response:
+        """
+        Выполняет асинхронный POST-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные в формате JSON или pydantic-модель, которая сразу сериализуется в байты.
+        :param data: Форматированные данные формы (например, application/x-www-form-urlencoded).
+        :param files: Файлы для загрузки на сервер.
+        :param content: Готовое тело запроса (байты или поток байтов).
+        :param headers: Дополнительные заголовки запроса.
+        :return: Объект Response с данными ответа.
+        """
+        return await self.request(
+            "POST",
+            url,
+            json=json,
+            data=data,
+            files=files,
+            content=content,
+            headers=headers,
+        )
+
+    async def patch(self, url: URL | str, json: Any | None = None) -> Response:
+        """
+        Выполняет асинхронный PATCH-запрос (частичное обновление данных).
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные для обновления в формате JSON или pydantic-модель.
+        :return: Объект Response с данными ответа.
+        """
+        return await self.request("PATCH", url, json=json)
+
+    async def delete(self, url: URL | str) -> Response:
+        """
+        Выполняет асинхронный DELETE-запрос (удаление данных).
+
+        :param url: URL-адрес эндпоинта.
+        :return: Объект Response с данными ответа.
+        """
+        return await self.request("DELETE", url)
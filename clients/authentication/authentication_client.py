@@ -1,6 +1,6 @@
 from httpx import Response
 
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 
 # Добавили импорт моделей
 from clients.authentication.authentication_schema import (
@@ -8,7 +8,10 @@ from clients.authentication.authentication_schema import (
     RefreshRequestSchema,
     LoginResponseSchema,
 )
-from clients.public_http_builder import get_public_http_client
+from clients.public_http_builder import (
+    get_public_http_client,
+    get_async_public_http_client,
+)
 
 
 # Старые модели с использованием TypedDict были удалены
@@ -29,8 +32,8 @@ class AuthenticationClient(APIClient):
         """
         return self.post(
             "/api/v1/authentication/login",
-            # Сериализуем модель в словарь с использованием alias
-            json=request.model_dump(by_alias=True),
+            # Модель передаётся как есть: APIClient кодирует её в JSON по alias (prepare_request_kwargs)
+            json=request,
         )
 
     # Теперь используем pydantic-модель для аннотации
@@ -43,15 +46,25 @@ class AuthenticationClient(APIClient):
         """
         return self.post(
             "/api/v1/authentication/refresh",
-            # Сериализуем модель в словарь с использованием alias
-            json=request.model_dump(by_alias=True),
+            # Модель передаётся как есть: APIClient кодирует её в JSON по alias (prepare_request_kwargs)
+            json=request,
         )
 
     # Теперь используем pydantic-модель для аннотации
     def login(self, request: LoginRequestSchema) -> LoginResponseSchema:
         response = self.login_api(request)
         # Инициализируем модель через валидацию JSON строки
-        return LoginResponseSchema.model_validate_json(response.text)
+        return LoginResponseSchema.model_validate_json(response.content)
+
+    def refresh(self, request: RefreshRequestSchema) -> LoginResponseSchema:
+        """
+        Метод обновления токена с автоматической обработкой ответа.
+
+        :param request: Словарь с refreshToken.
+        :return: Ответ от сервера с новой парой токенов.
+        """
+        response = self.refresh_api(request)
+        return LoginResponseSchema.model_validate_json(response.content)
 
 
 def get_authentication_client() -> AuthenticationClient:
@@ -61,3 +74,44 @@ def get_authentication_client() -> AuthenticationClient:
     :return: Готовый к использованию AuthenticationClient.
     """
     return AuthenticationClient(client=get_public_http_client())
+
+
+class AsyncAuthenticationClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/authentication
+    """
+
+    async def login_api(self, request: LoginRequestSchema) -> Response:
+        """
+        Метод выполняет аутентификацию пользователя.
+
+        :param request: Словарь с email и password.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.post("/api/v1/authentication/login", json=request)
+
+    async def refresh_api(self, request: RefreshRequestSchema) -> Response:
+        """
+        Метод обновляет токен авторизации.
+
+        :param request: Словарь с refreshToken.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.post("/api/v1/authentication/refresh", json=request)
+
+    async def login(self, request: LoginRequestSchema) -> LoginResponseSchema:
+        response = await self.login_api(request)
+        return LoginResponseSchema.model_validate_json(response.content)
+
+    async def refresh(self, request: RefreshRequestSchema) -> LoginResponseSchema:
+        response = await self.refresh_api(request)
+        return LoginResponseSchema.model_validate_json(response.content)
+
+
+def get_async_authentication_client() -> AsyncAuthenticationClient:
+    """
+    Функция создаёт экземпляр AsyncAuthenticationClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncAuthenticationClient.
+    """
+    return AsyncAuthenticationClient(client=get_async_public_http_client())
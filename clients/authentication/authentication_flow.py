@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+from http import HTTPStatus
+from typing import AsyncGenerator, Generator
+
+from httpx import Auth, Request, Response
+
+from clients.authentication.authentication_schema import (
+    LoginRequestSchema,
+    TokenSchema,
+)
+from clients.authentication.token_cache import (
+    REFRESH_MARGIN,
+    get_token_cache,
+    get_token_expiry,
+)
+
+# Ключ request.extensions, в котором хранится email пользователя запроса
+USER_EXTENSION = "autotests.user"
+
+
+class TokenAuth(Auth):
+    """
+    Слой авторизации с автоматическим обновлением access-токена.
+
+    Добавляет заголовок Authorization к каждому запросу. Токен обновляется заранее,
+    если по claim "exp" он вот-вот истечёт, или после ответа 401 — в этом случае
+    запрос повторяется с новым токеном. Одновременные запросы обновляют токен
+    один раз под общей блокировкой.
+    """
+
+    def __init__(self, request: LoginRequestSchema, token: TokenSchema):
+        """
+        :param request: Учётные данные пользователя для обновления токена.
+        :param token: Текущая пара токенов.
+        """
+        self.request = request
+        self.token = token
+        self._lock = threading.Lock()
+        self._async_lock: asyncio.Lock | None = None
+
+    @property
+    def is_expiring(self) -> bool:
+        expires_at = get_token_expiry(self.token.access_token)
+        return expires_at is not None and expires_at - REFRESH_MARGIN <= time.time()
+
+    def sync_auth_flow(self, request: Request) -> Generator[Request, Response, None]:
+        if self.is_expiring:
+            with self._lock:
+                if self.is_expiring:
+                    self.token = get_token_cache().get_token(self.request)
+
+        token = self._authorize(request)
+        response = yield request
+
+        if response.status_code == HTTPStatus.UNAUTHORIZED:
+            with self._lock:
+                self._renew(token)
+
+            self._authorize(request)
+            yield request
+
+    async def async_auth_flow(
+        self, request: Request
+    ) -> AsyncGenerator[Request, Response]:
+        # asyncio.Lock создаём лениво, чтобы он был привязан к event loop клиента
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+
+        if self.is_expiring:
+            async with self._async_lock:
+                if self.is_expiring:
+                    self.token = await asyncio.to_thread(
+                        get_token_cache().get_token, self.request
+                    )
+
+        token = self._authorize(request)
+        response = yield request
+
+        if response.status_code == HTTPStatus.UNAUTHORIZED:
+            async with self._async_lock:
+                await asyncio.to_thread(self._renew, token)
+
+            self._authorize(request)
+            yield request
+
+    def _authorize(self, request: Request) -> TokenSchema:
+        token = self.token
+        request.headers["Authorization"] = f"Bearer {token.access_token}"
+        # Пользователь запроса нужен журналу трафика, сам токен туда не записывается
+        request.extensions[USER_EXTENSION] = self.request.email
+        return token
+
+    def _renew(self, stale_token: TokenSchema) -> None:
+        # Пока запрос ждал блокировку, токен мог уже обновить другой поток
+        if self.token is stale_token:
+            self.token = get_token_cache().renew_token(self.request, stale_token)
@@ -0,0 +1,204 @@
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import time
+from functools import lru_cache
+from http import HTTPStatus
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+from clients.authentication.authentication_client import (
+    AuthenticationClient,
+    get_authentication_client,
+)
+from clients.authentication.authentication_schema import (
+    LoginRequestSchema,
+    LoginResponseSchema,
+    RefreshRequestSchema,
+    TokenSchema,
+)
+from config import settings
+from tools.file_lock import FileLock
+
+# Каталог кеша общий для всех воркеров pytest-xdist и для последующих запусков
+TOKEN_CACHE_DIR = Path(tempfile.gettempdir()) / "autotests-api" / "tokens"
+# Время жизни токена, если в нём нет claim "exp" (значение JWT_ACCESS_TOKEN_EXPIRE по умолчанию)
+DEFAULT_TOKEN_TTL = 1800
+# За сколько секунд до истечения access-токен считается устаревшим и обновляется
+REFRESH_MARGIN = 60
+
+
+def get_token_expiry(token: str) -> float | None:
+    """
+    Функция извлекает время истечения токена из claim "exp" без проверки подписи.
+
+    :param token: JWT-токен.
+    :return: Unix-время истечения токена или None, если токен не является JWT с claim "exp".
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload))["exp"]
+        return float(exp)
+    except (IndexError, ValueError, KeyError, TypeError):
+        return None
+
+
+class CachedTokenSchema(BaseModel):
+    """
+    Описание структуры записи кеша токенов.
+    """
+
+    token: TokenSchema
+    expires_at: float
+    refresh_expires_at: float | None
+
+    @classmethod
+    def from_token(cls, token: TokenSchema) -> "CachedTokenSchema":
+        expires_at = get_token_expiry(token.access_token)
+        return cls(
+            token=token,
+            expires_at=expires_at or time.time() + DEFAULT_TOKEN_TTL,
+            refresh_expires_at=get_token_expiry(token.refresh_token),
+        )
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.expires_at - REFRESH_MARGIN > time.time()
+
+    @property
+    def is_refreshable(self) -> bool:
+        return (
+            self.refresh_expires_at is None
+            or self.refresh_expires_at - REFRESH_MARGIN > time.time()
+        )
+
+
+class TokenCache:
+    """
+    Файловый кеш токенов авторизации, общий для всех воркеров pytest-xdist.
+
+    Каждый пользователь хранится в отдельном файле со своей блокировкой, поэтому
+    воркеры аутентифицируют разных пользователей параллельно, а одного и того же —
+    ровно один раз. Перед истечением access-токен обновляется через /authentication/refresh.
+    """
+
+    def __init__(self, directory: Path, authentication_client: AuthenticationClient):
+        """
+        :param directory: Каталог, в котором хранятся токены.
+        :param authentication_client: Клиент для логина и обновления токенов.
+        """
+        self.directory = directory
+        self.authentication_client = authentication_client
+
+    def get_token(self, request: LoginRequestSchema) -> TokenSchema:
+        """
+        Возвращает действующий токен пользователя, при необходимости обновляя или получая новый.
+
+        :param request: Учётные данные пользователя.
+        :return: Действующая пара токенов.
+        """
+        path = self._get_path(request)
+
+        with FileLock(path.with_suffix(".lock")):
+            cached = self._read(path)
+            if cached and cached.is_fresh:
+                return cached.token
+
+            token = None
+            if cached and cached.is_refreshable:
+                token = self._refresh(cached.token)
+            if token is None:
+                token = self.authentication_client.login(request).token
+
+            self._write(path, CachedTokenSchema.from_token(token))
+            return token
+
+    def renew_token(
+        self, request: LoginRequestSchema, stale_token: TokenSchema
+    ) -> TokenSchema:
+        """
+        Принудительно обновляет токен, который сервер перестал принимать.
+
+        Если другой процесс уже обновил токен, повторного обновления не происходит —
+        возвращается токен из кеша.
+
+        :param request: Учётные данные пользователя.
+        :param stale_token: Токен, с которым запрос получил отказ.
+        :return: Новая пара токенов.
+        """
+        path = self._get_path(request)
+
+        with FileLock(path.with_suffix(".lock")):
+            cached = self._read(path)
+            if cached and cached.token.access_token != stale_token.access_token:
+                return cached.token
+
+            token = self._refresh(stale_token)
+            if token is None:
+                token = self.authentication_client.login(request).token
+
+            self._write(path, CachedTokenSchema.from_token(token))
+            return token
+
+    def invalidate(self, request: LoginRequestSchema) -> None:
+        """
+        Удаляет токен пользователя из кеша.
+
+        :param request: Учётные данные пользователя.
+        """
+        path = self._get_path(request)
+        with FileLock(path.with_suffix(".lock")):
+            path.unlink(missing_ok=True)
+
+    def _refresh(self, token: TokenSchema) -> TokenSchema | None:
+        response = self.authentication_client.refresh_api(
+            RefreshRequestSchema(refreshToken=token.refresh_token)
+        )
+        if response.status_code != HTTPStatus.OK:
+            return None
+
+        return LoginResponseSchema.model_validate_json(response.content).token
+
+    def _get_path(self, request: LoginRequestSchema) -> Path:
+        # Кеш переживает запуски: токены другого стенда или фейкового сервера
+        # с теми же учётными данными хранятся в отдельных записях
+        backend = "fake" if settings.fake_backend else "http"
+        base_url = self.authentication_client.client.base_url
+        # В имени файла не должно быть учётных данных в открытом виде
+        key = hashlib.sha256(
+            f"{request.email}\0{request.password}\0{backend}\0{base_url}".encode()
+        ).hexdigest()
+        return self.directory / f"{key}.json"
+
+    @staticmethod
+    def _read(path: Path) -> CachedTokenSchema | None:
+        try:
+            return CachedTokenSchema.model_validate_json(path.read_text())
+        except (FileNotFoundError, ValidationError):
+            return None
+
+    @staticmethod
+    def _write(path: Path, cached: CachedTokenSchema) -> None:
+        # Пишем во временный файл и атомарно подменяем, чтобы другие воркеры не прочитали половину
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        descriptor = os.open(temp_path, os.O_CREAT | os.O_TRUNC | os.O_WRONLY, 0o600)
+        with os.fdopen(descriptor, "w") as file:
+            file.write(cached.model_dump_json(by_alias=True))
+        os.replace(temp_path, path)
+
+
+@lru_cache(maxsize=None)
+def get_token_cache() -> TokenCache:
+    """
+    Функция создаёт общий для процесса экземпляр TokenCache.
+
+    :return: Готовый к использованию TokenCache.
+    """
+    TOKEN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    return TokenCache(
+        directory=TOKEN_CACHE_DIR, authentication_client=get_authentication_client()
+    )
@@ -0,0 +1,321 @@
+import atexit
+import base64
+import gzip
+import hashlib
+import json
+import re
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, Literal
+
+from httpx import (
+    AsyncBaseTransport,
+    BaseTransport,
+    Request,
+    Response,
+    TransportError,
+)
+from pydantic import BaseModel
+
+from config import settings
+from tools.file_lock import FileLock
+from tools.routes import get_route_template
+
+MatchField = Literal["method", "route", "path", "query", "body"]
+
+# Сколько записей накапливается в памяти перед дозаписью в файл кассеты
+CASSETTE_FLUSH_SIZE = 100
+# Заголовки, которые не сохраняются: тело хранится уже раскодированным,
+# а авторизация не должна попадать в файл
+SKIPPED_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding", "authorization"}
+)
+MULTIPART_BOUNDARY_PATTERN = re.compile(rb"boundary=([^\s;]+)")
+
+
+class CassetteMissError(TransportError):
+    """
+    В кассете нет ответа для запроса.
+    """
+
+
+class CassetteEntrySchema(BaseModel):
+    """
+    Описание структуры записанной пары запрос/ответ.
+    """
+
+    method: str
+    path: str
+    route: str
+    query: str
+    body_hash: str
+    request_headers: list[tuple[str, str]]
+    # Тела хранятся в base64, так как запросы и ответы могут быть бинарными
+    request_content: str
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: str
+
+    @property
+    def request_bytes(self) -> bytes:
+        return base64.b64decode(self.request_content)
+
+    def to_response(self) -> Response:
+        return Response(
+            status_code=self.status_code,
+            headers=self.headers,
+            content=base64.b64decode(self.content),
+        )
+
+
+def normalize_body(content: bytes, content_type: str) -> bytes:
+    """
+    Функция приводит тело запроса к виду, не зависящему от порядка ключей и случайных разделителей.
+
+    :param content: Тело запроса.
+    :param content_type: Значение заголовка Content-Type.
+    :return: Нормализованное тело.
+    """
+    if content_type.startswith("application/json"):
+        try:
+            return json.dumps(json.loads(content), sort_keys=True).encode()
+        except ValueError:
+            return content
+
+    if content_type.startswith("multipart/") and (
+        boundary := MULTIPART_BOUNDARY_PATTERN.search(content_type.encode())
+    ):
+        return content.replace(boundary.group(1), b"boundary")
+
+    return content
+
+
+def get_body_hash(request: Request) -> str:
+    body = normalize_body(request.content, request.headers.get("content-type", ""))
+    return hashlib.sha256(body).hexdigest()
+
+
+def filter_headers(headers) -> list[tuple[str, str]]:
+    return [
+        (name, value)
+        for name, value in headers.items()
+        if name.lower() not in SKIPPED_HEADERS
+    ]
+
+
+class Cassette:
+    """
+    Кассета — сжатый gzip-файл с записанными парами запрос/ответ в формате JSON Lines.
+
+    При загрузке строится индекс по полям из match_on. Запросы с одинаковым ключом
+    получают ответы в порядке записи, а последний ответ повторяется, если запросов
+    больше, чем записей. Запись дозаписывается в файл отдельными gzip-блоками
+    под межпроцессной блокировкой, поэтому в одну кассету могут писать воркеры xdist.
+
+    Запросы содержат случайные данные Faker, поэтому кассету воспроизводят с тем же
+    seed (FAKE_SEED или --fake-seed), идентификатором прогона (FAKE_RUN_ID или --fake-run-id)
+    и числом воркеров xdist, что и при записи.
+    """
+
+    def __init__(self, path: Path, match_on: tuple[MatchField, ...]):
+        """
+        :param path: Путь к файлу кассеты.
+        :param match_on: Поля, по которым запрос сопоставляется с записью.
+        """
+        self.path = path
+        self.match_on = match_on
+        self._lock = threading.Lock()
+        self._pending: list[CassetteEntrySchema] = []
+        self._index: dict[tuple, list[CassetteEntrySchema]] | None = None
+        self._cursors: dict[tuple, int] = {}
+
+    def __iter__(self) -> Iterator[CassetteEntrySchema]:
+        """
+        Лениво читает все записи кассеты в порядке записи.
+        """
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as file:
+                for line in file:
+                    yield CassetteEntrySchema.model_validate_json(line)
+        except FileNotFoundError:
+            return
+
+    def get_key(self, entry: CassetteEntrySchema) -> tuple:
+        return tuple(
+            getattr(entry, "body_hash" if field == "body" else field)
+            for field in self.match_on
+        )
+
+    def find(self, request: Request) -> Response:
+        """
+        Возвращает записанный ответ на запрос.
+
+        :param request: Запрос с уже прочитанным телом.
+        :return: Ответ из кассеты.
+        :raises CassetteMissError: Если подходящей записи нет.
+        """
+        key = self.get_key(self.build_entry(request))
+
+        with self._lock:
+            if self._index is None:
+                self._index = {}
+                for entry in self:
+                    self._index.setdefault(self.get_key(entry), []).append(entry)
+
+            entries = self._index.get(key)
+            if not entries:
+                raise CassetteMissError(
+                    f"В кассете {self.path} нет ответа на {request.method} {request.url} "
+                    f"(сопоставление по {', '.join(self.match_on)})",
+                    request=request,
+                )
+
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = min(cursor + 1, len(entries) - 1)
+            return entries[cursor].to_response()
+
+    def record(self, request: Request, response: Response) -> None:
+        """
+        Добавляет пару запрос/ответ в кассету.
+
+        :param request: Запрос с уже прочитанным телом.
+        :param response: Ответ с уже прочитанным телом.
+        """
+        entry = self.build_entry(request, response)
+        with self._lock:
+            self._pending.append(entry)
+            if len(self._pending) < CASSETTE_FLUSH_SIZE:
+                return
+            pending, self._pending = self._pending, []
+
+        self._write(pending)
+
+    def flush(self) -> None:
+        """
+        Записывает накопленные записи в файл.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if pending:
+            self._write(pending)
+
+    @staticmethod
+    def build_entry(
+        request: Request, response: Response | None = None
+    ) -> CassetteEntrySchema:
+        return CassetteEntrySchema(
+            method=request.method,
+            path=request.url.path,
+            route=get_route_template(request.url.path),
+            query=request.url.query.decode(),
+            body_hash=get_body_hash(request),
+            request_headers=filter_headers(request.headers),
+            request_content=base64.b64encode(request.content).decode(),
+            status_code=response.status_code if response else 0,
+            headers=filter_headers(response.headers) if response else [],
+            content=base64.b64encode(response.content).decode() if response else "",
+        )
+
+    def _write(self, entries: list[CassetteEntrySchema]) -> None:
+        lines = "".join(f"{entry.model_dump_json()}\n" for entry in entries)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with FileLock(self.path.with_name(f"{self.path.name}.lock")):
+            # Каждая дозапись — отдельный gzip-блок; gzip читает их подряд как один поток
+            with open(self.path, "ab") as file:
+                file.write(gzip.compress(lines.encode()))
+
+
+class RecordingTransport(BaseTransport):
+    """
+    Синхронный транспорт, который выполняет запросы и записывает их в кассету.
+    """
+
+    def __init__(self, transport: BaseTransport, cassette: Cassette):
+        self.transport = transport
+        self.cassette = cassette
+
+    def handle_request(self, request: Request) -> Response:
+        request.read()
+        response = self.transport.handle_request(request)
+        try:
+            response.read()
+        finally:
+            response.close()
+
+        self.cassette.record(request, response)
+        return Response(
+            status_code=response.status_code,
+            headers=filter_headers(response.headers),
+            content=response.content,
+        )
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRecordingTransport(AsyncBaseTransport):
+    """
+    Асинхронный транспорт, который выполняет запросы и записывает их в кассету.
+    """
+
+    def __init__(self, transport: AsyncBaseTransport, cassette: Cassette):
+        self.transport = transport
+        self.cassette = cassette
+
+    async def handle_async_request(self, request: Request) -> Response:
+        await request.aread()
+        response = await self.transport.handle_async_request(request)
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+
+        self.cassette.record(request, response)
+        return Response(
+            status_code=response.status_code,
+            headers=filter_headers(response.headers),
+            content=response.content,
+        )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class ReplayTransport(BaseTransport, AsyncBaseTransport):
+    """
+    Транспорт, который отвечает на запросы из кассеты без обращения к сети.
+
+    Подходит и для httpx.Client, и для httpx.AsyncClient.
+    """
+
+    def __init__(self, cassette: Cassette):
+        self.cassette = cassette
+
+    def handle_request(self, request: Request) -> Response:
+        request.read()
+        return self.cassette.find(request)
+
+    async def handle_async_request(self, request: Request) -> Response:
+        await request.aread()
+        return self.cassette.find(request)
+
+
+@lru_cache(maxsize=None)
+def get_cassette() -> Cassette:
+    """
+    Функция создаёт общую для процесса кассету из settings.cassette.
+
+    В режиме записи накопленные записи сбрасываются в файл при завершении процесса.
+    Воркеры xdist могут завершиться без atexit, поэтому в pytest записи дополнительно
+    сбрасываются в pytest_sessionfinish (plugins/cassette.py).
+
+    :return: Готовая к использованию кассета.
+    """
+    cassette = Cassette(
+        path=settings.cassette.path, match_on=tuple(settings.cassette.match_on)
+    )
+    if settings.cassette.mode == "record":
+        atexit.register(cassette.flush)
+
+    return cassette
@@ -1,6 +1,6 @@
 from httpx import Response
 
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.courses.courses_schema import (
     GetCoursesQuerySchema,
     CreateCourseRequestSchema,
@@ -9,6 +9,7 @@ from clients.courses.courses_schema import (
 )
 from clients.private_http_builder import (
     get_private_http_client,
+    get_async_private_http_client,
     AuthenticationUserSchema,
 )
 
@@ -44,7 +45,7 @@ class CoursesClient(APIClient):
         previewFileId, createdByUserId.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        return self.post("/api/v1/courses", json=request.model_dump(by_alias=True))
+        return self.post("/api/v1/courses", json=request)
 
     def update_course_api(
         self, course_id: str, request: UpdateCourseRequestSchema
@@ -56,9 +57,7 @@ class CoursesClient(APIClient):
         :param request: Словарь с title, maxScore, minScore, description, estimatedTime.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        return self.patch(
-            f"/api/v1/courses/{course_id}", json=request.model_dump(by_alias=True)
-        )
+        return self.patch(f"/api/v1/courses/{course_id}", json=request)
 
     def delete_course_api(self, course_id: str) -> Response:
         """
@@ -80,7 +79,7 @@ class CoursesClient(APIClient):
         :return: Ответ от сервера в виде словаря с созданным курсом.
         """
         response = self.create_course_api(request)
-        return CreateCourseResponseSchema.model_validate_json(response.text)
+        return CreateCourseResponseSchema.model_validate_json(response.content)
 
 
 # Добавляем builder для CoursesClient
@@ -91,3 +90,84 @@ def get_courses_client(user: AuthenticationUserSchema) -> CoursesClient:
     :return: Готовый к использованию CoursesClient.
     """
     return CoursesClient(client=get_private_http_client(user))
+
+
+class AsyncCoursesClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/courses
+    """
+
+    async def get_courses_api(self, query: GetCoursesQuerySchema) -> Response:
+        """
+        Метод получения списка курсов.
+
+        :param query: Словарь с userId.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.get(
+            "/api/v1/courses", params=query.model_dump(by_alias=True)
+        )
+
+    async def get_course_api(self, course_id: str) -> Response:
+        """
+        Метод получения курса.
+
+        :param course_id: Идентификатор курса.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.get(f"/api/v1/courses/{course_id}")
+
+    async def create_course_api(self, request: CreateCourseRequestSchema) -> Response:
+        """
+        Метод создания курса.
+
+        :param request: Словарь с title, maxScore, minScore, description, estimatedTime,
+        previewFileId, createdByUserId.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.post("/api/v1/courses", json=request)
+
+    async def update_course_api(
+        self, course_id: str, request: UpdateCourseRequestSchema
+    ) -> Response:
+        """
+        Метод обновления курса.
+
+        :param course_id: Идентификатор курса.
+        :param request: Словарь с title, maxScore, minScore, description, estimatedTime.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.patch(f"/api/v1/courses/{course_id}", json=request)
+
+    async def delete_course_api(self, course_id: str) -> Response:
+        """
+        Метод удаления курса.
+
+        :param course_id: Идентификатор курса.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.delete(f"/api/v1/courses/{course_id}")
+
+    async def create_course(
+        self, request: CreateCourseRequestSchema
+    ) -> CreateCourseResponseSchema:
+        """
+        Метод создания курса с автоматической обработкой ответа.
+
+        :param request: Словарь с title, maxScore, minScore, description, estimatedTime,
+            previewFileId, createdByUserId.
+        :return: Ответ от сервера в виде словаря с созданным курсом.
+        """
+        response = await self.create_course_api(request)
+        return CreateCourseResponseSchema.model_validate_json(response.content)
+
+
+async def get_async_courses_client(
+    user: AuthenticationUserSchema,
+) -> AsyncCoursesClient:
+    """
+    Функция создаёт экземпляр AsyncCoursesClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncCoursesClient.
+    """
+    return AsyncCoursesClient(client=await get_async_private_http_client(user))
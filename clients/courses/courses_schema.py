@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field, ConfigDict
 from clients.files.files_schema import FileSchema
 from clients.users.users_schema import UserSchema
+from tools.bulk import BulkBuildMixin
 from tools.fakers import fake
 
 
@@ -31,7 +32,7 @@ class GetCoursesQuerySchema(BaseModel):
     user_id: str = Field(alias="userId")
 
 
-class CreateCourseRequestSchema(BaseModel):
+class CreateCourseRequestSchema(BulkBuildMixin, BaseModel):
     """
     Описание структуры запроса на создание курса.
     """
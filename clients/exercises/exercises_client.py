@@ -2,7 +2,7 @@ from typing import TypedDict
 
 from httpx import Response
 
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.exercises.exercises_schema import (
     UpdateExerciseResponseSchema,
     UpdateExerciseRequestSchema,
@@ -14,6 +14,7 @@ from clients.exercises.exercises_schema import (
 )
 from clients.private_http_builder import (
     get_private_http_client,
+    get_async_private_http_client,
     AuthenticationUserSchema,
 )
 
@@ -48,7 +49,7 @@ class ExercisesClient(APIClient):
         :param request: Словарь с данными для создания упражнения (см. `CreateExerciseRequestDict`).
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        return self.post("/api/v1/exercises", json=request.model_dump(by_alias=True))
+        return self.post("/api/v1/exercises", json=request)
 
     def update_exercise_api(
         self, exercise_id: str, request: UpdateExerciseRequestSchema
@@ -60,9 +61,7 @@ class ExercisesClient(APIClient):
         :param request: Словарь с данными для обновления упражнения (см. `UpdateExerciseRequestDict`).
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        return self.patch(
-            f"/api/v1/exercises/{exercise_id}", json=request.model_dump(by_alias=True)
-        )
+        return self.patch(f"/api/v1/exercises/{exercise_id}", json=request)
 
     def delete_exercise_api(self, exercise_id: str) -> Response:
         """
@@ -81,7 +80,7 @@ class ExercisesClient(APIClient):
         :return: Ответ от сервера в виде словаря с данными упражнения.
         """
         response = self.get_exercise_api(exercises_id)
-        return GetExerciseResponseSchema.model_validate_json(response.text)
+        return GetExerciseResponseSchema.model_validate_json(response.content)
 
     def get_exercises(
         self, query: GetExercisesQuerySchema
@@ -92,8 +91,8 @@ class ExercisesClient(APIClient):
         :param query: Словарь с courseId для фильтрации упражнений.
         :return: Ответ от сервера в виде словаря со списком упражнений.
         """
-        response = self.get_exercises_api(query.model_dump(by_alias=True))
-        return GetExercisesResponseSchema.model_validate_json(response.text)
+        response = self.get_exercises_api(query)
+        return GetExercisesResponseSchema.model_validate_json(response.content)
 
     def create_exercise(
         self, request: CreateExerciseRequestSchema
@@ -106,7 +105,7 @@ class ExercisesClient(APIClient):
         :return: Ответ от сервера в виде словаря с созданным упражнением.
         """
         response = self.create_exercise_api(request)
-        return CreateExerciseResponseSchema.model_validate_json(response.text)
+        return CreateExerciseResponseSchema.model_validate_json(response.content)
 
     def update_exercise(
         self, exercises_id: str, request: UpdateExerciseRequestSchema
@@ -120,7 +119,7 @@ class ExercisesClient(APIClient):
         :return: Ответ от сервера в виде словаря с обновленным упражнением.
         """
         response = self.update_exercise_api(exercises_id, request)
-        return UpdateExerciseResponseSchema.model_validate_json(response.text)
+        return UpdateExerciseResponseSchema.model_validate_json(response.content)
 
 
 def get_exercises_client(user: AuthenticationUserSchema) -> ExercisesClient:
@@ -130,3 +129,121 @@ def get_exercises_client(user: AuthenticationUserSchema) -> ExercisesClient:
     :return: Готовый к использованию ExercisesClient.
     """
     return ExercisesClient(client=get_private_http_client(user))
+
+
+class AsyncExercisesClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/exercises
+    """
+
+    async def get_exercises_api(self, query: GetExercisesQuerySchema) -> Response:
+        """
+        Метод получения списка упражнений.
+
+        :param query: Словарь с courseId.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.get(
+            "/api/v1/exercises", params=query.model_dump(by_alias=True)
+        )
+
+    async def get_exercise_api(self, exercises_id: str) -> Response:
+        """
+        Метод получения упражнения.
+
+        :param exercises_id: Идентификатор упражнения.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.get(f"/api/v1/exercises/{exercises_id}")
+
+    async def create_exercise_api(
+        self, request: CreateExerciseRequestSchema
+    ) -> Response:
+        """
+        Метод создания упражнения.
+
+        :param request: Словарь с данными для создания упражнения (см. `CreateExerciseRequestSchema`).
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.post("/api/v1/exercises", json=request)
+
+    async def update_exercise_api(
+        self, exercise_id: str, request: UpdateExerciseRequestSchema
+    ) -> Response:
+        """
+        Метод обновления упражнения.
+
+        :param exercise_id: Идентификатор упражнения.
+        :param request: Словарь с данными для обновления упражнения (см. `UpdateExerciseRequestSchema`).
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.patch(f"/api/v1/exercises/{exercise_id}", json=request)
+
+    async def delete_exercise_api(self, exercise_id: str) -> Response:
+        """
+        Метод удаления упражнения.
+
+        :param exercise_id: Идентификатор упражнения.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.delete(f"/api/v1/exercises/{exercise_id}")
+
+    async def get_exercise(self, exercises_id: str) -> GetExerciseResponseSchema:
+        """
+        Метод получения упражнения с автоматической обработкой ответа.
+
+        :param exercises_id: Идентификатор упражнения.
+        :return: Ответ от сервера в виде словаря с данными упражнения.
+        """
+        response = await self.get_exercise_api(exercises_id)
+        return GetExerciseResponseSchema.model_validate_json(response.content)
+
+    async def get_exercises(
+        self, query: GetExercisesQuerySchema
+    ) -> GetExercisesResponseSchema:
+        """
+        Метод получения списка упражнений с автоматической обработкой ответа.
+
+        :param query: Словарь с courseId для фильтрации упражнений.
+        :return: Ответ от сервера в виде словаря со списком упражнений.
+        """
+        response = await self.get_exercises_api(query)
+        return GetExercisesResponseSchema.model_validate_json(response.content)
+
+    async def create_exercise(
+        self, request: CreateExerciseRequestSchema
+    ) -> CreateExerciseResponseSchema:
+        """
+        Метод создания упражнения с автоматической обработкой ответа.
+
+        :param request: Словарь с данными для создания упражнения
+            (title, courseId, maxScore, minScore, orderIndex, description, estimatedTime).
+        :return: Ответ от сервера в виде словаря с созданным упражнением.
+        """
+        response = await self.create_exercise_api(request)
+        return CreateExerciseResponseSchema.model_validate_json(response.content)
+
+    async def update_exercise(
+        self, exercises_id: str, request: UpdateExerciseRequestSchema
+    ) -> UpdateExerciseResponseSchema:
+        """
+        Метод обновления упражнения с автоматической обработкой ответа.
+
+        :param exercises_id: Идентификатор упражнения для обновления.
+        :param request: Словарь с обновляемыми полями упражнения
+            (title, maxScore, minScore, orderIndex, description, estimatedTime).
+        :return: Ответ от сервера в виде словаря с обновленным упражнением.
+        """
+        response = await self.update_exercise_api(exercises_id, request)
+        return UpdateExerciseResponseSchema.model_validate_json(response.content)
+
+
+async def get_async_exercises_client(
+    user: AuthenticationUserSchema,
+) -> AsyncExercisesClient:
+    """
+    Функция создаёт экземпляр AsyncExercisesClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncExercisesClient.
+    """
+    return AsyncExercisesClient(client=await get_async_private_http_client(user))
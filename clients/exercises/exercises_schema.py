@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field, ConfigDict
 
+from tools.bulk import BulkBuildMixin
 from tools.fakers import fake
 
 
@@ -36,7 +37,7 @@ class GetExercisesQuerySchema(BaseModel):
     course_id: str = Field(alias="courseId")
 
 
-class CreateExerciseRequestSchema(BaseModel):
+class CreateExerciseRequestSchema(BulkBuildMixin, BaseModel):
     """
     Описание структуры запроса на создание упражнения.
     """
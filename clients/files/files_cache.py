@@ -0,0 +1,171 @@
+import hashlib
+import os
+import tempfile
+from functools import lru_cache
+from http import HTTPStatus
+from os import PathLike
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+from clients.api_client import RequestRecord, add_request_listener
+from clients.files.files_client import FilesClient
+from clients.files.files_schema import (
+    CreateFileRequestSchema,
+    CreateFileResponseSchema,
+    GetFileResponseSchema,
+)
+from clients.files.files_upload import UPLOAD_CHUNK_SIZE
+from tools.file_lock import FileLock
+
+# Каталог кеша общий для всех воркеров pytest-xdist и для последующих запусков
+FILE_CACHE_DIR = Path(tempfile.gettempdir()) / "autotests-api" / "files"
+# Префикс пути, по которому FilesClient и AsyncFilesClient удаляют файл
+FILE_PATH_PREFIX = "/api/v1/files/"
+
+
+class CachedFileSchema(BaseModel):
+    """
+    Описание структуры записи кеша загруженных файлов.
+    """
+
+    response: CreateFileResponseSchema
+
+
+class FileUploadCache:
+    """
+    Кеш загруженных файлов, адресуемый по содержимому.
+
+    Ключ записи — SHA-256 содержимого файла, директория и адрес сервера, поэтому
+    одинаковые байты загружаются на сервер один раз. В пределах процесса найденный файл
+    переиспользуется сразу, а запись с диска (из другого воркера или прошлого запуска)
+    сначала проверяется через get_file_api: если файл больше не отдаётся, он загружается заново.
+    Успешное удаление файла через API сбрасывает его запись (см. on_request).
+    """
+
+    def __init__(self, directory: Path):
+        """
+        :param directory: Каталог, в котором хранятся записи кеша.
+        """
+        self.directory = directory
+        # Записи, уже проверенные или созданные в текущем процессе
+        self.verified: dict[str, CreateFileResponseSchema] = {}
+
+    def get_or_create(
+        self, files_client: FilesClient, request: CreateFileRequestSchema
+    ) -> CreateFileResponseSchema:
+        """
+        Возвращает уже загруженный файл с тем же содержимым или загружает новый.
+
+        Кешируются только файлы, переданные путём или байтами: поток байтов
+        нельзя прочитать повторно, поэтому он всегда загружается.
+
+        :param files_client: Клиент, через который загружается и проверяется файл.
+        :param request: Запрос на создание файла.
+        :return: Ответ создания файла (возможно, из кеша).
+        """
+        key = self._get_key(files_client, request)
+        if key is None:
+            return files_client.create_file(request)
+
+        if response := self.verified.get(key):
+            return response
+
+        path = self.directory / f"{key}.json"
+        with FileLock(path.with_suffix(".lock")):
+            cached = self._read(path)
+            if cached and self._is_available(files_client, cached.response):
+                response = cached.response
+            else:
+                response = files_client.create_file(request)
+                self._write(path, CachedFileSchema(response=response))
+
+        self.verified[key] = response
+        return response
+
+    def invalidate(self, file_id: str) -> None:
+        """
+        Удаляет из кеша записи об удалённом файле.
+
+        :param file_id: Идентификатор файла.
+        """
+        for key, response in list(self.verified.items()):
+            if response.file.id == file_id:
+                del self.verified[key]
+                path = self.directory / f"{key}.json"
+                with FileLock(path.with_suffix(".lock")):
+                    path.unlink(missing_ok=True)
+
+    def on_request(self, record: RequestRecord) -> None:
+        """
+        Сбрасывает запись кеша, когда файл удалён через delete_file_api.
+
+        :param record: Описание выполненного запроса.
+        """
+        if (
+            record.method == "DELETE"
+            and record.status_code == HTTPStatus.OK
+            and record.path.startswith(FILE_PATH_PREFIX)
+        ):
+            self.invalidate(record.path.removeprefix(FILE_PATH_PREFIX))
+
+    @staticmethod
+    def _is_available(
+        files_client: FilesClient, response: CreateFileResponseSchema
+    ) -> bool:
+        verification = files_client.get_file_api(response.file.id)
+        if verification.status_code != HTTPStatus.OK:
+            return False
+
+        try:
+            file = GetFileResponseSchema.model_validate_json(verification.content).file
+        except ValidationError:
+            return False
+
+        return file == response.file
+
+    @staticmethod
+    def _get_key(
+        files_client: FilesClient, request: CreateFileRequestSchema
+    ) -> str | None:
+        digest = hashlib.sha256()
+
+        if isinstance(request.upload_file, (str, PathLike)):
+            with open(request.upload_file, "rb") as file:
+                while chunk := file.read(UPLOAD_CHUNK_SIZE):
+                    digest.update(chunk)
+        elif isinstance(request.upload_file, bytes):
+            digest.update(request.upload_file)
+        else:
+            return None
+
+        # Один и тот же файл на разных серверах и в разных директориях — разные записи
+        digest.update(f"\0{request.directory}\0{files_client.client.base_url}".encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _read(path: Path) -> CachedFileSchema | None:
+        try:
+            return CachedFileSchema.model_validate_json(path.read_text())
+        except (FileNotFoundError, ValidationError):
+            return None
+
+    @staticmethod
+    def _write(path: Path, cached: CachedFileSchema) -> None:
+        # Пишем во временный файл и атомарно подменяем, чтобы другие воркеры не прочитали половину
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        temp_path.write_text(cached.model_dump_json(by_alias=True))
+        os.replace(temp_path, path)
+
+
+@lru_cache(maxsize=None)
+def get_file_upload_cache() -> FileUploadCache:
+    """
+    Функция создаёт общий для процесса экземпляр FileUploadCache.
+
+    :return: Готовый к использованию FileUploadCache.
+    """
+    FILE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache = FileUploadCache(directory=FILE_CACHE_DIR)
+    add_request_listener(cache.on_request)
+    return cache
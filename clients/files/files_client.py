@@ -1,13 +1,36 @@
 from httpx import Response
 
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema
+from clients.files.files_upload import (
+    AsyncUploadStream,
+    MultipartUpload,
+    SyncUploadStream,
+    get_source_filename,
+)
 from clients.private_http_builder import (
     AuthenticationUserSchema,
     get_private_http_client,
+    get_async_private_http_client,
 )
 
 
+def build_upload(request: CreateFileRequestSchema) -> MultipartUpload:
+    """
+    Функция формирует потоковое multipart-тело запроса на создание файла.
+
+    :param request: Словарь с filename, directory, upload_file.
+    :return: Тело запроса для отправки блоками.
+    """
+    return MultipartUpload(
+        fields=request.model_dump(by_alias=True, exclude={"upload_file"}),
+        file_field="upload_file",
+        # Как при отправке через files=: имя исходного файла, а для байтов и потоков — filename
+        filename=get_source_filename(request.upload_file) or request.filename,
+        source=request.upload_file,
+    )
+
+
 class FilesClient(APIClient):
     """
     Клиент для работы с /api/v1/files
@@ -26,13 +49,14 @@ class FilesClient(APIClient):
         """
         Метод создания файла.
 
+        Содержимое файла отправляется потоком блоками фиксированного размера.
+
         :param request: Словарь с filename, directory, upload_file.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
+        upload = build_upload(request)
         return self.post(
-            "/api/v1/files",
-            data=request.model_dump(by_alias=True, exclude={"upload_file"}),
-            files={"upload_file": open(request.upload_file, "rb")},
+            "/api/v1/files", content=SyncUploadStream(upload), headers=upload.headers
         )
 
     def delete_file_api(self, file_id: str) -> Response:
@@ -46,7 +70,7 @@ class FilesClient(APIClient):
 
     def create_file(self, request: CreateFileRequestSchema) -> CreateFileResponseSchema:
         response = self.create_file_api(request)
-        return CreateFileResponseSchema.model_validate_json(response.text)
+        return CreateFileResponseSchema.model_validate_json(response.content)
 
 
 def get_files_client(user: AuthenticationUserSchema) -> FilesClient:
@@ -56,3 +80,56 @@ def get_files_client(user: AuthenticationUserSchema) -> FilesClient:
     :return: Готовый к использованию FilesClient.
     """
     return FilesClient(client=get_private_http_client(user))
+
+
+class AsyncFilesClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/files
+    """
+
+    async def get_file_api(self, file_id: str) -> Response:
+        """
+        Метод получения файла.
+
+        :param file_id: Идентификатор файла.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.get(f"/api/v1/files/{file_id}")
+
+    async def create_file_api(self, request: CreateFileRequestSchema) -> Response:
+        """
+        Метод создания файла.
+
+        Содержимое файла отправляется потоком, в том числе из асинхронного итератора байтов.
+
+        :param request: Словарь с filename, directory, upload_file.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        upload = build_upload(request)
+        return await self.post(
+            "/api/v1/files", content=AsyncUploadStream(upload), headers=upload.headers
+        )
+
+    async def delete_file_api(self, file_id: str) -> Response:
+        """
+        Метод удаления файла.
+
+        :param file_id: Идентификатор файла.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.delete(f"/api/v1/files/{file_id}")
+
+    async def create_file(
+        self, request: CreateFileRequestSchema
+    ) -> CreateFileResponseSchema:
+        response = await self.create_file_api(request)
+        return CreateFileResponseSchema.model_validate_json(response.content)
+
+
+async def get_async_files_client(user: AuthenticationUserSchema) -> AsyncFilesClient:
+    """
+    Функция создаёт экземпляр AsyncFilesClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncFilesClient.
+    """
+    return AsyncFilesClient(client=await get_async_private_http_client(user))
@@ -1,4 +1,6 @@
-from pydantic import BaseModel, HttpUrl, Field
+from pydantic import BaseModel, ConfigDict, HttpUrl, Field, SkipValidation
+
+from clients.files.files_upload import UploadSource
 from tools.fakers import fake
 
 
@@ -18,11 +20,15 @@ class CreateFileRequestSchema(BaseModel):
     Описание структуры запроса на создание файла.
     """
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     # Добавили генерацию случайного названия файла с расширением PNG
     filename: str = Field(default_factory=lambda: f"{fake.uuid4()}.png")
     # Директорию оставляем статичной, чтобы все тестовые файлы на сервере попадали в одну папку
     directory: str = Field(default="tests")
-    upload_file: str
+    # Путь к файлу, открытый бинарный файл, байты или (асинхронный) поток байтов.
+    # Валидацию пропускаем, чтобы pydantic не начал читать переданный поток
+    upload_file: SkipValidation[UploadSource]
 
 
 class CreateFileResponseSchema(BaseModel):
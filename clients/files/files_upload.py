@@ -0,0 +1,217 @@
+import asyncio
+import mimetypes
+import os
+import uuid
+from os import PathLike
+from typing import IO, AsyncIterable, AsyncIterator, Iterable, Iterator
+
+from httpx import StreamConsumed
+
+# Источник содержимого загружаемого файла: путь, открытый бинарный файл или поток байтов
+UploadSource = (
+    str | PathLike | bytes | IO[bytes] | Iterable[bytes] | AsyncIterable[bytes]
+)
+
+# Размер блока, которым файл читается и отправляется на сервер
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def get_source_filename(source: UploadSource) -> str | None:
+    """
+    Функция возвращает имя исходного файла так же, как httpx для files=: базовое имя
+    пути или открытого файла.
+
+    :param source: Содержимое файла.
+    :return: Имя файла или None, если у источника нет имени (байты, поток).
+    """
+    name = getattr(source, "name", source)
+    if isinstance(name, (str, PathLike)):
+        return os.path.basename(name)
+    return None
+
+
+class MultipartUpload:
+    """
+    Потоковое тело запроса multipart/form-data с одним файлом.
+
+    Файл никогда не читается в память целиком: содержимое отправляется блоками
+    не больше chunk_size. Файлы, открытые по пути, закрываются сразу после отправки,
+    а в асинхронных клиентах читаются в отдельном потоке, не блокируя event loop.
+    Тело из пути или файла с seek можно отправить повторно (например, при повторе
+    запроса после обновления токена), поток байтов и файл без seek — только один раз:
+    повторная отправка завершается StreamConsumed, а не пустым телом.
+    """
+
+    def __init__(
+        self,
+        fields: dict[str, str],
+        file_field: str,
+        filename: str,
+        source: UploadSource,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+    ):
+        """
+        :param fields: Текстовые поля формы.
+        :param file_field: Название поля формы с файлом.
+        :param filename: Имя файла в заголовке части, по нему же определяется Content-Type.
+        :param source: Содержимое файла.
+        :param chunk_size: Максимальный размер отправляемого блока.
+        """
+        self.source = source
+        self.chunk_size = chunk_size
+        self.boundary = uuid.uuid4().hex
+        self._consumed = False
+        content_type, _ = mimetypes.guess_type(filename)
+
+        self.head = b"".join(
+            self._part_header(f'name="{name}"') + str(value).encode() + b"\r\n"
+            for name, value in fields.items()
+        ) + self._part_header(
+            f'name="{file_field}"; filename="{filename}"',
+            content_type=content_type or "application/octet-stream",
+        )
+        self.tail = f"\r\n--{self.boundary}--\r\n".encode()
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """
+        Заголовки запроса. Content-Length указывается, если размер файла известен заранее,
+        иначе тело передаётся с Transfer-Encoding: chunked.
+        """
+        headers = {"Content-Type": f"multipart/form-data; boundary={self.boundary}"}
+        if (size := self._get_source_size()) is not None:
+            headers["Content-Length"] = str(len(self.head) + size + len(self.tail))
+
+        return headers
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        yield self.head
+
+        if isinstance(self.source, (str, PathLike)):
+            with open(self.source, "rb") as file:
+                yield from self._read_file(file)
+        elif isinstance(self.source, bytes):
+            yield from self._split(self.source)
+        elif hasattr(self.source, "read"):
+            self._rewind()
+            yield from self._read_file(self.source)
+        elif isinstance(self.source, Iterable):
+            self._consume_once()
+            for chunk in self.source:
+                yield from self._split(chunk)
+        else:
+            raise TypeError("Асинхронный поток байтов можно загрузить только AsyncFilesClient")
+
+        yield self.tail
+
+    async def aiter_chunks(self) -> AsyncIterator[bytes]:
+        if isinstance(self.source, AsyncIterable):
+            yield self.head
+            self._consume_once()
+            async for chunk in self.source:
+                for part in self._split(chunk):
+                    yield part
+            yield self.tail
+            return
+
+        # Чтение с диска выполняется в отдельном потоке, чтобы не блокировать event loop
+        if isinstance(self.source, (str, PathLike)):
+            yield self.head
+            file = await asyncio.to_thread(open, self.source, "rb")
+            try:
+                async for chunk in self._aread_file(file):
+                    yield chunk
+            finally:
+                file.close()
+            yield self.tail
+            return
+
+        if hasattr(self.source, "read"):
+            yield self.head
+            await asyncio.to_thread(self._rewind)
+            async for chunk in self._aread_file(self.source):
+                yield chunk
+            yield self.tail
+            return
+
+        for chunk in self.iter_chunks():
+            yield chunk
+
+    def _read_file(self, file: IO[bytes]) -> Iterator[bytes]:
+        while chunk := file.read(self.chunk_size):
+            yield chunk
+
+    async def _aread_file(self, file: IO[bytes]) -> AsyncIterator[bytes]:
+        while chunk := await asyncio.to_thread(file.read, self.chunk_size):
+            yield chunk
+
+    def _rewind(self) -> None:
+        # Повторная отправка должна начинаться с начала файла; файл без seek перемотать
+        # нельзя, и повтор с ним отправил бы пустое тело
+        if self._is_seekable():
+            self.source.seek(0)
+        else:
+            self._consume_once()
+
+    def _is_seekable(self) -> bool:
+        if not (hasattr(self.source, "seek") and hasattr(self.source, "tell")):
+            return False
+        # У файлов io (например, pipe) seek есть всегда, поддержку сообщает seekable()
+        seekable = getattr(self.source, "seekable", None)
+        return seekable() if callable(seekable) else True
+
+    def _split(self, chunk: bytes) -> Iterator[bytes]:
+        for start in range(0, len(chunk), self.chunk_size):
+            yield chunk[start : start + self.chunk_size]
+
+    def _consume_once(self) -> None:
+        if self._consumed:
+            raise StreamConsumed()
+        self._consumed = True
+
+    def _get_source_size(self) -> int | None:
+        if isinstance(self.source, (str, PathLike)):
+            return os.path.getsize(self.source)
+
+        if isinstance(self.source, bytes):
+            return len(self.source)
+
+        if self._is_seekable():
+            position = self.source.tell()
+            size = self.source.seek(0, os.SEEK_END)
+            self.source.seek(position)
+            return size
+
+        return None
+
+    def _part_header(
+        self, disposition: str, content_type: str | None = None
+    ) -> bytes:
+        header = f"--{self.boundary}\r\nContent-Disposition: form-data; {disposition}\r\n"
+        if content_type:
+            header += f"Content-Type: {content_type}\r\n"
+        return f"{header}\r\n".encode()
+
+
+class SyncUploadStream:
+    """
+    Синхронное представление MultipartUpload для httpx.Client.
+    """
+
+    def __init__(self, upload: MultipartUpload):
+        self.upload = upload
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self.upload.iter_chunks()
+
+
+class AsyncUploadStream:
+    """
+    Асинхронное представление MultipartUpload для httpx.AsyncClient.
+    """
+
+    def __init__(self, upload: MultipartUpload):
+        self.upload = upload
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self.upload.aiter_chunks()
@@ -0,0 +1,107 @@
+import asyncio
+from functools import lru_cache
+from weakref import WeakKeyDictionary
+
+from httpx import (
+    AsyncBaseTransport,
+    AsyncHTTPTransport,
+    BaseTransport,
+    HTTPTransport,
+    MockTransport,
+)
+
+from clients.cassette import (
+    AsyncRecordingTransport,
+    RecordingTransport,
+    ReplayTransport,
+    get_cassette,
+)
+from config import settings
+from tools.fake_backend.app import get_fake_backend
+
+
+def get_http_transport(base_url: str | None = None) -> BaseTransport:
+    """
+    Функция возвращает общий синхронный транспорт (пул соединений) для указанного base_url.
+
+    Транспорт потокобезопасен и используется всеми публичными и приватными клиентами,
+    поэтому количество открытых сокетов не зависит от количества пользователей.
+    Лимиты пула и HTTP/2 настраиваются через settings.http_client,
+    запись и воспроизведение трафика — через settings.cassette.
+    С settings.fake_backend запросы обрабатывает фейковый сервер в памяти процесса.
+
+    :param base_url: Базовый URL сервиса (по умолчанию settings.http_client.url).
+    :return: Объект httpx.HTTPTransport с настроенным пулом соединений.
+    """
+    # Вызов без base_url и с base_url по умолчанию должны получить один и тот же пул
+    return _get_http_transport(base_url or settings.http_client.client_url)
+
+
+@lru_cache(maxsize=None)
+def _get_http_transport(base_url: str) -> BaseTransport:
+    # base_url — ключ кеша: для каждого сервиса создаётся свой пул соединений
+    if settings.cassette.mode == "replay":
+        return ReplayTransport(get_cassette())
+
+    if settings.fake_backend:
+        transport = MockTransport(get_fake_backend())
+    else:
+        transport = HTTPTransport(
+            http1=settings.http_client.http1,
+            http2=settings.http_client.http2,
+            limits=settings.http_client.limits.to_httpx(),
+        )
+    if settings.cassette.mode == "record":
+        return RecordingTransport(transport, get_cassette())
+
+    return transport
+
+
+# Асинхронные соединения привязаны к event loop, поэтому пулы храним отдельно для каждого loop
+_async_transports: WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, AsyncBaseTransport]
+] = WeakKeyDictionary()
+
+
+def get_async_http_transport(base_url: str | None = None) -> AsyncBaseTransport:
+    """
+    Функция возвращает общий асинхронный транспорт (пул соединений) для указанного base_url.
+
+    Все асинхронные клиенты, созданные в рамках одного event loop, используют один и тот же пул,
+    поэтому закрывать такие клиенты по отдельности не нужно — для этого есть close_async_http_transports.
+    С HTTP/2 параллельные запросы мультиплексируются в нескольких соединениях.
+
+    :param base_url: Базовый URL сервиса (по умолчанию settings.http_client.url).
+    :return: Объект httpx.AsyncHTTPTransport с настроенным пулом соединений.
+    """
+    base_url = base_url or settings.http_client.client_url
+    transports = _async_transports.setdefault(asyncio.get_running_loop(), {})
+    if base_url in transports:
+        return transports[base_url]
+
+    if settings.cassette.mode == "replay":
+        transports[base_url] = ReplayTransport(get_cassette())
+        return transports[base_url]
+
+    if settings.fake_backend:
+        transport = MockTransport(get_fake_backend())
+    else:
+        transport = AsyncHTTPTransport(
+            http1=settings.http_client.http1,
+            http2=settings.http_client.http2,
+            limits=settings.http_client.async_limits.to_httpx(),
+        )
+    if settings.cassette.mode == "record":
+        transport = AsyncRecordingTransport(transport, get_cassette())
+
+    transports[base_url] = transport
+    return transport
+
+
+async def close_async_http_transports() -> None:
+    """
+    Функция закрывает все асинхронные пулы соединений текущего event loop.
+    """
+    transports = _async_transports.pop(asyncio.get_running_loop(), {})
+    for transport in transports.values():
+        await transport.aclose()
@@ -1,12 +1,20 @@
+import asyncio
+from collections import OrderedDict
 from functools import lru_cache
+from weakref import WeakKeyDictionary
 
-from httpx import Client
+from httpx import AsyncClient, Client
 from pydantic import BaseModel
 
-from clients.authentication.authentication_client import (
-    get_authentication_client,
-    LoginRequestSchema,
-)
+from clients.authentication.authentication_flow import TokenAuth
+from clients.authentication.authentication_schema import LoginRequestSchema
+from clients.authentication.token_cache import get_token_cache
+from clients.http_transport import get_http_transport, get_async_http_transport
+from config import settings
+
+# Максимальное количество закешированных клиентов пользователей.
+# Клиенты используют общий пул соединений, поэтому вытеснение из кеша не оставляет открытых сокетов
+PRIVATE_CLIENTS_CACHE_SIZE = 256
 
 
 class AuthenticationUserSchema(
@@ -21,25 +29,68 @@ class AuthenticationUserSchema(
 
 
 # Создаем private builder
-@lru_cache(maxsize=None)
+@lru_cache(maxsize=PRIVATE_CLIENTS_CACHE_SIZE)
 def get_private_http_client(user: AuthenticationUserSchema) -> Client:
     """
     Функция создаёт экземпляр httpx.Client с аутентификацией пользователя.
 
+    Клиент не открывает собственных соединений: запросы идут через общий транспорт
+    из get_http_transport, а авторизация добавляется слоем TokenAuth,
+    который сам обновляет истекающий токен.
+    Токен берётся из TokenCache, общего для всех воркеров, поэтому логин выполняется
+    примерно один раз на пользователя за прогон.
+
     :param user: Объект AuthenticationUserSchema с email и паролем пользователя.
     :return: Готовый к использованию объект httpx.Client с установленным заголовком Authorization.
     """
-    # Инициализируем AuthenticationClient для аутентификации
-    authentication_client = get_authentication_client()
-
     # Инициализируем запрос на аутентификацию
     login_request = LoginRequestSchema(email=user.email, password=user.password)
-    # Выполняем POST запрос и аутентифицируемся
-    login_response = authentication_client.login(login_request)
+    # Получаем токен из кеша, при необходимости выполняется логин или обновление токена
+    token = get_token_cache().get_token(login_request)
 
     return Client(
-        timeout=100,
-        base_url="http://localhost:8000",
-        # Добавляем заголовок авторизации
-        headers={"Authorization": f"Bearer {login_response.token.access_token}"},
+        timeout=settings.http_client.timeout.to_httpx(),
+        base_url=settings.http_client.client_url,
+        transport=get_http_transport(),
+        # Добавляем заголовок авторизации с автоматическим обновлением токена
+        auth=TokenAuth(login_request, token),
+    )
+
+
+# Асинхронные клиенты кешируем отдельно для каждого event loop, так как их пул привязан к loop
+_async_private_clients: WeakKeyDictionary[
+    asyncio.AbstractEventLoop, OrderedDict[AuthenticationUserSchema, AsyncClient]
+] = WeakKeyDictionary()
+
+
+async def get_async_private_http_client(user: AuthenticationUserSchema) -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient с аутентификацией пользователя.
+
+    Клиенты разных пользователей используют общий пул соединений из get_async_http_transport.
+
+    :param user: Объект AuthenticationUserSchema с email и паролем пользователя.
+    :return: Готовый к использованию объект httpx.AsyncClient с установленным заголовком Authorization.
+    """
+    clients = _async_private_clients.setdefault(
+        asyncio.get_running_loop(), OrderedDict()
     )
+    if user in clients:
+        clients.move_to_end(user)
+        return clients[user]
+
+    login_request = LoginRequestSchema(email=user.email, password=user.password)
+    # Кеш токенов работает с файлами и блокировками, поэтому выполняем его в отдельном потоке
+    token = await asyncio.to_thread(get_token_cache().get_token, login_request)
+
+    clients[user] = AsyncClient(
+        timeout=settings.http_client.timeout.to_httpx(),
+        base_url=settings.http_client.client_url,
+        transport=get_async_http_transport(),
+        auth=TokenAuth(login_request, token),
+    )
+    # Вытесняем самых давно использованных пользователей, пул соединений при этом не закрывается
+    while len(clients) > PRIVATE_CLIENTS_CACHE_SIZE:
+        clients.popitem(last=False)
+
+    return clients[user]
@@ -1,10 +1,30 @@
-from httpx import Client
+from httpx import AsyncClient, Client
+
+from clients.http_transport import get_http_transport, get_async_http_transport
+from config import settings
 
 
 def get_public_http_client() -> Client:
     """
-    Функция создаёт экземпляр httpx.Client с базовыми настройками.
+    Функция создаёт экземпляр httpx.Client с базовыми настройками поверх общего пула соединений.
 
     :return: Готовый к использованию объект httpx.Client.
     """
-    return Client(timeout=100, base_url="http://localhost:8000")
+    return Client(
+        timeout=settings.http_client.timeout.to_httpx(),
+        base_url=settings.http_client.client_url,
+        transport=get_http_transport(),
+    )
+
+
+def get_async_public_http_client() -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient поверх общего пула соединений.
+
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    return AsyncClient(
+        timeout=settings.http_client.timeout.to_httpx(),
+        base_url=settings.http_client.client_url,
+        transport=get_async_http_transport(),
+    )
@@ -1,8 +1,9 @@
 from httpx import Response
 
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.private_http_builder import (
     get_private_http_client,
+    get_async_private_http_client,
     AuthenticationUserSchema,
 )
 from clients.users.users_schema import UpdateUserRequestSchema, GetUserResponseSchema
@@ -40,9 +41,7 @@ class PrivateUsersClient(APIClient):
         :param request: Словарь с email, lastName, firstName, middleName.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        return self.patch(
-            f"/api/v1/users/{user_id}", json=request.model_dump(by_alias=True)
-        )
+        return self.patch(f"/api/v1/users/{user_id}", json=request)
 
     def delete_user_api(self, user_id: str) -> Response:
         """
@@ -55,7 +54,7 @@ class PrivateUsersClient(APIClient):
 
     def get_user(self, user_id: str) -> GetUserResponseSchema:
         response = self.get_user_api(user_id)
-        return GetUserResponseSchema.model_validate_json(response.text)
+        return GetUserResponseSchema.model_validate_json(response.content)
 
 
 def get_private_users_client(user: AuthenticationUserSchema) -> PrivateUsersClient:
@@ -65,3 +64,62 @@ def get_private_users_client(user: AuthenticationUserSchema) -> PrivateUsersClie
     :return: Готовый к использованию PrivateUsersClient.
     """
     return PrivateUsersClient(client=get_private_http_client(user))
+
+
+class AsyncPrivateUsersClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/users
+    """
+
+    async def get_user_me_api(self) -> Response:
+        """
+        Метод получения текущего пользователя.
+
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.get("/api/v1/users/me")
+
+    async def get_user_api(self, user_id: str) -> Response:
+        """
+        Метод получения пользователя по идентификатору.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.get(f"/api/v1/users/{user_id}")
+
+    async def update_user_api(
+        self, user_id: str, request: UpdateUserRequestSchema
+    ) -> Response:
+        """
+        Метод обновления пользователя по идентификатору.
+
+        :param user_id: Идентификатор пользователя.
+        :param request: Словарь с email, lastName, firstName, middleName.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.patch(f"/api/v1/users/{user_id}", json=request)
+
+    async def delete_user_api(self, user_id: str) -> Response:
+        """
+        Метод удаления пользователя по идентификатору.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.delete(f"/api/v1/users/{user_id}")
+
+    async def get_user(self, user_id: str) -> GetUserResponseSchema:
+        response = await self.get_user_api(user_id)
+        return GetUserResponseSchema.model_validate_json(response.content)
+
+
+async def get_async_private_users_client(
+    user: AuthenticationUserSchema,
+) -> AsyncPrivateUsersClient:
+    """
+    Функция создаёт экземпляр AsyncPrivateUsersClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncPrivateUsersClient.
+    """
+    return AsyncPrivateUsersClient(client=await get_async_private_http_client(user))
@@ -1,8 +1,11 @@
 from typing import TypedDict
 from httpx import Response
 
-from clients.api_client import APIClient
-from clients.public_http_builder import get_public_http_client
+from clients.api_client import APIClient, AsyncAPIClient
+from clients.public_http_builder import (
+    get_public_http_client,
+    get_async_public_http_client,
+)
 from clients.users.users_schema import CreateUserResponseSchema, CreateUserRequestSchema
 
 
@@ -18,7 +21,7 @@ class PublicUsersClient(APIClient):
         :param request: Словарь с email, password, lastName, firstName, middleName.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        return self.post("/api/v1/users", json=request.model_dump(by_alias=True))
+        return self.post("/api/v1/users", json=request)
 
     def create_user(self, request: CreateUserRequestSchema) -> CreateUserResponseSchema:
         """
@@ -28,7 +31,7 @@ class PublicUsersClient(APIClient):
         :return: Ответ от сервера в виде словаря с созданным пользователем.
         """
         response = self.create_user_api(request)
-        return CreateUserResponseSchema.model_validate_json(response.text)
+        return CreateUserResponseSchema.model_validate_json(response.content)
 
 
 # Добавляем builder для PublicUsersClient
@@ -39,3 +42,39 @@ def get_public_users_client() -> PublicUsersClient:
     :return: Готовый к использованию PublicUsersClient.
     """
     return PublicUsersClient(client=get_public_http_client())
+
+
+class AsyncPublicUsersClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/users
+    """
+
+    async def create_user_api(self, request: CreateUserRequestSchema) -> Response:
+        """
+        Метод создает пользователя.
+
+        :param request: Словарь с email, password, lastName, firstName, middleName.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.post("/api/v1/users", json=request)
+
+    async def create_user(
+        self, request: CreateUserRequestSchema
+    ) -> CreateUserResponseSchema:
+        """
+        Метод создания пользователя с автоматической обработкой ответа.
+
+        :param request: Словарь с email, password, lastName, firstName, middleName.
+        :return: Ответ от сервера в виде словаря с созданным пользователем.
+        """
+        response = await self.create_user_api(request)
+        return CreateUserResponseSchema.model_validate_json(response.content)
+
+
+def get_async_public_users_client() -> AsyncPublicUsersClient:
+    """
+    Функция создаёт экземпляр AsyncPublicUsersClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncPublicUsersClient.
+    """
+    return AsyncPublicUsersClient(client=get_async_public_http_client())
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field, EmailStr, ConfigDict
 
+from tools.bulk import BulkBuildMixin
 from tools.fakers import fake
 
 
@@ -17,7 +18,7 @@ class UserSchema(BaseModel):
     middle_name: str = Field(alias="middleName")
 
 
-class CreateUserRequestSchema(BaseModel):
+class CreateUserRequestSchema(BulkBuildMixin, BaseModel):
     """
     Описание структуры запроса на создание пользователя.
     """
@@ -0,0 +1,123 @@
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Literal
+
+from httpx import Limits, Timeout
+from pydantic import BaseModel, HttpUrl, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class HTTPTimeoutConfig(BaseModel):
+    """
+    Таймауты HTTP-клиента по фазам запроса, в секундах.
+    """
+
+    connect: float = 100
+    read: float = 100
+    write: float = 100
+    # Ожидание свободного соединения в пуле
+    pool: float = 100
+
+    def to_httpx(self) -> Timeout:
+        return Timeout(
+            connect=self.connect, read=self.read, write=self.write, pool=self.pool
+        )
+
+
+class HTTPLimitsConfig(BaseModel):
+    """
+    Лимиты синхронного пула соединений: соединения переиспользуются всеми клиентами процесса.
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    # Через сколько секунд простаивающее keep-alive соединение закрывается
+    keepalive_expiry: float = 30
+
+    def to_httpx(self) -> Limits:
+        return Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+class AsyncHTTPLimitsConfig(HTTPLimitsConfig):
+    """
+    Лимиты асинхронного пула, рассчитанные на сотни одновременных запросов из одного процесса.
+    """
+
+    max_connections: int = 200
+    max_keepalive_connections: int = 100
+
+
+class HTTPClientConfig(BaseModel):
+    """
+    Настройки HTTP-клиентов API.
+    """
+
+    url: HttpUrl = HttpUrl("http://localhost:8000")
+    # HTTP/2 мультиплексирует параллельные запросы в нескольких соединениях (нужен пакет h2).
+    # Для https версия выбирается через ALPN; для http без TLS сервер должен поддерживать
+    # h2c, и HTTP/1.1 нужно отключить (http1=false)
+    http2: bool = False
+    http1: bool = True
+    timeout: HTTPTimeoutConfig = HTTPTimeoutConfig()
+    limits: HTTPLimitsConfig = HTTPLimitsConfig()
+    async_limits: AsyncHTTPLimitsConfig = AsyncHTTPLimitsConfig()
+
+    @model_validator(mode="after")
+    def check_http_versions(self) -> "HTTPClientConfig":
+        if not (self.http1 or self.http2):
+            raise ValueError("Нужно включить хотя бы одну из версий: http1 или http2")
+        if self.http2 and find_spec("h2") is None:
+            raise ValueError("Для HTTP/2 нужен пакет h2: pip install 'httpx[http2]'")
+        return self
+
+    @property
+    def client_url(self) -> str:
+        return str(self.url).rstrip("/")
+
+
+class CassetteConfig(BaseModel):
+    """
+    Настройки записи и воспроизведения HTTP-трафика (см. clients/cassette.py).
+    """
+
+    # off — обычные запросы, record — запросы выполняются и записываются,
+    # replay — ответы берутся из кассеты без обращения к серверу
+    mode: Literal["off", "record", "replay"] = "off"
+    path: Path = Path("cassettes/api.jsonl.gz")
+    # Поля, по которым запрос сопоставляется с записью: method, route, path, query, body.
+    # Тесты сверяют ответы с данными Faker в запросах, поэтому кассету воспроизводят с тем же
+    # FAKE_SEED (--fake-seed), FAKE_RUN_ID (--fake-run-id, от него зависят email) и тем же
+    # числом воркеров xdist (пул пользователей и группы shared_setup у каждого воркера свои),
+    # что и при записи. body делает сопоставление строгим: при другом seed запросы
+    # не находятся в кассете совсем
+    match_on: list[Literal["method", "route", "path", "query", "body"]] = [
+        "method",
+        "route",
+    ]
+
+
+class Settings(BaseSettings):
+    """
+    Настройки автотестов. Читаются из переменных окружения и файла .env,
+    вложенные поля разделяются точкой (например, HTTP_CLIENT.TIMEOUT.READ=30).
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        env_nested_delimiter=".",
+        extra="ignore",
+    )
+
+    http_client: HTTPClientConfig = HTTPClientConfig()
+    cassette: CassetteConfig = CassetteConfig()
+    # Запросы обрабатывает фейковый сервер в памяти процесса (tools/fake_backend)
+    # вместо сервера по http_client.url
+    fake_backend: bool = False
+
+
+settings = Settings()
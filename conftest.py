@@ -4,4 +4,12 @@ pytest_plugins = (
     "fixtures.files",
     "fixtures.courses",
     "fixtures.exercises",
+    "fixtures.provisioning",
+    "plugins.cassette",
+    "plugins.fake_data",
+    "plugins.latency",
+    "plugins.performance",
+    "plugins.scheduling",
+    "plugins.shared_setup",
+    "plugins.traffic",
 )
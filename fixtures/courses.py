@@ -1,13 +1,12 @@
 import pytest
 from pydantic import BaseModel
 
-from clients.courses.courses_client import CoursesClient, get_courses_client
+from clients.courses.courses_client import CoursesClient
 from clients.courses.courses_schema import (
     CreateCourseRequestSchema,
     CreateCourseResponseSchema,
 )
-from fixtures.files import FileFixture
-from fixtures.users import UserFixture
+from tools.provisioning import ProvisioningGraph
 
 
 class CourseFixture(BaseModel):
@@ -16,19 +15,10 @@ class CourseFixture(BaseModel):
 
 
 @pytest.fixture
-def courses_client(function_user: UserFixture) -> CoursesClient:
-    return get_courses_client(function_user.authentication_user)
+def courses_client(provisioning_graph: ProvisioningGraph) -> CoursesClient:
+    return provisioning_graph.resolve("courses_client")
 
 
 @pytest.fixture
-def function_course(
-    courses_client: CoursesClient,
-    function_user: UserFixture,
-    function_file: FileFixture,
-) -> CourseFixture:
-    request = CreateCourseRequestSchema(
-        preview_file_id=function_file.response.file.id,
-        created_by_user_id=function_user.response.user.id,
-    )
-    response = courses_client.create_course(request)
-    return CourseFixture(request=request, response=response)
+def function_course(provisioning_graph: ProvisioningGraph) -> CourseFixture:
+    return provisioning_graph.resolve("course")
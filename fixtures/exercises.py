@@ -1,13 +1,12 @@
 import pytest
 from pydantic import BaseModel
 
-from clients.exercises.exercises_client import get_exercises_client, ExercisesClient
+from clients.exercises.exercises_client import ExercisesClient
 from clients.exercises.exercises_schema import (
     CreateExerciseRequestSchema,
     CreateExerciseResponseSchema,
 )
-from fixtures.courses import CourseFixture
-from fixtures.users import UserFixture
+from tools.provisioning import ProvisioningGraph
 
 
 class ExerciseFixture(BaseModel):
@@ -16,15 +15,10 @@ class ExerciseFixture(BaseModel):
 
 
 @pytest.fixture
-def exercises_client(function_user: UserFixture) -> ExercisesClient:
-    return get_exercises_client(function_user.authentication_user)
+def exercises_client(provisioning_graph: ProvisioningGraph) -> ExercisesClient:
+    return provisioning_graph.resolve("exercises_client")
 
 
 @pytest.fixture
-def function_exercise(
-    exercises_client: ExercisesClient,
-    function_course: CourseFixture,
-) -> ExerciseFixture:
-    request = CreateExerciseRequestSchema(course_id=function_course.response.course.id)
-    response = exercises_client.create_exercise(request)
-    return ExerciseFixture(request=request, response=response)
+def function_exercise(provisioning_graph: ProvisioningGraph) -> ExerciseFixture:
+    return provisioning_graph.resolve("exercise")
@@ -1,9 +1,9 @@
 import pytest
 from pydantic import BaseModel
 
-from clients.files.files_client import get_files_client, FilesClient
+from clients.files.files_client import FilesClient
 from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema
-from fixtures.users import UserFixture
+from tools.provisioning import ProvisioningGraph
 
 
 class FileFixture(BaseModel):
@@ -12,12 +12,10 @@ class FileFixture(BaseModel):
 
 
 @pytest.fixture
-def files_client(function_user: UserFixture) -> FilesClient:
-    return get_files_client(function_user.authentication_user)
+def files_client(provisioning_graph: ProvisioningGraph) -> FilesClient:
+    return provisioning_graph.resolve("files_client")
 
 
 @pytest.fixture
-def function_file(files_client: FilesClient) -> FileFixture:
-    request = CreateFileRequestSchema(upload_file="./testdata/files/image.png")
-    response = files_client.create_file(request)
-    return FileFixture(request=request, response=response)
+def function_file(provisioning_graph: ProvisioningGraph) -> FileFixture:
+    return provisioning_graph.resolve("file")
@@ -0,0 +1,83 @@
+import pytest
+
+from clients.courses.courses_client import CoursesClient, get_courses_client
+from clients.courses.courses_schema import CreateCourseRequestSchema
+from clients.exercises.exercises_client import ExercisesClient, get_exercises_client
+from clients.exercises.exercises_schema import CreateExerciseRequestSchema
+from clients.files.files_cache import get_file_upload_cache
+from clients.files.files_client import FilesClient, get_files_client
+from clients.files.files_schema import CreateFileRequestSchema
+from fixtures.courses import CourseFixture
+from fixtures.exercises import ExerciseFixture
+from fixtures.files import FileFixture
+from fixtures.users import UserFixture
+from tools.provisioning import ProvisioningGraph
+from tools.shared_setup import SharedSetupGroup
+
+
+def create_file(files_client: FilesClient) -> FileFixture:
+    request = CreateFileRequestSchema(upload_file="./testdata/files/image.png")
+    # Одинаковый тестовый файл загружается один раз и переиспользуется между тестами
+    response = get_file_upload_cache().get_or_create(files_client, request)
+    request = request.model_copy(update={"filename": response.file.filename})
+    return FileFixture(request=request, response=response)
+
+
+def create_course(
+    courses_client: CoursesClient, user: UserFixture, file: FileFixture
+) -> CourseFixture:
+    request = CreateCourseRequestSchema(
+        preview_file_id=file.response.file.id,
+        created_by_user_id=user.response.user.id,
+    )
+    response = courses_client.create_course(request)
+    return CourseFixture(request=request, response=response)
+
+
+def create_exercise(
+    exercises_client: ExercisesClient, course: CourseFixture
+) -> ExerciseFixture:
+    request = CreateExerciseRequestSchema(course_id=course.response.course.id)
+    response = exercises_client.create_exercise(request)
+    return ExerciseFixture(request=request, response=response)
+
+
+def build_provisioning_graph(
+    user: UserFixture, fake_seed: int | None = None
+) -> ProvisioningGraph:
+    """
+    Функция строит граф тестовых данных пользователя: клиенты создаются параллельно
+    с загрузкой файла и созданием курса.
+
+    :param user: Пользователь, от имени которого создаются данные.
+    :param fake_seed: Seed собственного потока тестовых данных графа (см. ProvisioningGraph).
+    :return: Граф с ещё не вычисленными узлами.
+    """
+    authentication_user = user.authentication_user
+
+    graph = ProvisioningGraph(fake_seed=fake_seed)
+    graph.add("user", lambda: user)
+    graph.add("files_client", lambda: get_files_client(authentication_user))
+    graph.add("courses_client", lambda: get_courses_client(authentication_user))
+    graph.add("exercises_client", lambda: get_exercises_client(authentication_user))
+    graph.add("file", create_file, depends_on=("files_client",))
+    graph.add("course", create_course, depends_on=("courses_client", "user", "file"))
+    graph.add("exercise", create_exercise, depends_on=("exercises_client", "course"))
+    return graph
+
+
+@pytest.fixture
+def provisioning_graph(
+    function_user: UserFixture, shared_setup: SharedSetupGroup | None
+) -> ProvisioningGraph:
+    # В группе shared_setup граф общий: вычисленные узлы (файл, курс, упражнение)
+    # переиспользуются всеми тестами группы и создаются из потока данных группы
+    if shared_setup is not None:
+        return shared_setup.get_or_create(
+            "provisioning_graph",
+            lambda: build_provisioning_graph(
+                function_user, fake_seed=shared_setup.fake_seed
+            ),
+        )
+
+    return build_provisioning_graph(function_user)
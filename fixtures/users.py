@@ -1,17 +1,32 @@
+from collections import deque
+from typing import Generator
+
 import pytest
+from _pytest.fixtures import SubRequest
 from pydantic import BaseModel, EmailStr
 
 
+from clients.authentication.authentication_schema import LoginRequestSchema
+from clients.authentication.token_cache import get_token_cache
 from clients.private_http_builder import AuthenticationUserSchema
 from clients.users.private_users_client import (
     PrivateUsersClient,
     get_private_users_client,
 )
-from clients.users.public_users_client import get_public_users_client, PublicUsersClient
+from clients.users.public_users_client import (
+    get_public_users_client,
+    PublicUsersClient,
+)
 from clients.users.users_schema import (
     CreateUserRequestSchema,
     CreateUserResponseSchema,
 )
+from tools.fakers import fake, get_seed
+from tools.provisioning import get_provisioning_executor
+from tools.shared_setup import SharedSetupGroup
+
+# Количество пользователей, которые создаются заранее в начале сессии
+USER_POOL_SIZE = 10
 
 
 # Модель для агрегации возвращаемых данных фикстурой function_user
@@ -32,6 +47,72 @@ class UserFixture(BaseModel):
         return AuthenticationUserSchema(email=str(self.email), password=self.password)
 
 
+class UserPool:
+    """
+    Пул заранее созданных пользователей, которые по очереди выдаются тестам.
+    """
+
+    def __init__(self, users: list[UserFixture]):
+        """
+        :param users: Созданные пользователи с уже полученными токенами.
+        """
+        self.users = deque(users)
+
+    def lease(self) -> UserFixture | None:
+        """
+        Выдаёт пользователя из пула.
+
+        :return: Свободный пользователь или None, если пул пуст.
+        """
+        return self.users.popleft() if self.users else None
+
+    def release(self, user: UserFixture) -> None:
+        """
+        Возвращает пользователя в конец очереди пула.
+
+        :param user: Ранее выданный пользователь.
+        """
+        self.users.append(user)
+
+
+def create_user(public_users_client: PublicUsersClient) -> UserFixture:
+    """
+    Функция создаёт нового пользователя.
+
+    :param public_users_client: Клиент для работы с публичным API пользователей.
+    :return: Данные созданного пользователя.
+    """
+    request = CreateUserRequestSchema()
+    response = public_users_client.create_user(request)
+    return UserFixture(request=request, response=response)
+
+
+def create_users(count: int) -> list[UserFixture]:
+    """
+    Функция одновременно создаёт несколько пользователей и заранее получает их токены.
+
+    Запросы выполняются синхронным клиентом в потоках подготовки данных, поэтому
+    функция работает и там, где уже запущен event loop (например, под pytest-asyncio).
+
+    :param count: Количество пользователей.
+    :return: Данные созданных пользователей.
+    """
+    public_users_client = get_public_users_client()
+    # Данные генерируются заранее в вызывающем потоке: потоки исполнителя выполняются
+    # в произвольном порядке и перемешали бы значения Faker между пользователями
+    requests = [CreateUserRequestSchema() for _ in range(count)]
+
+    def create(request: CreateUserRequestSchema) -> UserFixture:
+        response = public_users_client.create_user(request)
+        # Токен сразу попадает в общий кеш, тесты не будут тратить время на логин
+        get_token_cache().get_token(
+            LoginRequestSchema(email=request.email, password=request.password)
+        )
+        return UserFixture(request=request, response=response)
+
+    return list(get_provisioning_executor().map(create, requests))
+
+
 @pytest.fixture  # Объявляем фикстуру, по умолчанию скоуп function, то что нам нужно
 def public_users_client() -> (
     PublicUsersClient
@@ -45,12 +126,37 @@ def private_users_client(function_user: UserFixture) -> PrivateUsersClient:
     return get_private_users_client(function_user.authentication_user)
 
 
-# Фикстура для создания пользователя
+@pytest.fixture(scope="session")
+def user_pool(fake_seed: int, worker_id: str) -> UserPool:
+    # Пользователи создаются один раз на сессию (на каждом воркере xdist — свой пул).
+    # Пул создаётся из своего потока данных, а не из потока теста, который запросил его первым
+    with fake.stream(get_seed(fake_seed, "user_pool", worker_id)):
+        return UserPool(users=create_users(USER_POOL_SIZE))
+
+
+# Фикстура для получения пользователя
 @pytest.fixture
 # Используем фикстуру public_users_client, которая создает нужный API клиент
-def function_user(public_users_client: PublicUsersClient) -> UserFixture:
-    request = CreateUserRequestSchema()
-    response = public_users_client.create_user(request)
-    return UserFixture(
-        request=request, response=response
-    )  # Возвращаем все нужные данные
+def function_user(
+    request: SubRequest,
+    shared_setup: SharedSetupGroup | None,
+    public_users_client: PublicUsersClient,
+) -> Generator[UserFixture, None, None]:
+    # Тесты группы shared_setup используют одного пользователя на всю группу
+    if shared_setup is not None:
+        yield shared_setup.get_or_create(
+            "user", lambda: create_user(public_users_client)
+        )
+        return
+
+    # Тесты, которые изменяют пользователя, получают нового пользователя
+    if request.node.get_closest_marker("fresh_user"):
+        yield create_user(public_users_client)
+        return
+
+    # Остальные тесты берут готового пользователя из пула на время выполнения.
+    # Пул запрашивается лениво, чтобы прогон из одних групп shared_setup его не создавал
+    user_pool: UserPool = request.getfixturevalue("user_pool")
+    user = user_pool.lease() or create_user(public_users_client)
+    yield user
+    user_pool.release(user)
@@ -0,0 +1,11 @@
+from _pytest.main import Session
+
+from clients.cassette import get_cassette
+from config import settings
+
+
+def pytest_sessionfinish(session: Session) -> None:
+    # Воркеры xdist (execnet) могут завершиться, не вызвав atexit, — тогда
+    # до CASSETTE_FLUSH_SIZE записей потерялись бы. Каждый воркер дозаписывает свои
+    if settings.cassette.mode == "record":
+        get_cassette().flush()
@@ -0,0 +1,125 @@
+import os
+import random
+import secrets
+
+import pytest
+from _pytest.config import Config
+from _pytest.config.argparsing import Parser
+from _pytest.nodes import Item
+from _pytest.reports import TestReport
+
+from tools.fakers import fake, get_seed
+
+# Переменная окружения, из которой берётся seed, если не указан --fake-seed
+FAKE_SEED_ENV = "FAKE_SEED"
+# Переменная окружения, из которой берётся идентификатор прогона, если не указан --fake-run-id
+FAKE_RUN_ID_ENV = "FAKE_RUN_ID"
+# Ключи workerinput, через которые контроллер передаёт seed и идентификатор прогона воркерам xdist
+WORKER_INPUT_KEY = "fake_seed"
+WORKER_INPUT_RUN_ID_KEY = "fake_run_id"
+
+fake_seed_key = pytest.StashKey[int]()
+fake_run_id_key = pytest.StashKey[str]()
+
+
+def get_worker_id() -> str:
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def get_test_seed(run_seed: int, item: Item) -> int:
+    """
+    Функция выводит seed данных теста.
+
+    Seed не зависит от воркера, на котором выполняется тест, поэтому с тем же --fake-seed
+    тест получает те же значения полей при любом количестве воркеров, а с тем же
+    --fake-run-id — и те же email. Пул пользователей и группы shared_setup создаются
+    из собственных потоков воркера (фикстура fake_seed), а не из потока теста,
+    который запросил их первым.
+    Номер попытки (pytest-rerunfailures) входит в seed, чтобы перезапуск не повторял
+    уже созданные данные.
+
+    :param run_seed: Seed прогона.
+    :param item: Тест.
+    :return: Seed данных теста.
+    """
+    return get_seed(run_seed, item.nodeid, getattr(item, "execution_count", 1))
+
+
+def pytest_addoption(parser: Parser) -> None:
+    group = parser.getgroup("fake-data", "Тестовые данные")
+    group.addoption(
+        "--fake-seed",
+        type=int,
+        default=None,
+        help=f"Seed генератора тестовых данных (по умолчанию ${FAKE_SEED_ENV} или случайный).",
+    )
+    group.addoption(
+        "--fake-run-id",
+        default=None,
+        help="Идентификатор прогона, который входит в email тестовых данных "
+        f"(по умолчанию ${FAKE_RUN_ID_ENV} или случайный). Тот же идентификатор вместе "
+        "с --fake-seed повторяет и email — например, для воспроизведения кассеты.",
+    )
+
+
+def pytest_configure(config: Config) -> None:
+    if hasattr(config, "workerinput"):
+        seed = config.workerinput[WORKER_INPUT_KEY]
+        run_id = config.workerinput[WORKER_INPUT_RUN_ID_KEY]
+    else:
+        if (seed := config.getoption("fake_seed")) is None:
+            seed = int(os.environ.get(FAKE_SEED_ENV) or random.getrandbits(32))
+        run_id = (
+            config.getoption("fake_run_id")
+            or os.environ.get(FAKE_RUN_ID_ENV)
+            or secrets.token_hex(4)
+        )
+
+    config.stash[fake_seed_key] = seed
+    config.stash[fake_run_id_key] = run_id
+    fake.run_id = run_id
+    # Данные, создаваемые вне тестов, разделяются по воркерам
+    fake.seed(get_seed(seed, get_worker_id()))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node) -> None:
+    node.workerinput[WORKER_INPUT_KEY] = node.config.stash[fake_seed_key]
+    node.workerinput[WORKER_INPUT_RUN_ID_KEY] = node.config.stash[fake_run_id_key]
+
+
+def pytest_report_header(config: Config) -> str:
+    return (
+        f"fake data seed: {config.stash[fake_seed_key]}, "
+        f"run id: {config.stash[fake_run_id_key]}"
+    )
+
+
+@pytest.fixture(scope="session")
+def fake_seed(pytestconfig: Config) -> int:
+    # Seed прогона: из него выводятся отдельные потоки данных пула и групп shared_setup
+    return pytestconfig.stash[fake_seed_key]
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item: Item) -> None:
+    # Перед фикстурами теста переключаемся на его собственный поток данных
+    fake.seed(get_test_seed(item.config.stash[fake_seed_key], item))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: Item):
+    outcome = yield
+    report: TestReport = outcome.get_result()
+    if report.failed:
+        seed = item.config.stash[fake_seed_key]
+        run_id = item.config.stash[fake_run_id_key]
+        # С новым run id email другие, поэтому повтор не конфликтует с уже созданными данными
+        report.sections.append(
+            (
+                "fake data",
+                f"Те же значения полей (email будут новыми): --fake-seed {seed}\n"
+                f"Те же email (только на сервере без этих данных, например с кассетой): "
+                f"--fake-seed {seed} --fake-run-id {run_id}",
+            )
+        )
@@ -0,0 +1,79 @@
+import json
+from pathlib import Path
+
+import pytest
+from _pytest.config import Config
+from _pytest.config.argparsing import Parser
+from _pytest.main import Session
+from _pytest.terminal import TerminalReporter
+
+from clients.api_client import add_request_listener
+from tools.latency import LatencyRecorder, format_table
+
+# Ключ, под которым воркер xdist передаёт гистограммы контроллеру
+WORKER_OUTPUT_KEY = "latency_histograms"
+
+latency_recorder_key = pytest.StashKey[LatencyRecorder]()
+
+
+def pytest_addoption(parser: Parser) -> None:
+    group = parser.getgroup("latency", "Задержки API")
+    group.addoption(
+        "--latency",
+        action="store_true",
+        default=False,
+        help="Собирать гистограммы задержек API по эндпоинтам и выводить перцентили в конце сессии.",
+    )
+    group.addoption(
+        "--latency-report",
+        default=None,
+        metavar="PATH",
+        help="Сохранить перцентили задержек в JSON-файл.",
+    )
+
+
+def pytest_configure(config: Config) -> None:
+    if not (config.getoption("latency") or config.getoption("latency_report")):
+        return
+
+    recorder = LatencyRecorder()
+    config.stash[latency_recorder_key] = recorder
+    add_request_listener(recorder)
+
+
+def pytest_sessionfinish(session: Session) -> None:
+    recorder = session.config.stash.get(latency_recorder_key, None)
+    # На воркере xdist отдаём состояние гистограмм контроллеру, он объединит их
+    if recorder is not None and hasattr(session.config, "workeroutput"):
+        session.config.workeroutput[WORKER_OUTPUT_KEY] = recorder.to_dict()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    recorder = node.config.stash.get(latency_recorder_key, None)
+    data = getattr(node, "workeroutput", {}).get(WORKER_OUTPUT_KEY)
+    if recorder is not None and data:
+        recorder.merge(LatencyRecorder.from_dict(data))
+
+
+def pytest_terminal_summary(terminalreporter: TerminalReporter, config: Config) -> None:
+    recorder = config.stash.get(latency_recorder_key, None)
+    if recorder is None or hasattr(config, "workeroutput"):
+        return
+
+    summary = recorder.summary()
+    if report_path := config.getoption("latency_report"):
+        Path(report_path).write_text(json.dumps(summary, indent=2))
+
+    if not summary:
+        return
+
+    terminalreporter.section("API latency, ms")
+    columns = list(next(iter(summary.values())))
+    rows = [["endpoint"] + columns]
+    rows += [
+        [endpoint] + [str(values[column]) for column in columns]
+        for endpoint, values in summary.items()
+    ]
+    for line in format_table(rows):
+        terminalreporter.write_line(line)
@@ -0,0 +1,233 @@
+import statistics
+from pathlib import Path
+
+import pytest
+from _pytest.config import Config
+from _pytest.config.argparsing import Parser
+from _pytest.main import Session
+from _pytest.nodes import Item
+from _pytest.reports import TestReport
+from _pytest.terminal import TerminalReporter
+from pydantic import BaseModel
+
+from clients.api_client import RequestRecord, add_request_listener
+from tools.baselines import BaselineStore, RunMeasurementSchema, get_git_revision
+from tools.significance import mann_whitney_u, robust_upper_limit
+
+# Ключ user_properties, в котором воркер передаёт задержки API контроллеру
+API_LATENCIES_PROPERTY = "perf_api_latencies"
+# Минимальное количество исторических измерений для сравнения
+MIN_BASELINE_SAMPLES = 5
+
+
+class RegressionSchema(BaseModel):
+    """
+    Описание структуры найденной регрессии производительности.
+    """
+
+    nodeid: str
+    metric: str
+    baseline_median: float
+    current_median: float
+    # p-value U-критерия (для задержек API)
+    p_value: float | None = None
+    # Граница median + k·MAD (для одиночного измерения времени теста)
+    limit: float | None = None
+
+
+class PerformancePlugin:
+    """
+    Плагин записи и сравнения производительности тестов.
+
+    Регистрируется в pytest_configure только при запуске с --perf.
+    """
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.store = BaselineStore(
+            path=Path(config.getoption("perf_store")),
+            history=config.getoption("perf_history"),
+        )
+        self.alpha: float = config.getoption("perf_alpha")
+        self.threshold: float = config.getoption("perf_threshold")
+        self.mad: float = config.getoption("perf_mad")
+        self.fail: bool = config.getoption("perf_fail")
+        self.revision = get_git_revision()
+        # Задержки API текущего теста (None — тест сейчас не выполняется)
+        self.api_latencies: list[float] | None = None
+        self.measurements: dict[str, RunMeasurementSchema] = {}
+        self.regressions: list[RegressionSchema] = []
+
+    @property
+    def is_worker(self) -> bool:
+        return hasattr(self.config, "workeroutput")
+
+    def on_request(self, record: RequestRecord) -> None:
+        if self.api_latencies is not None:
+            self.api_latencies.append(record.elapsed)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item: Item):
+        self.api_latencies = []
+        try:
+            yield
+        finally:
+            # Передаём задержки через user_properties, они доходят до контроллера и при xdist
+            item.user_properties.append((API_LATENCIES_PROPERTY, self.api_latencies))
+            self.api_latencies = None
+
+    def pytest_runtest_logreport(self, report: TestReport) -> None:
+        if self.is_worker or report.when != "call" or not report.passed:
+            return
+
+        api_latencies = dict(report.user_properties).get(API_LATENCIES_PROPERTY, [])
+        self.measurements[report.nodeid] = RunMeasurementSchema(
+            revision=self.revision,
+            duration=report.duration,
+            api_latencies=api_latencies,
+        )
+
+    def pytest_sessionfinish(self, session: Session) -> None:
+        if self.is_worker or not self.measurements:
+            return
+
+        history = self.store.load()
+        for nodeid, measurement in self.measurements.items():
+            regression = self.find_regression(
+                nodeid, measurement, history.get(nodeid, [])
+            )
+            if regression:
+                self.regressions.append(regression)
+
+        self.store.append(self.measurements)
+
+        if self.regressions and self.fail and session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter) -> None:
+        if self.is_worker or not self.regressions:
+            return
+
+        terminalreporter.section(
+            "performance regressions", red=self.fail, yellow=not self.fail
+        )
+        for regression in self.regressions:
+            if regression.p_value is not None:
+                detail = f"p={regression.p_value:.4f}"
+            else:
+                detail = f"limit {regression.limit * 1000:.1f}ms"
+            terminalreporter.write_line(
+                f"{regression.nodeid}: {regression.metric} median "
+                f"{regression.baseline_median * 1000:.1f}ms -> "
+                f"{regression.current_median * 1000:.1f}ms ({detail})"
+            )
+
+    def find_regression(
+        self,
+        nodeid: str,
+        current: RunMeasurementSchema,
+        history: list[RunMeasurementSchema],
+    ) -> RegressionSchema | None:
+        # Прогоны той же ревизии (перезапуски, локальные правки) не считаются базовыми:
+        # иначе регрессия попадает в историю и сравнивается сама с собой
+        if self.revision != "unknown":
+            history = [run for run in history if run.revision != self.revision]
+
+        # Если тест вызывает API, сравниваем выборки задержек запросов U-критерием
+        if current.api_latencies:
+            baseline_samples = [value for run in history for value in run.api_latencies]
+            if len(baseline_samples) < MIN_BASELINE_SAMPLES:
+                return None
+
+            baseline_median = statistics.median(baseline_samples)
+            current_median = statistics.median(current.api_latencies)
+            if current_median < baseline_median * self.threshold:
+                return None
+
+            p_value = mann_whitney_u(current.api_latencies, baseline_samples)
+            if p_value >= self.alpha:
+                return None
+
+            return RegressionSchema(
+                nodeid=nodeid,
+                metric="api latency",
+                baseline_median=baseline_median,
+                current_median=current_median,
+                p_value=p_value,
+            )
+
+        # Иначе у теста одно измерение времени выполнения — сравниваем его с median + k·MAD
+        baseline_samples = [run.duration for run in history]
+        if len(baseline_samples) < MIN_BASELINE_SAMPLES:
+            return None
+
+        baseline_median = statistics.median(baseline_samples)
+        limit = robust_upper_limit(baseline_samples, self.mad)
+        if (
+            current.duration < baseline_median * self.threshold
+            or current.duration <= limit
+        ):
+            return None
+
+        return RegressionSchema(
+            nodeid=nodeid,
+            metric="duration",
+            baseline_median=baseline_median,
+            current_median=current.duration,
+            limit=limit,
+        )
+
+
+def pytest_addoption(parser: Parser) -> None:
+    group = parser.getgroup("performance", "Регрессии производительности")
+    group.addoption(
+        "--perf",
+        action="store_true",
+        default=False,
+        help="Записывать время тестов и задержки API и сравнивать их с прошлыми прогонами.",
+    )
+    group.addoption(
+        "--perf-store",
+        default=".perf/baselines.json",
+        metavar="PATH",
+        help="Файл с историей измерений.",
+    )
+    group.addoption(
+        "--perf-history",
+        type=int,
+        default=20,
+        help="Количество последних прогонов, с которыми сравнивается тест.",
+    )
+    group.addoption(
+        "--perf-alpha",
+        type=float,
+        default=0.01,
+        help="Уровень значимости U-критерия Манна-Уитни (для задержек API).",
+    )
+    group.addoption(
+        "--perf-mad",
+        type=float,
+        default=3.0,
+        help="Во сколько MAD время теста без API-запросов может превышать медиану истории.",
+    )
+    group.addoption(
+        "--perf-threshold",
+        type=float,
+        default=1.2,
+        help="Во сколько раз медиана должна вырасти, чтобы считаться регрессией.",
+    )
+    group.addoption(
+        "--perf-fail",
+        action="store_true",
+        default=False,
+        help="Завершать прогон с ошибкой при регрессии (по умолчанию только предупреждение).",
+    )
+
+
+def pytest_configure(config: Config) -> None:
+    if not config.getoption("perf"):
+        return
+
+    plugin = PerformancePlugin(config)
+    add_request_listener(plugin.on_request)
+    config.pluginmanager.register(plugin, "performance-plugin")
@@ -0,0 +1,207 @@
+import time
+import warnings
+import weakref
+
+import pytest
+import xdist
+from _pytest.config import Config
+from _pytest.config.argparsing import Parser
+from _pytest.fixtures import FixtureDef, SubRequest
+from _pytest.main import Session
+from _pytest.nodes import Item
+from _pytest.reports import TestReport
+from pydantic import ValidationError
+from xdist.scheduler import WorkStealingScheduling
+
+from tools.durations import (
+    DURATIONS_CACHE_KEY,
+    DurationHistorySchema,
+    DurationRecorder,
+    get_shared_setup_fixture,
+    plan_schedule,
+)
+from tools.shared_setup import (
+    SharedSetupGroup,
+    get_shared_setup_name,
+    shared_setup_groups_key,
+)
+
+# Ключ, под которым воркер xdist передаёт замеры контроллеру
+WORKER_OUTPUT_KEY = "durations"
+# Мажорная версия xdist, внутренности WorkStealingScheduling которой использует DurationScheduling
+SUPPORTED_XDIST_MAJOR = "3"
+
+duration_recorder_key = pytest.StashKey[DurationRecorder]()
+# Сколько времени создания каждой группы shared_setup уже учтено
+recorded_shared_setup_key = pytest.StashKey[
+    weakref.WeakKeyDictionary[SharedSetupGroup, float]
+]()
+
+
+def is_xdist_supported() -> bool:
+    # DurationScheduling переопределяет schedule() и обращается к node2pending,
+    # node2collection и _check_nodes_have_same_collection базового планировщика
+    return xdist.__version__.split(".")[0] == SUPPORTED_XDIST_MAJOR and all(
+        hasattr(WorkStealingScheduling, name)
+        for name in ("schedule", "check_schedule", "_check_nodes_have_same_collection")
+    )
+
+
+def load_history(config: Config) -> DurationHistorySchema:
+    try:
+        return DurationHistorySchema.model_validate(
+            config.cache.get(DURATIONS_CACHE_KEY, None) or {}
+        )
+    except ValidationError:
+        return DurationHistorySchema()
+
+
+class DurationScheduling(WorkStealingScheduling):
+    """
+    Планировщик xdist, распределяющий тесты по длительностям прошлых прогонов.
+
+    Весь набор тестов раздаётся воркерам сразу по плану tools.durations.plan_schedule
+    (LPT с группировкой по дорогим общим фикстурам). Если оценки разошлись
+    с реальностью, освободившийся воркер забирает хвост очереди у самого загруженного,
+    как в --dist worksteal, — хвост плана состоит из самых коротких тестов.
+    """
+
+    def __init__(self, config: Config, log, history: DurationHistorySchema):
+        """
+        :param config: Конфигурация pytest.
+        :param log: Логгер xdist.
+        :param history: История длительностей тестов и стоимости фикстур.
+        """
+        super().__init__(config, log)
+        self.history = history
+
+    def schedule(self) -> None:
+        assert self.collection_is_completed
+
+        # Повторный вызов (добавился воркер) обрабатывается как в базовом планировщике
+        if self.collection is not None:
+            self.check_schedule()
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        if not self.collection:
+            return
+
+        nodes = [node for node in self.nodes if not node.shutting_down]
+        plan = plan_schedule(self.collection, self.history, len(nodes))
+        for node, indices in zip(nodes, plan):
+            if indices:
+                self.node2pending[node].extend(indices)
+                node.send_runtest_some(indices)
+
+        self.check_schedule()
+
+
+def pytest_addoption(parser: Parser) -> None:
+    group = parser.getgroup("scheduling", "Распределение тестов")
+    group.addoption(
+        "--lpt-schedule",
+        action="store_true",
+        default=False,
+        help="Распределять тесты по воркерам xdist по длительностям прошлых прогонов (LPT), "
+        "объединяя тесты с дорогими общими фикстурами.",
+    )
+
+
+def pytest_configure(config: Config) -> None:
+    # Без cacheprovider (-p no:cacheprovider) историю хранить негде
+    if getattr(config, "cache", None) is not None:
+        config.stash[duration_recorder_key] = DurationRecorder()
+        config.stash[recorded_shared_setup_key] = weakref.WeakKeyDictionary()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config: Config, log) -> DurationScheduling | None:
+    if duration_recorder_key not in config.stash:
+        return None
+    if not config.getoption("lpt_schedule"):
+        return None
+    if not is_xdist_supported():
+        warnings.warn(
+            pytest.PytestWarning(
+                f"--lpt-schedule не поддерживает pytest-xdist {xdist.__version__}, "
+                "используется планировщик по умолчанию"
+            )
+        )
+        return None
+    return DurationScheduling(config, log, load_history(config))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef: FixtureDef, request: SubRequest):
+    started_at = time.perf_counter()
+    yield
+    # Время без учёта зависимостей: они настраиваются до вызова этого хука
+    if recorder := request.config.stash.get(duration_recorder_key, None):
+        recorder.record_fixture_setup(
+            fixturedef.argname, fixturedef.scope, time.perf_counter() - started_at
+        )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: Item):
+    outcome = yield
+    report: TestReport = outcome.get_result()
+    if recorder := item.config.stash.get(duration_recorder_key, None):
+        recorder.record_phase(item.nodeid, report.duration)
+        if report.when == "setup":
+            fixtures = list(getattr(item, "fixturenames", []))
+            if name := get_shared_setup_name(item):
+                fixtures.append(get_shared_setup_fixture(name))
+                record_shared_setup(item, recorder, name)
+            recorder.record_test_fixtures(item.nodeid, fixtures)
+
+
+def record_shared_setup(item: Item, recorder: DurationRecorder, name: str) -> None:
+    """
+    Функция учитывает группу shared_setup как общую фикстуру, чтобы планировщик
+    отправлял тесты группы на один воркер, как тесты с дорогой фикстурой шире function.
+
+    Значения группы создаются лениво в фикстурах тестов, поэтому после setup каждого
+    теста записывается только время создания, которое ещё не было учтено.
+    """
+    group = item.config.stash[shared_setup_groups_key].get(name)
+    if group is None:
+        return
+
+    recorded = item.config.stash[recorded_shared_setup_key]
+    if (seconds := group.setup_seconds - recorded.get(group, 0.0)) > 0:
+        recorder.record_fixture_setup(
+            get_shared_setup_fixture(name),
+            "shared_setup",
+            seconds,
+            setups=0 if group in recorded else 1,
+        )
+        recorded[group] = group.setup_seconds
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    recorder = node.config.stash.get(duration_recorder_key, None)
+    data = getattr(node, "workeroutput", {}).get(WORKER_OUTPUT_KEY)
+    if recorder is not None and data:
+        recorder.merge(data)
+
+
+def pytest_sessionfinish(session: Session) -> None:
+    config = session.config
+    if (recorder := config.stash.get(duration_recorder_key, None)) is None:
+        return
+
+    # На воркере xdist отдаём замеры контроллеру, историю сохраняет только он
+    if hasattr(config, "workeroutput"):
+        config.workeroutput[WORKER_OUTPUT_KEY] = recorder.to_dict()
+        return
+
+    if recorder.durations:
+        history = recorder.update_history(load_history(config))
+        config.cache.set(DURATIONS_CACHE_KEY, history.model_dump())
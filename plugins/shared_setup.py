@@ -0,0 +1,40 @@
+import pytest
+from _pytest.config import Config
+from _pytest.fixtures import SubRequest
+from _pytest.nodes import Item
+
+from tools.fakers import get_seed
+from tools.shared_setup import (
+    SharedSetupGroup,
+    get_shared_setup_name,
+    shared_setup_groups_key,
+)
+
+
+def pytest_configure(config: Config) -> None:
+    config.stash[shared_setup_groups_key] = {}
+
+
+@pytest.fixture
+def shared_setup(
+    request: SubRequest, fake_seed: int, worker_id: str
+) -> SharedSetupGroup | None:
+    # Под xdist у каждого воркера свои группы
+    if (name := get_shared_setup_name(request.node)) is None:
+        return None
+
+    groups = request.config.stash[shared_setup_groups_key]
+    if name not in groups:
+        # Воркер входит в seed, чтобы группа, разделённая между воркерами, не повторяла email
+        groups[name] = SharedSetupGroup(
+            name, fake_seed=get_seed(fake_seed, "shared_setup", name, worker_id)
+        )
+    return groups[name]
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item: Item):
+    yield
+    # Тест изменил общие данные: следующий тест группы создаст их заново
+    if item.get_closest_marker("mutating") and (name := get_shared_setup_name(item)):
+        item.config.stash[shared_setup_groups_key].pop(name, None)
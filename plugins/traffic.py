@@ -0,0 +1,39 @@
+from pathlib import Path
+
+import pytest
+from _pytest.config import Config
+from _pytest.config.argparsing import Parser
+from _pytest.main import Session
+
+from clients.api_client import add_request_listener
+from tools.traffic import TRAFFIC_LOG_PATH, TrafficLog
+
+traffic_log_key = pytest.StashKey[TrafficLog]()
+
+
+def pytest_addoption(parser: Parser) -> None:
+    group = parser.getgroup("traffic", "Журнал трафика")
+    group.addoption(
+        "--traffic-log",
+        nargs="?",
+        const=str(TRAFFIC_LOG_PATH),
+        default=None,
+        metavar="PATH",
+        help=f"Записывать все запросы API в JSON Lines (по умолчанию {TRAFFIC_LOG_PATH}) "
+        "для последующего воспроизведения через python -m tools.replay.",
+    )
+
+
+def pytest_configure(config: Config) -> None:
+    if not (path := config.getoption("traffic_log")):
+        return
+
+    traffic_log = TrafficLog(Path(path))
+    config.stash[traffic_log_key] = traffic_log
+    add_request_listener(traffic_log)
+
+
+def pytest_sessionfinish(session: Session) -> None:
+    # Каждый воркер xdist сам дозаписывает свои строки в общий журнал
+    if traffic_log := session.config.stash.get(traffic_log_key, None):
+        traffic_log.flush()
@@ -11,11 +11,11 @@ from clients.users.public_users_client import PublicUsersClient
 from fixtures.users import UserFixture
 from tools.assertions.authentication import assert_login_response
 from tools.assertions.base import assert_status_code
-from tools.assertions.schema import validate_json_schema
 
 
 @pytest.mark.regression
 @pytest.mark.authentication
+@pytest.mark.shared_setup("user")
 class TestAuthentication:
     def test_login(
         self,
@@ -27,9 +27,9 @@ class TestAuthentication:
             email=function_user.email, password=function_user.password
         )
         response = authentication_client.login_api(request)
-        response_data = LoginResponseSchema.model_validate_json(response.text)
+        response_data, _ = authentication_client.parse_response(
+            response, LoginResponseSchema
+        )
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_login_response(response_data)
-
-        validate_json_schema(response.json(), response_data.model_json_schema())
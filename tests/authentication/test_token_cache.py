@@ -0,0 +1,208 @@
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from clients.authentication.authentication_client import AuthenticationClient
+from clients.authentication.authentication_schema import LoginRequestSchema
+from clients.authentication.token_cache import TokenCache, get_token_expiry
+from clients.users.users_schema import CreateUserRequestSchema
+from config import settings
+from tools.fake_backend import tokens
+from tools.fake_backend.app import FakeBackend
+from tools.fake_backend.tokens import TokenSigner
+
+
+class CountingBackend(FakeBackend):
+    """
+    Фейковый сервер, который запоминает пути выполненных запросов.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.paths: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.paths.append(request.url.path)
+        return super().__call__(request)
+
+    def pop_paths(self) -> list[str]:
+        paths, self.paths = self.paths, []
+        return [path.rsplit("/", 1)[-1] for path in paths]
+
+
+@pytest.fixture
+def backend() -> CountingBackend:
+    return CountingBackend()
+
+
+@pytest.fixture
+def login_request(backend: CountingBackend) -> LoginRequestSchema:
+    request = CreateUserRequestSchema()
+    with httpx.Client(transport=httpx.MockTransport(backend)) as client:
+        client.post(
+            "http://localhost:8000/api/v1/users", json=request.model_dump(by_alias=True)
+        )
+    backend.pop_paths()
+    return LoginRequestSchema(email=request.email, password=request.password)
+
+
+@pytest.fixture
+def token_cache(tmp_path: Path, backend: CountingBackend) -> TokenCache:
+    client = httpx.Client(
+        transport=httpx.MockTransport(backend), base_url="http://localhost:8000"
+    )
+    yield TokenCache(
+        directory=tmp_path, authentication_client=AuthenticationClient(client=client)
+    )
+    client.close()
+
+
+@pytest.mark.unit
+class TestTokenCache:
+    def test_token_is_cached(
+        self,
+        backend: CountingBackend,
+        token_cache: TokenCache,
+        login_request: LoginRequestSchema,
+    ):
+        token = token_cache.get_token(login_request)
+
+        assert token_cache.get_token(login_request) == token
+        assert backend.pop_paths() == ["login"]
+        assert backend.signer.verify(token.access_token, "access")
+
+    def test_expiring_token_is_refreshed(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        backend: CountingBackend,
+        token_cache: TokenCache,
+        login_request: LoginRequestSchema,
+    ):
+        # Токен истекает раньше REFRESH_MARGIN, поэтому сразу считается устаревшим
+        monkeypatch.setattr(tokens, "ACCESS_TOKEN_TTL", 30)
+        token = token_cache.get_token(login_request)
+
+        refreshed = token_cache.get_token(login_request)
+
+        assert refreshed != token
+        assert backend.pop_paths() == ["login", "refresh"]
+
+    def test_expired_refresh_token_logs_in_again(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        backend: CountingBackend,
+        token_cache: TokenCache,
+        login_request: LoginRequestSchema,
+    ):
+        monkeypatch.setattr(tokens, "ACCESS_TOKEN_TTL", 30)
+        monkeypatch.setattr(tokens, "REFRESH_TOKEN_TTL", 30)
+        token_cache.get_token(login_request)
+
+        token_cache.get_token(login_request)
+
+        assert backend.pop_paths() == ["login", "login"]
+
+    def test_renew_rejected_token(
+        self,
+        backend: CountingBackend,
+        token_cache: TokenCache,
+        login_request: LoginRequestSchema,
+    ):
+        stale = token_cache.get_token(login_request)
+
+        renewed = token_cache.renew_token(login_request, stale)
+
+        assert renewed != stale
+        assert token_cache.get_token(login_request) == renewed
+        assert backend.pop_paths() == ["login", "refresh"]
+
+    def test_renew_already_renewed_token(
+        self,
+        backend: CountingBackend,
+        token_cache: TokenCache,
+        login_request: LoginRequestSchema,
+    ):
+        # Другой воркер уже обновил токен: повторного обновления нет
+        stale = token_cache.get_token(login_request)
+        renewed = token_cache.renew_token(login_request, stale)
+        backend.pop_paths()
+
+        assert token_cache.renew_token(login_request, stale) == renewed
+        assert backend.pop_paths() == []
+
+    def test_renew_falls_back_to_login(
+        self,
+        backend: CountingBackend,
+        token_cache: TokenCache,
+        login_request: LoginRequestSchema,
+    ):
+        stale = token_cache.get_token(login_request)
+        # Сервер перезапущен с другим ключом: refresh-токен тоже больше не принимается
+        backend.signer = TokenSigner()
+
+        renewed = token_cache.renew_token(login_request, stale)
+
+        assert backend.signer.verify(renewed.access_token, "access")
+        assert backend.pop_paths() == ["login", "refresh", "login"]
+
+    def test_invalidate(
+        self,
+        backend: CountingBackend,
+        token_cache: TokenCache,
+        login_request: LoginRequestSchema,
+    ):
+        token_cache.get_token(login_request)
+
+        token_cache.invalidate(login_request)
+        token_cache.get_token(login_request)
+
+        assert backend.pop_paths() == ["login", "login"]
+
+    def test_other_server_has_own_entry(
+        self,
+        tmp_path: Path,
+        backend: CountingBackend,
+        token_cache: TokenCache,
+        login_request: LoginRequestSchema,
+    ):
+        token_cache.get_token(login_request)
+        with httpx.Client(
+            transport=httpx.MockTransport(backend), base_url="http://localhost:8001"
+        ) as client:
+            other_cache = TokenCache(
+                directory=tmp_path,
+                authentication_client=AuthenticationClient(client=client),
+            )
+
+            other_cache.get_token(login_request)
+
+        assert backend.pop_paths() == ["login", "login"]
+
+    def test_fake_backend_has_own_entry(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        backend: CountingBackend,
+        token_cache: TokenCache,
+        login_request: LoginRequestSchema,
+    ):
+        monkeypatch.setattr(settings, "fake_backend", False)
+        token_cache.get_token(login_request)
+        monkeypatch.setattr(settings, "fake_backend", True)
+
+        token_cache.get_token(login_request)
+
+        assert backend.pop_paths() == ["login", "login"]
+
+
+@pytest.mark.unit
+class TestGetTokenExpiry:
+    def test_jwt(self):
+        token = TokenSigner().sign("user-id", "access", ttl=100)
+
+        assert get_token_expiry(token) == pytest.approx(time.time() + 100, abs=2)
+
+    @pytest.mark.parametrize("token", ["", "opaque-token", "a.b.c", "a.e30.c"])
+    def test_not_jwt(self, token: str):
+        assert get_token_expiry(token) is None
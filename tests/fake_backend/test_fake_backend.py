@@ -0,0 +1,218 @@
+from http import HTTPStatus
+
+import httpx
+import pytest
+
+from clients.users.users_schema import CreateUserRequestSchema
+from tools.fake_backend.app import FakeBackend
+
+FILE_CONTENT = b"0123456789"
+
+
+@pytest.fixture
+def backend() -> FakeBackend:
+    return FakeBackend()
+
+
+@pytest.fixture
+def client(backend: FakeBackend) -> httpx.Client:
+    with httpx.Client(
+        transport=httpx.MockTransport(backend), base_url="http://localhost:8000"
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+def user(client: httpx.Client) -> dict:
+    request = CreateUserRequestSchema()
+    response = client.post("/api/v1/users", json=request.model_dump(by_alias=True))
+    login = client.post(
+        "/api/v1/authentication/login",
+        json={"email": request.email, "password": request.password},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['token']['accessToken']}"
+    return response.json()["user"]
+
+
+@pytest.fixture
+def file(client: httpx.Client, user: dict) -> dict:
+    response = client.post(
+        "/api/v1/files",
+        data={"filename": "image.png", "directory": "tests"},
+        files={"upload_file": ("image.png", FILE_CONTENT, "image/png")},
+    )
+    return response.json()["file"]
+
+
+def create_course(client: httpx.Client, user: dict, file: dict) -> dict:
+    response = client.post(
+        "/api/v1/courses",
+        json={
+            "title": "Python",
+            "maxScore": 100,
+            "minScore": 10,
+            "description": "Python API course",
+            "estimatedTime": "2 weeks",
+            "previewFileId": file["id"],
+            "createdByUserId": user["id"],
+        },
+    )
+    assert response.status_code == HTTPStatus.OK
+    return response.json()["course"]
+
+
+def create_exercise(client: httpx.Client, course: dict) -> dict:
+    response = client.post(
+        "/api/v1/exercises",
+        json={
+            "title": "Exercise 1",
+            "courseId": course["id"],
+            "maxScore": 5,
+            "minScore": 1,
+            "orderIndex": 0,
+            "description": "Exercise 1",
+            "estimatedTime": "5 minutes",
+        },
+    )
+    assert response.status_code == HTTPStatus.OK
+    return response.json()["exercise"]
+
+
+@pytest.mark.unit
+class TestFakeBackendValidation:
+    def test_missing_and_invalid_fields(self, client: httpx.Client):
+        response = client.post("/api/v1/users", json={"email": "not-an-email"})
+
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+        errors = {tuple(error["loc"]): error for error in response.json()["detail"]}
+        assert errors[("body", "email")]["type"] == "value_error"
+        for field in ("password", "lastName", "firstName", "middleName"):
+            assert errors[("body", field)]["type"] == "missing"
+        assert all(error["msg"] for error in errors.values())
+
+    def test_invalid_json(self, client: httpx.Client):
+        response = client.post(
+            "/api/v1/users",
+            content=b"{",
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+        assert response.json()["detail"][0]["type"] == "json_invalid"
+
+    def test_missing_query_parameter(self, client: httpx.Client, user: dict):
+        response = client.get("/api/v1/courses")
+
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+        assert response.json()["detail"][0]["loc"] == ["query", "userId"]
+
+    def test_partial_update_validates_aliases(self, client: httpx.Client, user: dict):
+        response = client.patch(f"/api/v1/users/{user['id']}", json={"email": "bad"})
+
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+        assert response.json()["detail"][0]["loc"] == ["body", "email"]
+
+    def test_unknown_route_and_method(self, client: httpx.Client):
+        assert client.get("/api/v1/unknown").status_code == HTTPStatus.NOT_FOUND
+        assert client.put("/api/v1/users").status_code == HTTPStatus.METHOD_NOT_ALLOWED
+
+
+@pytest.mark.unit
+class TestFakeBackendCascadeDelete:
+    def test_delete_course_deletes_exercises(
+        self, client: httpx.Client, user: dict, file: dict
+    ):
+        course = create_course(client, user, file)
+        exercise = create_exercise(client, course)
+
+        assert (
+            client.delete(f"/api/v1/courses/{course['id']}").status_code
+            == HTTPStatus.OK
+        )
+
+        assert (
+            client.get(f"/api/v1/courses/{course['id']}").status_code
+            == HTTPStatus.NOT_FOUND
+        )
+        assert (
+            client.get(f"/api/v1/exercises/{exercise['id']}").status_code
+            == HTTPStatus.NOT_FOUND
+        )
+
+    def test_delete_file_deletes_courses(
+        self, client: httpx.Client, user: dict, file: dict
+    ):
+        course = create_course(client, user, file)
+
+        client.delete(f"/api/v1/files/{file['id']}")
+
+        assert (
+            client.get(f"/api/v1/files/{file['id']}").status_code
+            == HTTPStatus.NOT_FOUND
+        )
+        assert (
+            client.get(f"/api/v1/courses/{course['id']}").status_code
+            == HTTPStatus.NOT_FOUND
+        )
+
+    def test_delete_user_deletes_courses(
+        self, backend: FakeBackend, client: httpx.Client, user: dict, file: dict
+    ):
+        course = create_course(client, user, file)
+
+        client.delete(f"/api/v1/users/{user['id']}")
+
+        # Токен удалённого пользователя больше не принимается
+        assert (
+            client.get(f"/api/v1/courses/{course['id']}").status_code
+            == HTTPStatus.UNAUTHORIZED
+        )
+        assert course["id"] not in backend.storage.courses
+
+
+@pytest.mark.unit
+class TestFakeBackendStatic:
+    def test_get(self, client: httpx.Client, file: dict):
+        response = client.get(file["url"])
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.content == FILE_CONTENT
+        assert response.headers["content-type"] == "image/png"
+
+    def test_head(self, client: httpx.Client, file: dict):
+        response = client.head(file["url"])
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.content == b""
+        assert response.headers["content-length"] == str(len(FILE_CONTENT))
+
+    @pytest.mark.parametrize(
+        "range_header, content, content_range",
+        [
+            ("bytes=2-4", b"234", "bytes 2-4/10"),
+            ("bytes=7-", b"789", "bytes 7-9/10"),
+            ("bytes=-3", b"789", "bytes 7-9/10"),
+            ("bytes=8-100", b"89", "bytes 8-9/10"),
+        ],
+    )
+    def test_range(
+        self,
+        client: httpx.Client,
+        file: dict,
+        range_header: str,
+        content: bytes,
+        content_range: str,
+    ):
+        response = client.get(file["url"], headers={"Range": range_header})
+
+        assert response.status_code == HTTPStatus.PARTIAL_CONTENT
+        assert response.content == content
+        assert response.headers["content-range"] == content_range
+
+    @pytest.mark.parametrize("range_header", ["bytes=10-", "bytes=5-2", "bytes=-"])
+    def test_range_not_satisfiable(
+        self, client: httpx.Client, file: dict, range_header: str
+    ):
+        response = client.get(file["url"], headers={"Range": range_header})
+
+        assert response.status_code == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
@@ -0,0 +1,109 @@
+from http import HTTPStatus
+
+import httpx
+import pytest
+
+from clients.users.users_schema import CreateUserRequestSchema
+from tools.fake_backend.app import FakeBackend
+from tools.fake_backend.tokens import TokenSigner, encode_segment
+
+
+@pytest.fixture
+def signer() -> TokenSigner:
+    return TokenSigner(secret=b"secret")
+
+
+@pytest.mark.unit
+class TestTokenSigner:
+    def test_issued_tokens_are_valid(self, signer: TokenSigner):
+        token = signer.issue("user-id")
+
+        assert token.token_type == "bearer"
+        assert signer.verify(token.access_token, "access") == "user-id"
+        assert signer.verify(token.refresh_token, "refresh") == "user-id"
+
+    def test_expired_token_is_rejected(self, signer: TokenSigner):
+        token = signer.sign("user-id", "access", ttl=-1)
+
+        assert signer.verify(token, "access") is None
+
+    def test_token_type_is_checked(self, signer: TokenSigner):
+        token = signer.issue("user-id")
+
+        assert signer.verify(token.refresh_token, "access") is None
+        assert signer.verify(token.access_token, "refresh") is None
+
+    def test_foreign_signature_is_rejected(self, signer: TokenSigner):
+        token = TokenSigner(secret=b"other").sign("user-id", "access", ttl=60)
+
+        assert signer.verify(token, "access") is None
+
+    def test_tampered_payload_is_rejected(self, signer: TokenSigner):
+        header, _, signature = signer.sign("user-id", "access", ttl=60).split(".")
+        payload = encode_segment({"sub": "admin", "type": "access", "exp": 2**40})
+
+        assert signer.verify(f"{header}.{payload}.{signature}", "access") is None
+
+    @pytest.mark.parametrize("token", ["", "abc", "a.b", "a.b.c", "...."])
+    def test_malformed_token_is_rejected(self, signer: TokenSigner, token: str):
+        assert signer.verify(token, "access") is None
+
+
+@pytest.mark.unit
+class TestFakeBackendAuthentication:
+    @pytest.fixture
+    def client(self, signer: TokenSigner) -> httpx.Client:
+        backend = FakeBackend(signer=signer)
+        with httpx.Client(
+            transport=httpx.MockTransport(backend), base_url="http://localhost:8000"
+        ) as client:
+            yield client
+
+    @pytest.fixture
+    def user_id(self, client: httpx.Client) -> str:
+        request = CreateUserRequestSchema()
+        response = client.post("/api/v1/users", json=request.model_dump(by_alias=True))
+        return response.json()["user"]["id"]
+
+    def test_expired_access_token(
+        self, client: httpx.Client, signer: TokenSigner, user_id: str
+    ):
+        token = signer.sign(user_id, "access", ttl=-1)
+
+        response = client.get(
+            "/api/v1/users/me", headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+        assert response.headers["www-authenticate"] == "Bearer"
+        assert response.json() == {"detail": "Could not validate credentials"}
+
+    def test_missing_token(self, client: httpx.Client):
+        response = client.get("/api/v1/users/me")
+
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+        assert response.json() == {"detail": "Not authenticated"}
+
+    def test_refresh(self, client: httpx.Client, signer: TokenSigner, user_id: str):
+        token = signer.issue(user_id)
+
+        response = client.post(
+            "/api/v1/authentication/refresh",
+            json={"refreshToken": token.refresh_token},
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        access_token = response.json()["token"]["accessToken"]
+        assert signer.verify(access_token, "access") == user_id
+
+    def test_refresh_rejects_access_token(
+        self, client: httpx.Client, signer: TokenSigner, user_id: str
+    ):
+        token = signer.issue(user_id)
+
+        response = client.post(
+            "/api/v1/authentication/refresh", json={"refreshToken": token.access_token}
+        )
+
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+        assert response.json() == {"detail": "Invalid refresh token"}
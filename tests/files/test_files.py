@@ -15,28 +15,26 @@ from tools.assertions.files import (
     assert_file_is_accessible,
     assert_get_file_response,
 )
-from tools.assertions.schema import validate_json_schema
 
 
 @pytest.mark.files
 @pytest.mark.regression
+@pytest.mark.shared_setup("file")
 class TestFiles:
     def test_create_file(self, files_client: FilesClient):
         request = CreateFileRequestSchema(upload_file="./testdata/files/image.png")
         response = files_client.create_file_api(request)
-        response_data = CreateFileResponseSchema.model_validate_json(response.text)
+        response_data, _ = files_client.parse_response(
+            response, CreateFileResponseSchema
+        )
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_create_file_response(request, response_data)
         assert_file_is_accessible(str(response_data.file.url))
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
-
     def test_get_file(self, files_client: FilesClient, function_file: FileFixture):
         response = files_client.get_file_api(function_file.response.file.id)
-        response_data = GetFileResponseSchema.model_validate_json(response.text)
+        response_data, _ = files_client.parse_response(response, GetFileResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_get_file_response(response_data, function_file.response)
-
-        validate_json_schema(response.json(), response_data.model_json_schema())
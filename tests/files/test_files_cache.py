@@ -0,0 +1,78 @@
+from pathlib import Path
+
+import httpx
+import pytest
+
+from clients.api_client import add_request_listener, remove_request_listener
+from clients.files.files_cache import FileUploadCache
+from clients.files.files_client import FilesClient
+from clients.files.files_schema import CreateFileRequestSchema
+from clients.users.users_schema import CreateUserRequestSchema
+from tools.fake_backend.app import FakeBackend
+
+FILE_CONTENT = b"0123456789"
+
+
+@pytest.fixture
+def files_client() -> FilesClient:
+    with httpx.Client(
+        transport=httpx.MockTransport(FakeBackend()), base_url="http://localhost:8000"
+    ) as client:
+        request = CreateUserRequestSchema()
+        client.post("/api/v1/users", json=request.model_dump(by_alias=True))
+        login = client.post(
+            "/api/v1/authentication/login",
+            json={"email": request.email, "password": request.password},
+        )
+        token = login.json()["token"]["accessToken"]
+        client.headers["Authorization"] = f"Bearer {token}"
+        yield FilesClient(client=client)
+
+
+@pytest.fixture
+def file_cache(tmp_path: Path) -> FileUploadCache:
+    cache = FileUploadCache(directory=tmp_path)
+    add_request_listener(cache.on_request)
+    yield cache
+    remove_request_listener(cache.on_request)
+
+
+@pytest.mark.unit
+class TestFileUploadCache:
+    def test_same_content_is_uploaded_once(
+        self, files_client: FilesClient, file_cache: FileUploadCache
+    ):
+        first = file_cache.get_or_create(
+            files_client, CreateFileRequestSchema(upload_file=FILE_CONTENT)
+        )
+        second = file_cache.get_or_create(
+            files_client, CreateFileRequestSchema(upload_file=FILE_CONTENT)
+        )
+
+        assert second.file.id == first.file.id
+
+    def test_deleted_file_is_uploaded_again(
+        self, tmp_path: Path, files_client: FilesClient, file_cache: FileUploadCache
+    ):
+        request = CreateFileRequestSchema(upload_file=FILE_CONTENT)
+        deleted = file_cache.get_or_create(files_client, request)
+
+        files_client.delete_file_api(deleted.file.id)
+
+        assert list(tmp_path.glob("*.json")) == []
+        created = file_cache.get_or_create(files_client, request)
+        assert created.file.id != deleted.file.id
+
+    def test_stale_disk_entry_is_verified(
+        self, tmp_path: Path, files_client: FilesClient, file_cache: FileUploadCache
+    ):
+        request = CreateFileRequestSchema(upload_file=FILE_CONTENT)
+        deleted = file_cache.get_or_create(files_client, request)
+        # Файл удалён в обход кеша — как если бы его удалил другой воркер
+        files_client.client.delete(f"/api/v1/files/{deleted.file.id}")
+
+        created = FileUploadCache(directory=tmp_path).get_or_create(
+            files_client, request
+        )
+
+        assert created.file.id != deleted.file.id
@@ -0,0 +1,108 @@
+import asyncio
+import io
+import os
+from pathlib import Path
+
+import pytest
+from httpx import StreamConsumed
+
+from clients.files import files_upload
+from clients.files.files_client import build_upload
+from clients.files.files_schema import CreateFileRequestSchema
+from clients.files.files_upload import MultipartUpload
+
+IMAGE_PATH = Path("./testdata/files/image.png")
+
+
+def build(source, filename: str = "upload.bin", chunk_size: int = 4) -> MultipartUpload:
+    return MultipartUpload(
+        fields={"directory": "tests"},
+        file_field="upload_file",
+        filename=filename,
+        source=source,
+        chunk_size=chunk_size,
+    )
+
+
+def read_body(upload: MultipartUpload) -> bytes:
+    return b"".join(upload.iter_chunks())
+
+
+async def aread_body(upload: MultipartUpload) -> bytes:
+    return b"".join([chunk async for chunk in upload.aiter_chunks()])
+
+
+@pytest.mark.unit
+class TestMultipartUpload:
+    def test_file_part_uses_source_basename_and_guessed_type(self):
+        request = CreateFileRequestSchema(upload_file=str(IMAGE_PATH))
+
+        head = build_upload(request).head.decode()
+
+        assert 'name="upload_file"; filename="image.png"' in head
+        assert "Content-Type: image/png" in head
+        assert f'name="filename"\r\n\r\n{request.filename}\r\n' in head
+
+    def test_bytes_use_request_filename(self):
+        request = CreateFileRequestSchema(filename="report.pdf", upload_file=b"%PDF")
+
+        head = build_upload(request).head.decode()
+
+        assert 'filename="report.pdf"' in head
+        assert "Content-Type: application/pdf" in head
+
+    def test_unknown_type(self):
+        assert "Content-Type: application/octet-stream" in build(b"").head.decode()
+
+    def test_content_length_matches_body(self):
+        upload = build(IMAGE_PATH)
+
+        body = read_body(upload)
+
+        assert int(upload.headers["Content-Length"]) == len(body)
+        assert body[len(upload.head) : -len(upload.tail)] == IMAGE_PATH.read_bytes()
+
+    def test_async_path_is_read_in_thread(self, monkeypatch: pytest.MonkeyPatch):
+        calls = []
+        to_thread = asyncio.to_thread
+
+        async def record_to_thread(function, *args):
+            calls.append(function)
+            return await to_thread(function, *args)
+
+        monkeypatch.setattr(files_upload.asyncio, "to_thread", record_to_thread)
+        upload = build(IMAGE_PATH, chunk_size=1024)
+
+        body = asyncio.run(aread_body(upload))
+
+        assert body == read_body(upload)
+        assert calls[0] is open
+        # Один вызов на каждый блок и один на конец файла
+        reads = -(-IMAGE_PATH.stat().st_size // 1024) + 1
+        assert len(calls) == 1 + reads
+
+    def test_seekable_file_is_resent(self):
+        upload = build(io.BytesIO(b"0123456789"))
+
+        assert read_body(upload) == read_body(upload)
+        assert asyncio.run(aread_body(upload)) == read_body(upload)
+
+    def test_non_seekable_file_is_not_resent_empty(self):
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"0123456789")
+        os.close(write_fd)
+
+        with os.fdopen(read_fd, "rb") as source:
+            upload = build(source)
+
+            assert "Content-Length" not in upload.headers
+            assert b"0123456789" in read_body(upload)
+            with pytest.raises(StreamConsumed):
+                read_body(upload)
+
+    def test_stream_is_sent_once(self):
+        upload = build(iter([b"0123", b"456789"]))
+
+        assert b"0123456789" in read_body(upload)
+        with pytest.raises(StreamConsumed):
+            read_body(upload)
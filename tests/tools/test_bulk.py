@@ -0,0 +1,95 @@
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from clients.courses.courses_schema import CreateCourseRequestSchema
+from clients.exercises.exercises_schema import CreateExerciseRequestSchema
+from clients.users.users_schema import CreateUserRequestSchema
+from tools.bulk import BulkBuildMixin
+from tools.fakers import fake
+
+
+class BulkDefaultsSchema(BulkBuildMixin, BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    title: str = Field(alias="courseTitle", default_factory=fake.sentence)
+    max_score: int = Field(alias="maxScore", default=100)
+    tags: list[str] = Field(default_factory=list)
+    estimated_time: str | None = Field(alias="estimatedTime", default=None)
+
+
+class BulkPrivateSchema(BulkBuildMixin, BaseModel):
+    model_config = ConfigDict(populate_by_name=True, extra="allow")
+
+    email: str = Field(default_factory=fake.email)
+    _token: str = PrivateAttr(default="token")
+
+
+def assert_equals_validated(instances: list[BaseModel]):
+    for instance in instances:
+        model = type(instance)
+        validated = model.model_validate(instance.model_dump(by_alias=True))
+
+        assert instance == validated
+        assert instance.model_dump() == validated.model_dump()
+        assert instance.model_dump(by_alias=True) == validated.model_dump(by_alias=True)
+        for name in model.model_fields:
+            assert type(getattr(instance, name)) is type(getattr(validated, name))
+
+
+@pytest.mark.unit
+class TestBuildMany:
+    @pytest.mark.parametrize(
+        "model",
+        [
+            CreateUserRequestSchema,
+            CreateCourseRequestSchema,
+            CreateExerciseRequestSchema,
+            BulkDefaultsSchema,
+            BulkPrivateSchema,
+        ],
+    )
+    def test_constructed_equal_validated(self, model: type[BulkBuildMixin]):
+        instances = model.build_many(200)
+
+        assert len(instances) == 200
+        assert_equals_validated(instances)
+        assert all(instance.model_fields_set == set() for instance in instances)
+
+    def test_overrides(self):
+        instances = CreateExerciseRequestSchema.build_many(
+            50, course_id="course-id", max_score=None
+        )
+
+        assert_equals_validated(instances)
+        for instance in instances:
+            assert instance.course_id == "course-id"
+            assert instance.max_score is None
+            assert instance.model_fields_set == {"course_id", "max_score"}
+            assert instance.model_dump(by_alias=True)["courseId"] == "course-id"
+
+    def test_static_defaults_are_not_shared_mutably(self):
+        first, second = BulkDefaultsSchema.build_many(2)
+
+        assert first.max_score == second.max_score == 100
+        assert first.estimated_time is None
+        assert first.tags is not second.tags
+
+    def test_mutable_overrides_are_copied(self):
+        first, second = BulkDefaultsSchema.build_many(2, tags=["python"])
+
+        first.tags.append("api")
+
+        assert second.tags == ["python"]
+
+    def test_private_attributes_are_initialized(self):
+        [instance] = BulkPrivateSchema.build_many(1)
+
+        assert instance._token == "token"
+
+    def test_unknown_override(self):
+        with pytest.raises(TypeError):
+            CreateUserRequestSchema.build_many(1, unknown="value")
+
+    def test_validate_sample_reports_invalid_data(self):
+        with pytest.raises(ValueError):
+            CreateUserRequestSchema.build_many(5, validate_sample=5, email="invalid")
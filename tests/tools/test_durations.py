@@ -0,0 +1,141 @@
+import pytest
+
+from tools.durations import (
+    DurationHistorySchema,
+    DurationRecorder,
+    FixtureCostSchema,
+    RecordedTestSchema,
+    plan_schedule,
+)
+
+
+def build_history(
+    durations: dict[str, float],
+    fixtures: dict[str, FixtureCostSchema] | None = None,
+    test_fixtures: dict[str, list[str]] | None = None,
+) -> DurationHistorySchema:
+    test_fixtures = test_fixtures or {}
+    return DurationHistorySchema(
+        tests={
+            nodeid: RecordedTestSchema(
+                duration=duration, fixtures=test_fixtures.get(nodeid, [])
+            )
+            for nodeid, duration in durations.items()
+        },
+        fixtures=fixtures or {},
+    )
+
+
+def get_loads(plan: list[list[int]], costs: list[float]) -> list[float]:
+    return [sum(costs[index] for index in indices) for indices in plan]
+
+
+def assert_every_test_planned_once(plan: list[list[int]], count: int):
+    assert sorted(index for indices in plan for index in indices) == list(range(count))
+
+
+@pytest.mark.unit
+class TestPlanSchedule:
+    def test_empty_history(self):
+        collection = [f"test_{index}" for index in range(10)]
+
+        plan = plan_schedule(collection, DurationHistorySchema(), workers=3)
+
+        assert_every_test_planned_once(plan, len(collection))
+        assert sorted(len(indices) for indices in plan) == [3, 3, 4]
+
+    def test_empty_collection(self):
+        assert plan_schedule([], DurationHistorySchema(), workers=2) == [[], []]
+
+    def test_unknown_tests_get_median_duration(self):
+        collection = ["slow", "fast", "medium", "new_1", "new_2"]
+        history = build_history({"slow": 10.0, "fast": 1.0, "medium": 2.0})
+
+        plan = plan_schedule(collection, history, workers=2)
+
+        # slow занимает один воркер, остальные тесты (2 + 1 + 2 + 2) — другой
+        assert_every_test_planned_once(plan, len(collection))
+        assert [0] in plan
+        loads = sorted(get_loads(plan, [10.0, 1.0, 2.0, 2.0, 2.0]))
+        assert loads == [7.0, 10.0]
+
+    def test_balance_across_workers(self):
+        durations = [7.0, 6.0, 5.0, 4.0, 4.0, 3.0, 3.0, 2.0, 1.0, 1.0]
+        collection = [f"test_{index}" for index in range(len(durations))]
+        history = build_history(dict(zip(collection, durations)))
+
+        plan = plan_schedule(collection, history, workers=3)
+
+        assert_every_test_planned_once(plan, len(collection))
+        loads = get_loads(plan, durations)
+        # Разброс нагрузки после LPT не больше самого долгого теста
+        assert max(loads) - min(loads) <= max(durations)
+        assert max(loads) <= sum(durations) / 3 + max(durations)
+        # Каждый воркер выполняет самые долгие тесты первыми
+        for indices in plan:
+            costs = [durations[index] for index in indices]
+            assert costs == sorted(costs, reverse=True)
+
+    def test_expensive_shared_fixture_groups_tests(self):
+        collection = ["db_1", "db_2", "plain_1", "plain_2", "db_3", "plain_3"]
+        durations = [1.0, 1.0, 2.0, 2.0, 1.0, 2.0]
+        history = build_history(
+            dict(zip(collection, durations)),
+            fixtures={"database": FixtureCostSchema(scope="session", cost=0.5)},
+            test_fixtures={nodeid: ["database"] for nodeid in ["db_1", "db_2", "db_3"]},
+        )
+
+        plan = plan_schedule(collection, history, workers=2)
+
+        assert_every_test_planned_once(plan, len(collection))
+        # Группа (3.0 + 0.5) помещается в среднюю нагрузку (4.5) и выполняется на одном воркере
+        assert any({0, 1, 4} <= set(indices) for indices in plan)
+
+    @pytest.mark.parametrize("scope, cost", [("function", 1.0), ("session", 0.01)])
+    def test_cheap_or_function_fixture_does_not_group(self, scope: str, cost: float):
+        collection = ["test_1", "test_2", "test_3", "test_4"]
+        history = build_history(
+            {nodeid: 1.0 for nodeid in collection},
+            fixtures={"client": FixtureCostSchema(scope=scope, cost=cost)},
+            test_fixtures={nodeid: ["client"] for nodeid in collection},
+        )
+
+        plan = plan_schedule(collection, history, workers=2)
+
+        assert sorted(len(indices) for indices in plan) == [2, 2]
+
+    def test_large_group_is_split(self):
+        collection = [f"test_{index}" for index in range(8)]
+        history = build_history(
+            {nodeid: 1.0 for nodeid in collection},
+            fixtures={"database": FixtureCostSchema(scope="session", cost=0.5)},
+            test_fixtures={nodeid: ["database"] for nodeid in collection},
+        )
+
+        plan = plan_schedule(collection, history, workers=4)
+
+        assert_every_test_planned_once(plan, len(collection))
+        # Все тесты в одной группе заняли бы один воркер на 8.5 с; группа делится на 4 части
+        assert sorted(len(indices) for indices in plan) == [2, 2, 2, 2]
+
+
+@pytest.mark.unit
+class TestDurationRecorder:
+    def test_merge_and_update_history(self):
+        controller, worker = DurationRecorder(), DurationRecorder()
+        worker.record_phase("test_1", 0.5)
+        worker.record_phase("test_1", 1.5)
+        worker.record_test_fixtures("test_1", ["database"])
+        worker.record_fixture_setup("database", "session", 1.0)
+        worker.record_fixture_setup("database", "session", 0.5, setups=0)
+        controller.merge(worker.to_dict())
+
+        history = controller.update_history(
+            build_history({"test_1": 4.0, "test_2": 3.0})
+        )
+
+        # Новое измерение сглаживается с историей, тест без измерения сохраняется
+        assert history.tests["test_1"].duration == pytest.approx(3.0)
+        assert history.tests["test_1"].fixtures == ["database"]
+        assert history.tests["test_2"].duration == 3.0
+        assert history.fixtures["database"].cost == pytest.approx(1.5)
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from clients.users.users_schema import (
+    CreateUserRequestSchema,
+    CreateUserResponseSchema,
+    UserSchema,
+)
+from tools import factory as factory_module
+from tools.factory import EntityFactory, SeedPlanSchema
+
+
+class FakePublicUsersClient:
+    async def create_user(
+        self, request: CreateUserRequestSchema
+    ) -> CreateUserResponseSchema:
+        return CreateUserResponseSchema(
+            user=UserSchema(
+                id="user-id",
+                email=request.email,
+                last_name=request.last_name,
+                first_name=request.first_name,
+                middle_name=request.middle_name,
+            )
+        )
+
+
+@pytest.mark.unit
+class TestEntityFactorySeed:
+    def test_seed_creates_every_planned_user(self, monkeypatch: pytest.MonkeyPatch):
+        async def seed_user(plan: SeedPlanSchema) -> str:
+            await asyncio.sleep(0)
+            return "user"
+
+        factory = EntityFactory(concurrency=3, on_progress=None)
+        monkeypatch.setattr(factory, "_seed_user", seed_user)
+
+        users = asyncio.run(factory.seed(SeedPlanSchema(users=10)))
+
+        assert users == ["user"] * 10
+
+    def test_seed_propagates_worker_error(self, monkeypatch: pytest.MonkeyPatch):
+        async def seed_user(plan: SeedPlanSchema) -> None:
+            raise ConnectionError("backend is down")
+
+        # Пользователей больше, чем воркеров и мест в очереди: producer блокируется на put
+        factory = EntityFactory(concurrency=2, on_progress=None)
+        monkeypatch.setattr(factory, "_seed_user", seed_user)
+
+        with pytest.raises(ConnectionError, match="backend is down"):
+            asyncio.run(asyncio.wait_for(factory.seed(SeedPlanSchema(users=100)), 5))
+
+    def test_logins_once_per_user_within_concurrency(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        active, peak, logins = 0, 0, []
+
+        async def get_user_clients(user) -> str:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            logins.append(user.email)
+            return "clients"
+
+        async def seed_course(plan, clients, user) -> str:
+            assert clients == "clients"
+            return "course"
+
+        factory = EntityFactory(concurrency=2, on_progress=None)
+        monkeypatch.setattr(
+            factory_module, "get_async_public_users_client", FakePublicUsersClient
+        )
+        monkeypatch.setattr(factory_module, "get_user_clients", get_user_clients)
+        monkeypatch.setattr(factory, "_seed_course", seed_course)
+
+        users = asyncio.run(factory.seed(SeedPlanSchema(users=6, courses_per_user=3)))
+
+        assert [user.courses for user in users] == [["course"] * 3] * 6
+        assert len(logins) == len(set(logins)) == 6
+        assert peak <= 2
+        assert factory._progress.created["logins"] == 6
@@ -0,0 +1,61 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from tools.file_lock import FileLock
+
+
+def make_stale(path: Path, age: float = 1000) -> None:
+    path.write_text("0")
+    timestamp = time.time() - age
+    os.utime(path, (timestamp, timestamp))
+
+
+@pytest.mark.unit
+class TestFileLock:
+    def test_acquire_and_release(self, tmp_path: Path):
+        path = tmp_path / "file.lock"
+
+        with FileLock(path):
+            assert path.read_text() == str(os.getpid())
+
+        assert not path.exists()
+
+    def test_timeout_while_held(self, tmp_path: Path):
+        path = tmp_path / "file.lock"
+
+        with FileLock(path):
+            with pytest.raises(TimeoutError):
+                FileLock(path, timeout=0.05).acquire()
+
+    def test_stale_lock_is_removed(self, tmp_path: Path):
+        path = tmp_path / "file.lock"
+        make_stale(path)
+
+        with FileLock(path, timeout=1, stale_after=60):
+            assert path.read_text() == str(os.getpid())
+
+    def test_stale_lock_is_removed_only_once(self, tmp_path: Path):
+        path = tmp_path / "file.lock"
+        make_stale(path)
+        # Оба процесса увидели устаревший файл, но первый успел удалить его и захватить блокировку
+        stale = path.stat()
+        first, second = FileLock(path, stale_after=60), FileLock(path, stale_after=60)
+        first.acquire()
+
+        second._break(stale)
+
+        assert path.exists()
+        with pytest.raises(TimeoutError):
+            FileLock(path, timeout=0.05, stale_after=60).acquire()
+        first.release()
+
+    def test_abandoned_break_lock_is_removed(self, tmp_path: Path):
+        path = tmp_path / "file.lock"
+        make_stale(path)
+        make_stale(tmp_path / "file.lock.break")
+
+        with FileLock(path, timeout=1, stale_after=60):
+            assert not (tmp_path / "file.lock.break").exists()
@@ -0,0 +1,42 @@
+import pytest
+
+from tools.latency import LatencyHistogram
+
+# Погрешность, обещанная в комментарии к SUB_BUCKET_BITS
+MAX_RELATIVE_ERROR = 0.01
+
+
+def get_sample_values() -> list[int]:
+    values = list(range(1, 50_000))
+    # Окрестности степеней двойки — границы, где меняется ширина интервалов
+    for power in range(16, 41):
+        values.extend(range((1 << power) - 300, (1 << power) + 300))
+    return values
+
+
+@pytest.mark.unit
+class TestLatencyHistogram:
+    def test_bucket_round_trip_error(self):
+        for value in get_sample_values():
+            upper = LatencyHistogram.get_bucket_upper_value(
+                LatencyHistogram.get_bucket(value)
+            )
+            assert value <= upper
+            assert (upper - value) / value < MAX_RELATIVE_ERROR, value
+
+    def test_buckets_are_monotonic(self):
+        buckets = [LatencyHistogram.get_bucket(value) for value in get_sample_values()]
+        assert buckets == sorted(buckets)
+
+    def test_percentile_after_merge(self):
+        first, second = LatencyHistogram(), LatencyHistogram()
+        for millisecond in range(1, 51):
+            first.record(millisecond / 1000)
+        for millisecond in range(51, 101):
+            second.record(millisecond / 1000)
+
+        first.merge(LatencyHistogram.from_dict(second.to_dict()))
+
+        assert first.total == 100
+        assert first.percentile(50) == pytest.approx(0.05, rel=MAX_RELATIVE_ERROR)
+        assert first.percentile(99) == pytest.approx(0.099, rel=MAX_RELATIVE_ERROR)
@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+from httpx import ConnectError
+
+from tools.load.runner import LoadRunner, StageSchema
+from tools.load.scenarios import SCENARIOS
+
+
+async def broken_scenario(context) -> None:
+    raise KeyError("course")
+
+
+async def unreachable_scenario(context) -> None:
+    raise ConnectError("connection refused")
+
+
+@pytest.mark.unit
+class TestLoadRunner:
+    def test_zero_rate_stages_are_rejected(self):
+        with pytest.raises(ValueError):
+            LoadRunner(
+                scenarios={},
+                stages=[StageSchema(duration=1, rate=0)],
+                concurrency=1,
+            )
+
+    def test_negative_rate_is_rejected(self):
+        with pytest.raises(ValueError):
+            StageSchema(duration=1, rate=-1)
+
+    def test_scenario_errors_are_counted(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setitem(SCENARIOS, "broken", broken_scenario)
+        monkeypatch.setitem(SCENARIOS, "unreachable", unreachable_scenario)
+        runner = LoadRunner(
+            scenarios={"broken": 1, "unreachable": 1},
+            stages=[
+                StageSchema(duration=0.01, rate=500),
+                StageSchema(duration=0.2, rate=500),
+            ],
+            concurrency=10,
+        )
+
+        stats = asyncio.run(runner.run(context=None))
+
+        # Ошибки запросов учитываются через request_listeners, а не как ошибки сценария
+        assert list(stats.scenario_errors) == ["broken_scenario: KeyError"]
+        assert stats.scenario_errors["broken_scenario: KeyError"] > 0
+        assert "scenario error broken_scenario: KeyError" in stats.report()
@@ -0,0 +1,71 @@
+import pytest
+from _pytest.config import Config
+
+from plugins.performance import PerformancePlugin
+from tools.baselines import RunMeasurementSchema
+from tools.significance import robust_upper_limit
+
+BASELINE_DURATIONS = [1.0, 1.02, 0.98, 1.01, 0.99, 1.03, 0.97, 1.0, 1.02, 0.98]
+
+
+@pytest.fixture
+def plugin(pytestconfig: Config) -> PerformancePlugin:
+    plugin = PerformancePlugin(pytestconfig)
+    plugin.revision = "current"
+    return plugin
+
+
+def build_history(durations: list[float], revision: str = "previous") -> list:
+    return [
+        RunMeasurementSchema(revision=revision, duration=value) for value in durations
+    ]
+
+
+@pytest.mark.unit
+class TestFindRegression:
+    def test_single_duration_regression_is_reported(self, plugin: PerformancePlugin):
+        current = RunMeasurementSchema(revision="current", duration=1.5)
+
+        regression = plugin.find_regression(
+            "test", current, build_history(BASELINE_DURATIONS)
+        )
+
+        assert regression is not None
+        assert regression.metric == "duration"
+        assert regression.p_value is None
+        assert regression.limit == pytest.approx(
+            robust_upper_limit(BASELINE_DURATIONS, 3.0)
+        )
+
+    def test_duration_within_limit_is_ignored(self, plugin: PerformancePlugin):
+        current = RunMeasurementSchema(revision="current", duration=1.03)
+
+        assert (
+            plugin.find_regression("test", current, build_history(BASELINE_DURATIONS))
+            is None
+        )
+
+    def test_current_revision_is_excluded_from_baseline(
+        self, plugin: PerformancePlugin
+    ):
+        current = RunMeasurementSchema(revision="current", duration=1.5)
+        history = build_history(BASELINE_DURATIONS, revision="current")
+
+        assert plugin.find_regression("test", current, history) is None
+
+    def test_api_latency_regression_uses_u_test(self, plugin: PerformancePlugin):
+        current = RunMeasurementSchema(
+            revision="current", duration=1.0, api_latencies=[0.2] * 10
+        )
+        history = [
+            RunMeasurementSchema(
+                revision="previous", duration=1.0, api_latencies=[0.1] * 10
+            )
+            for _ in range(3)
+        ]
+
+        regression = plugin.find_regression("test", current, history)
+
+        assert regression is not None
+        assert regression.metric == "api latency"
+        assert regression.p_value < plugin.alpha
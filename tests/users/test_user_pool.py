@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+
+from clients.authentication.authentication_schema import LoginRequestSchema
+from clients.authentication.token_cache import get_token_cache
+from fixtures.users import UserPool, create_users
+
+
+@pytest.mark.users
+@pytest.mark.regression
+class TestCreateUsers:
+    def test_create_users_inside_event_loop(self):
+        # Пул должен создаваться и из асинхронного кода, где asyncio.run недоступен
+        async def create() -> UserPool:
+            return UserPool(users=create_users(2))
+
+        pool = asyncio.run(create())
+
+        users = [pool.lease(), pool.lease()]
+        assert all(users)
+        assert users[0].email != users[1].email
+        assert pool.lease() is None
+        # Токены получены заранее и уже лежат в кеше
+        for user in users:
+            login = LoginRequestSchema(email=user.email, password=user.password)
+            assert get_token_cache()._get_path(login).exists()
+
+    def test_release_returns_user_to_pool(self, user_pool: UserPool):
+        user = user_pool.lease()
+        assert user is not None
+
+        user_pool.release(user)
+
+        assert user_pool.users[-1] is user
@@ -8,16 +8,22 @@ from clients.users.users_schema import (
     CreateUserRequestSchema,
     CreateUserResponseSchema,
     GetUserResponseSchema,
+    UpdateUserRequestSchema,
+    UpdateUserResponseSchema,
 )
 from fixtures.users import UserFixture
 from tools.assertions.base import assert_status_code
-from tools.assertions.schema import validate_json_schema
-from tools.assertions.users import assert_create_user_response, assert_get_user_response
+from tools.assertions.users import (
+    assert_create_user_response,
+    assert_get_user_response,
+    assert_update_user_response,
+)
 from tools.fakers import fake
 
 
 @pytest.mark.users  # Добавили маркировку users
 @pytest.mark.regression  # Добавили маркировку regression
+@pytest.mark.shared_setup("user")
 class TestUser:
     @pytest.mark.parametrize("domain", ["mail.ru", "gmail.com", "example.com"])
     def test_create_user(self, public_users_client: PublicUsersClient, domain: str):
@@ -26,8 +32,11 @@ class TestUser:
         # Отправляем запрос на создание пользователя
         response = public_users_client.create_user_api(request)
         # Инициализируем модель ответа на основе полученного JSON в ответе
-        # Также благодаря встроенной валидации в Pydantic дополнительно убеждаемся, что ответ корректный
-        response_data = CreateUserResponseSchema.model_validate_json(response.text)
+        # Также благодаря встроенной валидации в Pydantic и JSON-схеме дополнительно убеждаемся,
+        # что ответ корректный. Тело ответа декодируется только один раз
+        response_data, _ = public_users_client.parse_response(
+            response, CreateUserResponseSchema
+        )
 
         # Проверяем статус-код ответа
         assert_status_code(response.status_code, HTTPStatus.OK)
@@ -35,8 +44,6 @@ class TestUser:
         # Проверяем, что данные ответа совпадают с данными запроса
         assert_create_user_response(request, response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
-
     def test_get_user_me(
         self,
         function_user: UserFixture,  # Используем фикстуру для создания пользователя
@@ -44,11 +51,51 @@ class TestUser:
     ):
         response = private_users_client.get_user_me_api()
 
-        response_data = GetUserResponseSchema.model_validate_json(response.text)
+        response_data, _ = private_users_client.parse_response(
+            response, GetUserResponseSchema
+        )
+
+        assert_status_code(response.status_code, HTTPStatus.OK)
+        assert_get_user_response(
+            create_user_response=function_user.response, get_user_response=response_data
+        )
+
+
+# Тесты без shared_setup получают пользователя из пула или нового пользователя (fresh_user)
+@pytest.mark.users
+@pytest.mark.regression
+class TestUserPool:
+    def test_get_user(
+        self,
+        function_user: UserFixture,  # Пользователь из пула user_pool
+        private_users_client: PrivateUsersClient,
+    ):
+        response = private_users_client.get_user_api(function_user.response.user.id)
+
+        response_data, _ = private_users_client.parse_response(
+            response, GetUserResponseSchema
+        )
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_get_user_response(
             create_user_response=function_user.response, get_user_response=response_data
         )
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+    # Тест меняет email, поэтому пользователь из пула ему не подходит
+    @pytest.mark.fresh_user
+    def test_update_user(
+        self,
+        function_user: UserFixture,
+        private_users_client: PrivateUsersClient,
+    ):
+        request = UpdateUserRequestSchema()
+        response = private_users_client.update_user_api(
+            function_user.response.user.id, request
+        )
+
+        response_data, _ = private_users_client.parse_response(
+            response, UpdateUserResponseSchema
+        )
+
+        assert_status_code(response.status_code, HTTPStatus.OK)
+        assert_update_user_response(request, response_data)
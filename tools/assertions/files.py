@@ -1,11 +1,18 @@
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+
 from clients.files.files_schema import (
     CreateFileResponseSchema,
     CreateFileRequestSchema,
     FileSchema,
     GetFileResponseSchema,
 )
+from clients.public_http_builder import get_public_http_client
+from config import settings
 from tools.assertions.base import assert_equal
-import httpx
+
+# Сколько файлов проверяется одновременно в assert_files_are_accessible
+FILE_CHECK_WORKERS = 16
 
 
 def assert_create_file_response(
@@ -20,7 +27,7 @@ def assert_create_file_response(
     """
     # Формируем ожидаемую ссылку на загруженный файл
     expected_url = (
-        f"http://localhost:8000/static/{request.directory}/{request.filename}"
+        f"{settings.http_client.client_url}/static/{request.directory}/{request.filename}"
     )
 
     assert_equal(str(response.file.url), expected_url, "url")
@@ -28,6 +35,32 @@ def assert_create_file_response(
     assert_equal(response.file.directory, request.directory, "directory")
 
 
+def get_file_status(url: str) -> int:
+    """
+    Возвращает HTTP-статус файла, не скачивая его содержимое.
+
+    Запрос выполняется через общий пул соединений. Сначала отправляется HEAD,
+    а если сервер его не поддерживает — GET первого байта (Range: bytes=0-0),
+    тело которого не читается.
+
+    :param url: Ссылка на файл.
+    :return: Статус ответа; 206 Partial Content приводится к 200 OK.
+    """
+    client = get_public_http_client()
+
+    response = client.head(url)
+    if response.status_code not in (
+        HTTPStatus.METHOD_NOT_ALLOWED,
+        HTTPStatus.NOT_IMPLEMENTED,
+    ):
+        return response.status_code
+
+    with client.stream("GET", url, headers={"Range": "bytes=0-0"}) as response:
+        if response.status_code == HTTPStatus.PARTIAL_CONTENT:
+            return HTTPStatus.OK
+        return response.status_code
+
+
 def assert_file_is_accessible(url: str):
     """
     Проверяет, что файл доступен по указанному URL.
@@ -35,8 +68,26 @@ def assert_file_is_accessible(url: str):
     :param url: Ссылка на файл.
     :raises AssertionError: Если файл не доступен.
     """
-    response = httpx.get(url)
-    assert response.status_code == 200, f"Файл недоступен по URL: {url}"
+    assert get_file_status(url) == HTTPStatus.OK, f"Файл недоступен по URL: {url}"
+
+
+def assert_files_are_accessible(urls: list[str]):
+    """
+    Параллельно проверяет, что все файлы доступны по указанным URL.
+
+    :param urls: Ссылки на файлы.
+    :raises AssertionError: Если хотя бы один файл не доступен (в сообщении перечислены все).
+    """
+    if not urls:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(FILE_CHECK_WORKERS, len(urls))) as executor:
+        statuses = list(executor.map(get_file_status, urls))
+
+    unavailable = [
+        url for url, status in zip(urls, statuses) if status != HTTPStatus.OK
+    ]
+    assert not unavailable, f"Файлы недоступны по URL: {', '.join(unavailable)}"
 
 
 def assert_file(actual: FileSchema, expected: FileSchema):
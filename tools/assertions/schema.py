@@ -1,19 +1,52 @@
+import json
+from functools import lru_cache
 from typing import Any
 
-from jsonschema import validate
+from jsonschema.exceptions import best_match
 from jsonschema.validators import Draft202012Validator
+from pydantic import BaseModel
 
 
-def validate_json_schema(instance: Any, schema: dict) -> None:
+@lru_cache(maxsize=None)
+def get_schema_validator(model: type[BaseModel]) -> Draft202012Validator:
+    """
+    Функция один раз на процесс строит JSON-схему модели и скомпилированный валидатор для неё.
+
+    :param model: Pydantic-модель, описывающая ожидаемый JSON.
+    :return: Готовый к использованию валидатор с проверкой форматов.
+    """
+    return compile_schema_validator(json.dumps(model.model_json_schema()))
+
+
+@lru_cache(maxsize=None)
+def compile_schema_validator(schema: str) -> Draft202012Validator:
+    """
+    Функция проверяет корректность JSON-схемы и создаёт для неё валидатор.
+
+    :param schema: JSON-схема в виде строки (строка используется как ключ кеша).
+    :return: Готовый к использованию валидатор с проверкой форматов.
+    """
+    schema_data = json.loads(schema)
+    Draft202012Validator.check_schema(schema_data)
+    return Draft202012Validator(
+        schema_data, format_checker=Draft202012Validator.FORMAT_CHECKER
+    )
+
+
+def validate_json_schema(instance: Any, schema: dict | type[BaseModel]) -> None:
     """
     Проверяет, соответствует ли JSON-объект (instance) заданной JSON-схеме (schema).
 
     :param instance: JSON-данные, которые нужно проверить.
-    :param schema: Ожидаемая JSON-schema.
+    :param schema: Ожидаемая JSON-schema или pydantic-модель, из которой она строится.
     :raises jsonschema.exceptions.ValidationError: Если instance не соответствует schema.
     """
-    validate(
-        schema=schema,
-        instance=instance,
-        format_checker=Draft202012Validator.FORMAT_CHECKER,
-    )
+    if isinstance(schema, dict):
+        validator = compile_schema_validator(json.dumps(schema, sort_keys=True))
+    else:
+        validator = get_schema_validator(schema)
+
+    # Как и jsonschema.validate, выбираем наиболее релевантную ошибку
+    error = best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
@@ -2,6 +2,8 @@ from clients.users.users_schema import (
     CreateUserRequestSchema,
     CreateUserResponseSchema,
     GetUserResponseSchema,
+    UpdateUserRequestSchema,
+    UpdateUserResponseSchema,
     UserSchema,
 )
 from tools.assertions.base import assert_equal
@@ -23,6 +25,22 @@ def assert_create_user_response(
     assert_equal(response.user.middle_name, request.middle_name, "middle_name")
 
 
+def assert_update_user_response(
+    request: UpdateUserRequestSchema, response: UpdateUserResponseSchema
+):
+    """
+    Проверяет, что ответ на обновление пользователя соответствует запросу.
+
+    :param request: Исходный запрос на обновление пользователя.
+    :param response: Ответ API с данными пользователя.
+    :raises AssertionError: Если хотя бы одно поле не совпадает.
+    """
+    assert_equal(response.user.email, request.email, "email")
+    assert_equal(response.user.last_name, request.last_name, "last_name")
+    assert_equal(response.user.first_name, request.first_name, "first_name")
+    assert_equal(response.user.middle_name, request.middle_name, "middle_name")
+
+
 def assert_get_user_response(
     get_user_response: GetUserResponseSchema,
     create_user_response: CreateUserResponseSchema,
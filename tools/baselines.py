@@ -0,0 +1,94 @@
+import json
+import os
+import subprocess
+import time
+from functools import lru_cache
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from tools.file_lock import FileLock
+
+
+class RunMeasurementSchema(BaseModel):
+    """
+    Описание структуры измерений одного теста в одном прогоне.
+    """
+
+    revision: str
+    timestamp: float = Field(default_factory=time.time)
+    duration: float
+    api_latencies: list[float] = Field(default_factory=list)
+
+
+@lru_cache(maxsize=None)
+def get_git_revision() -> str:
+    """
+    Функция возвращает хеш текущего коммита.
+
+    :return: Хеш коммита или "unknown", если git недоступен.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        )
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+class BaselineStore:
+    """
+    Локальное файловое хранилище измерений производительности тестов.
+
+    Измерения хранятся по node id теста, каждое помечено git-ревизией.
+    Для каждого теста хранится не более history последних прогонов.
+    """
+
+    def __init__(self, path: Path, history: int = 20):
+        """
+        :param path: Путь к JSON-файлу хранилища.
+        :param history: Сколько последних прогонов хранить для каждого теста.
+        """
+        self.path = path
+        self.history = history
+
+    def load(self) -> dict[str, list[RunMeasurementSchema]]:
+        """
+        Загружает все измерения.
+
+        :return: Словарь {node id: измерения от старых к новым}.
+        """
+        try:
+            data = json.loads(self.path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+        return {
+            nodeid: [RunMeasurementSchema.model_validate(run) for run in runs]
+            for nodeid, runs in data.items()
+        }
+
+    def append(self, measurements: dict[str, RunMeasurementSchema]) -> None:
+        """
+        Добавляет измерения текущего прогона, отбрасывая самые старые.
+
+        :param measurements: Словарь {node id: измерение}.
+        """
+        with FileLock(self.path.with_name(f"{self.path.name}.lock")):
+            data = self.load()
+            for nodeid, measurement in measurements.items():
+                runs = data.setdefault(nodeid, [])
+                runs.append(measurement)
+                del runs[: -self.history]
+
+            temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            temp_path.write_text(
+                json.dumps(
+                    {
+                        nodeid: [run.model_dump() for run in runs]
+                        for nodeid, runs in data.items()
+                    }
+                )
+            )
+            os.replace(temp_path, self.path)
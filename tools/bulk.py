@@ -0,0 +1,100 @@
+import copy
+import random
+from typing import Any, Callable, Self
+
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
+
+from tools.fakers import Fake
+
+
+def get_column_factory(field: FieldInfo) -> Callable[[int], list[Any]]:
+    """
+    Функция подбирает для поля модели генератор сразу нескольких значений.
+
+    Если default_factory поля — метод Fake (например, fake.email), используется его
+    пакетный вариант (fake.emails). Иначе default_factory вызывается для каждого значения,
+    а статическое значение по умолчанию повторяется (см. repeat).
+
+    :param field: Описание поля pydantic-модели.
+    :return: Функция, которая по количеству возвращает список значений поля.
+    """
+    factory = field.default_factory
+    if factory is None:
+        if field.default is PydanticUndefined:
+            raise TypeError("Для обязательного поля без значения по умолчанию нужен override")
+        return lambda count: repeat(field.default, count)
+
+    if isinstance(owner := getattr(factory, "__self__", None), Fake):
+        batch = getattr(owner, f"{factory.__name__}s", None)
+        if callable(batch):
+            return batch
+
+    return lambda count: [factory() for _ in range(count)]
+
+
+def repeat(value: Any, count: int) -> list[Any]:
+    """
+    Функция повторяет значение для count экземпляров.
+
+    Как и pydantic для значений по умолчанию, изменяемые (нехешируемые) значения
+    копируются, чтобы экземпляры не делили один и тот же список или словарь.
+
+    :param value: Значение поля.
+    :param count: Количество экземпляров.
+    :return: Список значений.
+    """
+    try:
+        hash(value)
+    except TypeError:
+        return [copy.deepcopy(value) for _ in range(count)]
+
+    return [value] * count
+
+
+class BulkBuildMixin:
+    """
+    Примесь для pydantic-моделей запросов, добавляющая быстрое массовое создание.
+    """
+
+    @classmethod
+    def build_many(
+        cls: type[Self], count: int, validate_sample: int = 0, **overrides: Any
+    ) -> list[Self]:
+        """
+        Создаёт count экземпляров модели без валидации каждого из них.
+
+        Значения полей генерируются колонками пакетными методами Fake, а экземпляры
+        собираются через model_construct. Поэтому данные считаются доверенными:
+        при необходимости часть экземпляров можно проверить полной валидацией.
+
+        :param count: Количество экземпляров.
+        :param validate_sample: Сколько случайных экземпляров проверить через model_validate.
+        :param overrides: Значения полей (по имени поля), одинаковые для всех экземпляров.
+            Изменяемые значения копируются для каждого экземпляра.
+        :return: Список экземпляров модели.
+        :raises TypeError: Если в overrides передано неизвестное поле.
+        :raises pydantic.ValidationError: Если проверенный экземпляр не проходит валидацию.
+        """
+        if unknown := set(overrides) - set(cls.model_fields):
+            raise TypeError(f"Неизвестные поля модели: {', '.join(sorted(unknown))}")
+
+        columns = {
+            name: (
+                repeat(overrides[name], count)
+                if name in overrides
+                else get_column_factory(field)(count)
+            )
+            for name, field in cls.model_fields.items()
+        }
+        # Значения переданы для всех полей, поэтому model_construct не вызывает default_factory
+        fields_set = set(overrides)
+        instances = [
+            cls.model_construct(_fields_set=fields_set, **dict(zip(columns, values)))
+            for values in zip(*columns.values())
+        ]
+
+        for instance in random.sample(instances, min(validate_sample, count)):
+            cls.model_validate(instance.model_dump(by_alias=True))
+
+        return instances
@@ -0,0 +1,219 @@
+import heapq
+import math
+import statistics
+from collections import defaultdict
+
+from pydantic import BaseModel, Field
+
+# Ключ config.cache, под которым хранится история длительностей (.pytest_cache)
+DURATIONS_CACHE_KEY = "autotests/durations"
+# Вес нового измерения при сглаживании: длительности API-тестов шумят от запуска к запуску
+DURATION_SMOOTHING = 0.5
+# Длительность теста без истории, если оценить её по другим тестам не из чего
+DEFAULT_TEST_DURATION = 1.0
+# Фикстуры шире function дороже этого порога группируются на одном воркере, в секундах
+EXPENSIVE_FIXTURE_COST = 0.1
+
+
+class RecordedTestSchema(BaseModel):
+    """
+    Описание структуры истории теста.
+    """
+
+    # Сумма фаз setup, call и teardown, в секундах
+    duration: float
+    # Все фикстуры теста, включая транзитивные
+    fixtures: list[str] = Field(default_factory=list)
+
+
+class FixtureCostSchema(BaseModel):
+    """
+    Описание структуры истории фикстуры.
+    """
+
+    scope: str
+    # Среднее время одной настройки без учёта зависимостей, в секундах
+    cost: float
+
+
+class DurationHistorySchema(BaseModel):
+    """
+    Описание структуры истории длительностей тестов и стоимости фикстур.
+    """
+
+    tests: dict[str, RecordedTestSchema] = Field(default_factory=dict)
+    fixtures: dict[str, FixtureCostSchema] = Field(default_factory=dict)
+
+
+def smooth(previous: float | None, current: float) -> float:
+    if previous is None:
+        return current
+    return previous + DURATION_SMOOTHING * (current - previous)
+
+
+class DurationRecorder:
+    """
+    Собирает длительности тестов и время настройки фикстур за прогон.
+
+    Замеры делаются там, где выполняются тесты; под xdist контроллер объединяет
+    замеры воркеров через to_dict/merge.
+    """
+
+    def __init__(self):
+        self.durations: defaultdict[str, float] = defaultdict(float)
+        self.test_fixtures: dict[str, list[str]] = {}
+        # Имя фикстуры -> [скоуп, суммарное время, количество настроек]
+        self.fixture_costs: dict[str, list] = {}
+
+    def record_phase(self, nodeid: str, duration: float) -> None:
+        self.durations[nodeid] += duration
+
+    def record_test_fixtures(self, nodeid: str, fixtures: list[str]) -> None:
+        self.test_fixtures[nodeid] = fixtures
+
+    def record_fixture_setup(
+        self, name: str, scope: str, seconds: float, setups: int = 1
+    ) -> None:
+        # setups=0 добавляет время к уже учтённой настройке (ленивые группы shared_setup)
+        _, total, count = self.fixture_costs.get(name, (scope, 0.0, 0))
+        self.fixture_costs[name] = [scope, total + seconds, count + setups]
+
+    def to_dict(self) -> dict:
+        return {
+            "durations": dict(self.durations),
+            "tests": self.test_fixtures,
+            "fixtures": self.fixture_costs,
+        }
+
+    def merge(self, data: dict) -> None:
+        """
+        Добавляет замеры, полученные с воркера.
+
+        :param data: Результат DurationRecorder.to_dict() на воркере.
+        """
+        for nodeid, duration in data["durations"].items():
+            self.durations[nodeid] += duration
+        self.test_fixtures.update(data["tests"])
+        for name, (scope, total, count) in data["fixtures"].items():
+            _, own_total, own_count = self.fixture_costs.get(name, (scope, 0.0, 0))
+            self.fixture_costs[name] = [scope, own_total + total, own_count + count]
+
+    def update_history(self, history: DurationHistorySchema) -> DurationHistorySchema:
+        """
+        Обновляет историю замерами прогона; тесты, которые не запускались, сохраняются.
+
+        :param history: История предыдущих прогонов.
+        :return: Обновлённая история.
+        """
+        for nodeid, duration in self.durations.items():
+            previous = history.tests.get(nodeid)
+            history.tests[nodeid] = RecordedTestSchema(
+                duration=smooth(previous and previous.duration, duration),
+                fixtures=self.test_fixtures.get(
+                    nodeid, previous.fixtures if previous else []
+                ),
+            )
+
+        for name, (scope, total, count) in self.fixture_costs.items():
+            previous = history.fixtures.get(name)
+            history.fixtures[name] = FixtureCostSchema(
+                scope=scope, cost=smooth(previous and previous.cost, total / count)
+            )
+
+        return history
+
+
+def get_shared_setup_fixture(name: str) -> str:
+    """
+    Функция возвращает имя, под которым группа shared_setup хранится в истории как фикстура.
+
+    :param name: Название группы из маркера shared_setup.
+    """
+    return f"shared_setup[{name}]"
+
+
+def get_shared_fixture(
+    test: RecordedTestSchema | None, history: DurationHistorySchema
+) -> str | None:
+    """
+    Функция выбирает самую дорогую фикстуру теста со скоупом шире function.
+
+    :return: Имя фикстуры или None, если дорогих общих фикстур у теста нет.
+    """
+    if test is None:
+        return None
+
+    candidates = [
+        (fixture.cost, name)
+        for name in test.fixtures
+        if (fixture := history.fixtures.get(name))
+        and fixture.scope != "function"
+        and fixture.cost >= EXPENSIVE_FIXTURE_COST
+    ]
+    return max(candidates)[1] if candidates else None
+
+
+def split_group(indices: list[int], costs: list[float], chunks: int) -> list[list[int]]:
+    """
+    Функция делит тесты группы на части с близкой суммарной длительностью.
+
+    :return: Части с индексами в исходном порядке сбора тестов.
+    """
+    heap = [(0.0, chunk) for chunk in range(chunks)]
+    parts: list[list[int]] = [[] for _ in range(chunks)]
+    for index in sorted(indices, key=lambda index: -costs[index]):
+        load, chunk = heapq.heappop(heap)
+        parts[chunk].append(index)
+        heapq.heappush(heap, (load + costs[index], chunk))
+
+    return [sorted(part) for part in parts if part]
+
+
+def plan_schedule(
+    collection: list[str], history: DurationHistorySchema, workers: int
+) -> list[list[int]]:
+    """
+    Функция распределяет тесты по воркерам методом LPT (longest processing time first).
+
+    Тесты с общей дорогой фикстурой шире function объединяются в группу, чтобы
+    фикстура настраивалась на меньшем числе воркеров. Группы маркера shared_setup
+    записываются в историю как такие же фикстуры (get_shared_setup_fixture). Группа, которая не помещается
+    в среднюю нагрузку воркера, делится на части, и каждая часть учитывает стоимость
+    фикстуры заново. Затем группы и одиночные тесты по убыванию длительности отдаются
+    наименее загруженному воркеру. Тесты без истории получают медианную длительность.
+
+    :param collection: Идентификаторы тестов в порядке сбора.
+    :param history: История предыдущих прогонов.
+    :param workers: Количество воркеров.
+    :return: Для каждого воркера — индексы тестов в порядке выполнения, самые долгие первыми.
+    """
+    tests = [history.tests.get(nodeid) for nodeid in collection]
+    known = [test.duration for test in tests if test is not None]
+    default = statistics.median(known) if known else DEFAULT_TEST_DURATION
+    costs = [test.duration if test else default for test in tests]
+
+    groups: defaultdict[str, list[int]] = defaultdict(list)
+    units: list[tuple[float, list[int]]] = []
+    for index, test in enumerate(tests):
+        if fixture := get_shared_fixture(test, history):
+            groups[fixture].append(index)
+        else:
+            units.append((costs[index], [index]))
+
+    # Средняя нагрузка воркера; минимум защищает от деления на ноль при нулевой истории
+    target = max(sum(costs) / workers, 1e-6)
+    for fixture, indices in groups.items():
+        fixture_cost = history.fixtures[fixture].cost
+        group_cost = sum(costs[index] for index in indices) + fixture_cost
+        chunks = min(workers, len(indices), max(1, math.ceil(group_cost / target)))
+        for part in split_group(indices, costs, chunks):
+            units.append((sum(costs[index] for index in part) + fixture_cost, part))
+
+    plan: list[list[int]] = [[] for _ in range(workers)]
+    heap = [(0.0, worker) for worker in range(workers)]
+    for cost, indices in sorted(units, key=lambda unit: -unit[0]):
+        load, worker = heapq.heappop(heap)
+        plan[worker].extend(indices)
+        heapq.heappush(heap, (load + cost, worker))
+
+    return plan
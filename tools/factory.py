@@ -0,0 +1,301 @@
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, NamedTuple, TypeVar
+
+from pydantic import BaseModel, Field
+
+from clients.courses.courses_client import (
+    AsyncCoursesClient,
+    get_async_courses_client,
+)
+from clients.courses.courses_schema import (
+    CreateCourseRequestSchema,
+    CreateCourseResponseSchema,
+)
+from clients.exercises.exercises_client import (
+    AsyncExercisesClient,
+    get_async_exercises_client,
+)
+from clients.exercises.exercises_schema import (
+    CreateExerciseRequestSchema,
+    CreateExerciseResponseSchema,
+)
+from clients.files.files_client import AsyncFilesClient, get_async_files_client
+from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema
+from clients.http_transport import close_async_http_transports
+from clients.private_http_builder import AuthenticationUserSchema
+from clients.users.public_users_client import get_async_public_users_client
+from clients.users.users_schema import (
+    CreateUserRequestSchema,
+    CreateUserResponseSchema,
+)
+
+T = TypeVar("T")
+
+
+class SeedPlanSchema(BaseModel):
+    """
+    Описание структуры плана наполнения стенда данными.
+    """
+
+    users: int = 1
+    courses_per_user: int = 1
+    exercises_per_course: int = 1
+    upload_file: str = "./testdata/files/image.png"
+
+
+class SeededCourseSchema(BaseModel):
+    """
+    Описание структуры созданного курса вместе с его превью и упражнениями.
+    """
+
+    file: CreateFileResponseSchema
+    course: CreateCourseResponseSchema
+    exercises: list[CreateExerciseResponseSchema] = Field(default_factory=list)
+
+
+class SeededUserSchema(BaseModel):
+    """
+    Описание структуры созданного пользователя вместе с его курсами.
+    """
+
+    request: CreateUserRequestSchema
+    response: CreateUserResponseSchema
+    courses: list[SeededCourseSchema] = Field(default_factory=list)
+
+
+class UserClients(NamedTuple):
+    """
+    Приватные клиенты пользователя, через которые создаются его курсы.
+    """
+
+    files: AsyncFilesClient
+    courses: AsyncCoursesClient
+    exercises: AsyncExercisesClient
+
+
+async def get_user_clients(user: AuthenticationUserSchema) -> UserClients:
+    """
+    Функция создаёт приватные клиенты пользователя.
+
+    Логин выполняется при создании первого клиента, остальные получают
+    уже закешированный HTTP-клиент пользователя.
+
+    :param user: Учётные данные пользователя.
+    :return: Клиенты файлов, курсов и упражнений.
+    """
+    return UserClients(
+        files=await get_async_files_client(user),
+        courses=await get_async_courses_client(user),
+        exercises=await get_async_exercises_client(user),
+    )
+
+
+class SeedProgress:
+    """
+    Счётчики созданных сущностей для отчёта о прогрессе.
+    """
+
+    def __init__(self, plan: SeedPlanSchema):
+        """
+        :param plan: План наполнения, из которого рассчитываются ожидаемые количества.
+        """
+        courses = plan.users * plan.courses_per_user
+        self.expected = {
+            "users": plan.users,
+            # Пользователи без курсов не логинятся
+            "logins": plan.users if plan.courses_per_user else 0,
+            "files": courses,
+            "courses": courses,
+            "exercises": courses * plan.exercises_per_course,
+        }
+        self.created = dict.fromkeys(self.expected, 0)
+        self.started_at = time.monotonic()
+
+    def __str__(self) -> str:
+        counters = " | ".join(
+            f"{name} {self.created[name]}/{expected}"
+            for name, expected in self.expected.items()
+        )
+        return f"{counters} | {time.monotonic() - self.started_at:.1f}s"
+
+
+def print_progress(progress: SeedProgress) -> None:
+    """
+    Функция выводит прогресс наполнения в консоль одной обновляемой строкой.
+
+    :param progress: Текущий прогресс.
+    """
+    print(f"\r{progress}", end="", flush=True)
+
+
+class EntityFactory:
+    """
+    Фабрика для массового создания пользователей, файлов, курсов и упражнений.
+
+    Одновременно выполняется не более concurrency запросов. Пользователи подаются
+    в обработку через ограниченную очередь, поэтому при большом плане в памяти
+    не накапливаются тысячи ожидающих задач.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 50,
+        on_progress: Callable[[SeedProgress], None] | None = print_progress,
+        progress_interval: float = 1,
+    ):
+        """
+        :param concurrency: Максимальное количество одновременных запросов.
+        :param on_progress: Функция, которая получает прогресс. None отключает отчёт.
+        :param progress_interval: Как часто (в секундах) сообщать о прогрессе.
+        """
+        self.concurrency = concurrency
+        self.on_progress = on_progress
+        self.progress_interval = progress_interval
+        self._semaphore: asyncio.Semaphore | None = None
+        self._progress: SeedProgress | None = None
+
+    async def seed(self, plan: SeedPlanSchema) -> list[SeededUserSchema]:
+        """
+        Создаёт данные по плану.
+
+        :param plan: План наполнения.
+        :return: Созданные пользователи со всеми вложенными сущностями.
+        """
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._progress = SeedProgress(plan)
+
+        queue: asyncio.Queue[int | None] = asyncio.Queue(maxsize=self.concurrency)
+        users: list[SeededUserSchema] = []
+
+        async def produce() -> None:
+            for index in range(plan.users):
+                # put блокируется, пока воркеры не разберут очередь — это и есть backpressure
+                await queue.put(index)
+            for _ in range(self.concurrency):
+                await queue.put(None)
+
+        async def worker() -> None:
+            while await queue.get() is not None:
+                users.append(await self._seed_user(plan))
+
+        tasks = [asyncio.create_task(produce())]
+        tasks.extend(asyncio.create_task(worker()) for _ in range(self.concurrency))
+        reporter = asyncio.create_task(self._report())
+        try:
+            # Первая ошибка воркера сразу завершает gather. Иначе, если упадут все воркеры,
+            # producer навсегда заблокируется на полной очереди
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            reporter.cancel()
+            self._notify()
+
+        return users
+
+    async def _seed_user(self, plan: SeedPlanSchema) -> SeededUserSchema:
+        request = CreateUserRequestSchema()
+        response = await self._call(
+            "users", get_async_public_users_client().create_user(request)
+        )
+        user = SeededUserSchema(request=request, response=response)
+        if not plan.courses_per_user:
+            return user
+
+        # Логин (блокирующий кеш токенов в отдельном потоке) выполняется один раз
+        # на пользователя и, как и остальные запросы, ограничен concurrency
+        clients = await self._call(
+            "logins",
+            get_user_clients(
+                AuthenticationUserSchema(email=request.email, password=request.password)
+            ),
+        )
+        user.courses = list(
+            await asyncio.gather(
+                *(
+                    self._seed_course(plan, clients, response)
+                    for _ in range(plan.courses_per_user)
+                )
+            )
+        )
+        return user
+
+    async def _seed_course(
+        self,
+        plan: SeedPlanSchema,
+        clients: UserClients,
+        user: CreateUserResponseSchema,
+    ) -> SeededCourseSchema:
+        file = await self._call(
+            "files",
+            clients.files.create_file(
+                CreateFileRequestSchema(upload_file=plan.upload_file)
+            ),
+        )
+        course = await self._call(
+            "courses",
+            clients.courses.create_course(
+                CreateCourseRequestSchema(
+                    preview_file_id=file.file.id, created_by_user_id=user.user.id
+                )
+            ),
+        )
+        exercises = await asyncio.gather(
+            *(
+                self._call("exercises", clients.exercises.create_exercise(request))
+                for request in CreateExerciseRequestSchema.build_many(
+                    plan.exercises_per_course, course_id=course.course.id
+                )
+            )
+        )
+        return SeededCourseSchema(file=file, course=course, exercises=list(exercises))
+
+    async def _call(self, entity: str, coroutine: Awaitable[T]) -> T:
+        async with self._semaphore:
+            result = await coroutine
+
+        self._progress.created[entity] += 1
+        return result
+
+    async def _report(self) -> None:
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            self._notify()
+
+    def _notify(self) -> None:
+        if self.on_progress:
+            self.on_progress(self._progress)
+
+
+async def seed(plan: SeedPlanSchema, concurrency: int = 50) -> list[SeededUserSchema]:
+    """
+    Функция наполняет стенд данными по плану и закрывает пул соединений по завершении.
+
+    :param plan: План наполнения.
+    :param concurrency: Максимальное количество одновременных запросов.
+    :return: Созданные пользователи со всеми вложенными сущностями.
+    """
+    try:
+        return await EntityFactory(concurrency=concurrency).seed(plan)
+    finally:
+        await close_async_http_transports()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Массовое создание тестовых данных")
+    parser.add_argument("--users", type=int, default=1)
+    parser.add_argument("--courses-per-user", type=int, default=1)
+    parser.add_argument("--exercises-per-course", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    seed_plan = SeedPlanSchema(
+        users=args.users,
+        courses_per_user=args.courses_per_user,
+        exercises_per_course=args.exercises_per_course,
+    )
+    asyncio.run(seed(seed_plan, concurrency=args.concurrency))
+    print()
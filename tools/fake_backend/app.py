@@ -0,0 +1,573 @@
+import json
+import mimetypes
+import re
+from email import policy
+from email.parser import BytesParser
+from functools import lru_cache
+from http import HTTPStatus
+from typing import Annotated, Any
+
+from httpx import Request, Response
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
+
+from clients.authentication.authentication_schema import (
+    LoginRequestSchema,
+    LoginResponseSchema,
+    RefreshRequestSchema,
+)
+from clients.courses.courses_schema import (
+    CreateCourseRequestSchema,
+    CreateCourseResponseSchema,
+    GetCoursesQuerySchema,
+    UpdateCourseRequestSchema,
+)
+from clients.exercises.exercises_schema import (
+    CreateExerciseRequestSchema,
+    CreateExerciseResponseSchema,
+    ExerciseSchema,
+    GetExerciseResponseSchema,
+    GetExercisesQuerySchema,
+    GetExercisesResponseSchema,
+    UpdateExerciseRequestSchema,
+    UpdateExerciseResponseSchema,
+)
+from clients.files.files_schema import (
+    CreateFileRequestSchema,
+    CreateFileResponseSchema,
+    FileSchema,
+    GetFileResponseSchema,
+)
+from clients.users.users_schema import (
+    CreateUserRequestSchema,
+    CreateUserResponseSchema,
+    GetUserResponseSchema,
+    UpdateUserRequestSchema,
+    UpdateUserResponseSchema,
+    UserSchema,
+)
+from tools.fake_backend.storage import (
+    FakeStorage,
+    StoredCourseSchema,
+    StoredFileSchema,
+    generate_id,
+)
+from tools.fake_backend.tokens import TokenSigner
+
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class HTTPError(Exception):
+    """
+    Ошибка обработки запроса, которая превращается в ответ {"detail": ...}.
+    """
+
+    def __init__(self, status_code: HTTPStatus, detail: Any = None):
+        self.status_code = status_code
+        self.detail = detail if detail is not None else status_code.phrase
+
+
+class Route:
+    """
+    Маршрут фейкового сервера: шаблон пути вида /api/v1/users/{user_id} и обработчик.
+    """
+
+    def __init__(self, method: str, template: str, handler: str, private: bool = True):
+        """
+        :param method: HTTP-метод.
+        :param template: Шаблон пути; параметр {path} может содержать "/".
+        :param handler: Имя метода FakeBackend, обрабатывающего запрос.
+        :param private: Требуется ли access-токен.
+        """
+        self.method = method
+        self.handler = handler
+        self.private = private
+        pattern = re.sub(
+            r"{(\w+)}",
+            lambda match: rf"(?P<{match[1]}>{'.+' if match[1] == 'path' else '[^/]+'})",
+            template,
+        )
+        self.pattern = re.compile(f"^{pattern}$")
+
+
+ROUTES = [
+    Route("POST", "/api/v1/users", "create_user", private=False),
+    Route("GET", "/api/v1/users/me", "get_user_me"),
+    Route("GET", "/api/v1/users/{user_id}", "get_user"),
+    Route("PATCH", "/api/v1/users/{user_id}", "update_user"),
+    Route("DELETE", "/api/v1/users/{user_id}", "delete_user"),
+    Route("POST", "/api/v1/authentication/login", "login", private=False),
+    Route("POST", "/api/v1/authentication/refresh", "refresh", private=False),
+    Route("POST", "/api/v1/files", "create_file"),
+    Route("GET", "/api/v1/files/{file_id}", "get_file"),
+    Route("DELETE", "/api/v1/files/{file_id}", "delete_file"),
+    Route("GET", "/api/v1/courses", "get_courses"),
+    Route("POST", "/api/v1/courses", "create_course"),
+    Route("GET", "/api/v1/courses/{course_id}", "get_course"),
+    Route("PATCH", "/api/v1/courses/{course_id}", "update_course"),
+    Route("DELETE", "/api/v1/courses/{course_id}", "delete_course"),
+    Route("GET", "/api/v1/exercises", "get_exercises"),
+    Route("POST", "/api/v1/exercises", "create_exercise"),
+    Route("GET", "/api/v1/exercises/{exercise_id}", "get_exercise"),
+    Route("PATCH", "/api/v1/exercises/{exercise_id}", "update_exercise"),
+    Route("DELETE", "/api/v1/exercises/{exercise_id}", "delete_exercise"),
+    Route("GET", "/static/{path}", "get_static", private=False),
+    Route("HEAD", "/static/{path}", "get_static", private=False),
+]
+
+
+def build_response(
+    model: BaseModel | dict, status_code: int = HTTPStatus.OK
+) -> Response:
+    if isinstance(model, BaseModel):
+        content = model.model_dump_json(by_alias=True).encode()
+    else:
+        content = json.dumps(model).encode()
+    return Response(
+        status_code, headers={"Content-Type": "application/json"}, content=content
+    )
+
+
+@lru_cache(maxsize=None)
+def get_field_adapter(schema: type[BaseModel], name: str) -> TypeAdapter:
+    field = schema.model_fields[name]
+    annotation = (
+        Annotated[field.annotation, *field.metadata]
+        if field.metadata
+        else field.annotation
+    )
+    return TypeAdapter(annotation, config=ConfigDict(arbitrary_types_allowed=True))
+
+
+def validate_fields(
+    schema: type[BaseModel], data: Any, location: str, partial: bool = False
+) -> dict[str, Any]:
+    """
+    Функция проверяет данные запроса по схеме из clients/*/…_schema.py.
+
+    У схем запросов есть фабрики случайных значений по умолчанию, поэтому модель
+    не создаётся: каждое переданное поле проверяется по своему типу, а отсутствие
+    обязательного поля — отдельно. Иначе сервер подставлял бы вместо недостающих
+    полей фейковые данные и сдвигал последовательность tools.fakers в тестах.
+
+    :param schema: Схема запроса.
+    :param data: Разобранное тело или query-параметры.
+    :param location: Часть запроса для сообщений об ошибках: body или query.
+    :param partial: Все поля необязательные (PATCH).
+    :return: Провалидированные значения только переданных полей по именам полей схемы.
+    :raises HTTPError: 422 с описанием ошибок в формате FastAPI.
+    """
+    if not isinstance(data, dict):
+        raise HTTPError(
+            HTTPStatus.UNPROCESSABLE_ENTITY,
+            [
+                {
+                    "type": "dict_type",
+                    "loc": [location],
+                    "msg": "Input should be an object",
+                }
+            ],
+        )
+
+    values, errors = {}, []
+    for name, field in schema.model_fields.items():
+        key = field.alias or name
+        if key not in data:
+            if not partial:
+                errors.append(
+                    {"type": "missing", "loc": [location, key], "msg": "Field required"}
+                )
+            continue
+
+        try:
+            values[name] = get_field_adapter(schema, name).validate_python(data[key])
+        except ValidationError as error:
+            errors.extend(
+                {
+                    "type": detail["type"],
+                    "loc": [location, key, *detail["loc"]],
+                    "msg": detail["msg"],
+                }
+                for detail in error.errors(include_url=False)
+            )
+
+    if errors:
+        raise HTTPError(HTTPStatus.UNPROCESSABLE_ENTITY, errors)
+
+    return values
+
+
+def parse_json(request: Request) -> Any:
+    try:
+        return json.loads(request.content)
+    except ValueError:
+        raise HTTPError(
+            HTTPStatus.UNPROCESSABLE_ENTITY,
+            [{"type": "json_invalid", "loc": ["body"], "msg": "JSON decode error"}],
+        )
+
+
+def parse_multipart(request: Request) -> tuple[dict[str, str], dict[str, bytes]]:
+    """
+    Функция разбирает тело multipart/form-data.
+
+    :param request: Запрос с прочитанным телом.
+    :return: Текстовые поля и содержимое файлов по именам полей.
+    """
+    content_type = request.headers.get("content-type", "")
+    if not content_type.startswith("multipart/form-data"):
+        raise HTTPError(HTTPStatus.UNPROCESSABLE_ENTITY, "Expected multipart/form-data")
+
+    message = BytesParser(policy=policy.HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + request.content
+    )
+    fields, files = {}, {}
+    for part in message.iter_parts():
+        name = part.get_param("name", header="content-disposition")
+        payload = part.get_payload(decode=True) or b""
+        if part.get_filename() is not None:
+            files[name] = payload
+        else:
+            fields[name] = payload.decode()
+
+    return fields, files
+
+
+def update_record(record: BaseModel, changes: dict[str, Any]) -> BaseModel:
+    """
+    Функция применяет к записи переданные в PATCH поля и проверяет результат по схеме записи.
+
+    :param record: Текущая запись.
+    :param changes: Значения переданных полей из validate_fields.
+    :return: Новая запись.
+    """
+    fields = type(record).model_fields
+    try:
+        return type(record).model_validate({**record.__dict__, **changes})
+    except ValidationError as error:
+        raise HTTPError(
+            HTTPStatus.UNPROCESSABLE_ENTITY,
+            [
+                {
+                    "type": detail["type"],
+                    "loc": ["body", fields[name].alias or name, *detail["loc"][1:]],
+                    "msg": detail["msg"],
+                }
+                for detail in error.errors(include_url=False)
+                if (name := detail["loc"][0])
+            ],
+        )
+
+
+class FakeBackend:
+    """
+    Фейковый сервер, реализующий контракт /api/v1 в памяти процесса.
+
+    Экземпляр — обработчик для httpx.MockTransport (см. FAKE_BACKEND в config.py),
+    а через tools.fake_backend.asgi его можно запустить как ASGI-приложение.
+    Запросы и ответы проверяются и строятся по схемам из clients/*/…_schema.py,
+    ошибки возвращаются в формате FastAPI: {"detail": ...} с кодами 401, 404, 409, 422.
+    Все запросы выполняются под общей блокировкой хранилища.
+    """
+
+    def __init__(
+        self, storage: FakeStorage | None = None, signer: TokenSigner | None = None
+    ):
+        """
+        :param storage: Хранилище (по умолчанию пустое).
+        :param signer: Выпуск и проверка токенов (по умолчанию со случайным ключом).
+        """
+        self.storage = storage or FakeStorage()
+        self.signer = signer or TokenSigner()
+
+    def __call__(self, request: Request) -> Response:
+        """
+        Обрабатывает запрос.
+
+        :param request: Запрос с прочитанным телом.
+        :return: Ответ сервера.
+        """
+        try:
+            handler, params = self.resolve(request)
+            with self.storage.lock:
+                if handler.private:
+                    params["current_user"] = self.authenticate(request)
+                return getattr(self, handler.handler)(request, **params)
+        except HTTPError as error:
+            response = build_response({"detail": error.detail}, error.status_code)
+            if error.status_code == HTTPStatus.UNAUTHORIZED:
+                response.headers["WWW-Authenticate"] = "Bearer"
+            return response
+
+    def resolve(self, request: Request) -> tuple[Route, dict[str, Any]]:
+        path_matched = False
+        for route in ROUTES:
+            if match := route.pattern.match(request.url.path):
+                path_matched = True
+                if route.method == request.method:
+                    return route, match.groupdict()
+
+        if path_matched:
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+        raise HTTPError(HTTPStatus.NOT_FOUND)
+
+    def authenticate(self, request: Request) -> UserSchema:
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            raise HTTPError(HTTPStatus.UNAUTHORIZED, "Not authenticated")
+
+        user_id = self.signer.verify(token, "access")
+        if user_id is None or user_id not in self.storage.users:
+            raise HTTPError(HTTPStatus.UNAUTHORIZED, "Could not validate credentials")
+
+        return self.storage.users[user_id]
+
+    @staticmethod
+    def get_or_404(records: dict[str, Any], record_id: str, name: str) -> Any:
+        if (record := records.get(record_id)) is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"{name} not found")
+        return record
+
+    # Пользователи
+
+    def create_user(self, request: Request) -> Response:
+        data = validate_fields(CreateUserRequestSchema, parse_json(request), "body")
+        if self.storage.find_user_by_email(data["email"]):
+            raise HTTPError(HTTPStatus.CONFLICT, "User with this email already exists")
+
+        password = data.pop("password")
+        user = UserSchema(id=generate_id(), **data)
+        self.storage.add_user(user, password)
+        return build_response(CreateUserResponseSchema(user=user))
+
+    def get_user_me(self, request: Request, current_user: UserSchema) -> Response:
+        return build_response(GetUserResponseSchema(user=current_user))
+
+    def get_user(
+        self, request: Request, current_user: UserSchema, user_id: str
+    ) -> Response:
+        user = self.get_or_404(self.storage.users, user_id, "User")
+        return build_response(GetUserResponseSchema(user=user))
+
+    def update_user(
+        self, request: Request, current_user: UserSchema, user_id: str
+    ) -> Response:
+        user = self.get_or_404(self.storage.users, user_id, "User")
+        data = validate_fields(
+            UpdateUserRequestSchema, parse_json(request), "body", partial=True
+        )
+        updated = update_record(user, data)
+
+        owner = self.storage.find_user_by_email(updated.email)
+        if owner is not None and owner.id != user_id:
+            raise HTTPError(HTTPStatus.CONFLICT, "User with this email already exists")
+
+        self.storage.replace_user(updated)
+        return build_response(UpdateUserResponseSchema(user=updated))
+
+    def delete_user(
+        self, request: Request, current_user: UserSchema, user_id: str
+    ) -> Response:
+        self.get_or_404(self.storage.users, user_id, "User")
+        self.storage.delete_user(user_id)
+        return Response(HTTPStatus.OK)
+
+    # Аутентификация
+
+    def login(self, request: Request) -> Response:
+        data = validate_fields(LoginRequestSchema, parse_json(request), "body")
+        user = self.storage.find_user_by_email(data["email"])
+        if user is None or self.storage.passwords[user.id] != data["password"]:
+            raise HTTPError(HTTPStatus.UNAUTHORIZED, "Wrong email or password")
+
+        return build_response(LoginResponseSchema(token=self.signer.issue(user.id)))
+
+    def refresh(self, request: Request) -> Response:
+        data = validate_fields(RefreshRequestSchema, parse_json(request), "body")
+        user_id = self.signer.verify(data["refresh_token"], "refresh")
+        if user_id is None or user_id not in self.storage.users:
+            raise HTTPError(HTTPStatus.UNAUTHORIZED, "Invalid refresh token")
+
+        return build_response(LoginResponseSchema(token=self.signer.issue(user_id)))
+
+    # Файлы
+
+    def create_file(self, request: Request, current_user: UserSchema) -> Response:
+        fields, files = parse_multipart(request)
+        data = validate_fields(CreateFileRequestSchema, {**fields, **files}, "body")
+        directory, filename = data["directory"], data["filename"]
+
+        # Ссылка строится от адреса, по которому пришёл запрос, как у реального сервера
+        base_url = f"{request.url.scheme}://{request.url.netloc.decode()}"
+        file = FileSchema(
+            id=generate_id(),
+            url=f"{base_url}/static/{directory}/{filename}",
+            filename=filename,
+            directory=directory,
+        )
+        content_type, _ = mimetypes.guess_type(filename)
+        self.storage.add_file(
+            StoredFileSchema(
+                file=file,
+                content=data["upload_file"],
+                content_type=content_type or "application/octet-stream",
+            )
+        )
+        return build_response(CreateFileResponseSchema(file=file))
+
+    def get_file(
+        self, request: Request, current_user: UserSchema, file_id: str
+    ) -> Response:
+        stored = self.get_or_404(self.storage.files, file_id, "File")
+        return build_response(GetFileResponseSchema(file=stored.file))
+
+    def delete_file(
+        self, request: Request, current_user: UserSchema, file_id: str
+    ) -> Response:
+        self.get_or_404(self.storage.files, file_id, "File")
+        self.storage.delete_file(file_id)
+        return Response(HTTPStatus.OK)
+
+    def get_static(self, request: Request, path: str) -> Response:
+        directory, _, filename = path.rpartition("/")
+        stored = self.storage.find_file_by_path(directory, filename)
+        if stored is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND)
+
+        content, size = stored.content, len(stored.content)
+        status_code = HTTPStatus.OK
+        headers = {"Content-Type": stored.content_type, "Accept-Ranges": "bytes"}
+
+        if range_header := request.headers.get("range"):
+            match = RANGE_PATTERN.match(range_header.strip())
+            if match is None or match.group(1) == match.group(2) == "":
+                raise HTTPError(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+
+            if match.group(1):
+                start = int(match.group(1))
+                end = min(int(match.group(2)), size - 1) if match.group(2) else size - 1
+            else:
+                # bytes=-N — последние N байт
+                start, end = max(size - int(match.group(2)), 0), size - 1
+
+            if start > end or start >= size:
+                raise HTTPError(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+
+            content = content[start : end + 1]
+            status_code = HTTPStatus.PARTIAL_CONTENT
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+        headers["Content-Length"] = str(len(content))
+        if request.method == "HEAD":
+            content = b""
+
+        return Response(status_code, headers=headers, content=content)
+
+    # Курсы
+
+    def get_courses(self, request: Request, current_user: UserSchema) -> Response:
+        query = validate_fields(
+            GetCoursesQuerySchema, dict(request.url.params), "query"
+        )
+        courses = self.storage.get_user_courses(query["user_id"])
+        return build_response(
+            {
+                "courses": [
+                    self.storage.build_course(course).model_dump(
+                        mode="json", by_alias=True
+                    )
+                    for course in courses
+                ]
+            }
+        )
+
+    def create_course(self, request: Request, current_user: UserSchema) -> Response:
+        data = validate_fields(CreateCourseRequestSchema, parse_json(request), "body")
+        self.get_or_404(self.storage.files, data["preview_file_id"], "Preview file")
+        self.get_or_404(self.storage.users, data["created_by_user_id"], "User")
+
+        course = StoredCourseSchema(id=generate_id(), **data)
+        self.storage.add_course(course)
+        return build_response(
+            CreateCourseResponseSchema(course=self.storage.build_course(course))
+        )
+
+    def get_course(
+        self, request: Request, current_user: UserSchema, course_id: str
+    ) -> Response:
+        course = self.get_or_404(self.storage.courses, course_id, "Course")
+        return build_response(
+            CreateCourseResponseSchema(course=self.storage.build_course(course))
+        )
+
+    def update_course(
+        self, request: Request, current_user: UserSchema, course_id: str
+    ) -> Response:
+        course = self.get_or_404(self.storage.courses, course_id, "Course")
+        data = validate_fields(
+            UpdateCourseRequestSchema, parse_json(request), "body", partial=True
+        )
+        updated = update_record(course, data)
+        self.storage.replace_course(updated)
+        return build_response(
+            CreateCourseResponseSchema(course=self.storage.build_course(updated))
+        )
+
+    def delete_course(
+        self, request: Request, current_user: UserSchema, course_id: str
+    ) -> Response:
+        self.get_or_404(self.storage.courses, course_id, "Course")
+        self.storage.delete_course(course_id)
+        return Response(HTTPStatus.OK)
+
+    # Упражнения
+
+    def get_exercises(self, request: Request, current_user: UserSchema) -> Response:
+        query = validate_fields(
+            GetExercisesQuerySchema, dict(request.url.params), "query"
+        )
+        exercises = self.storage.get_course_exercises(query["course_id"])
+        return build_response(GetExercisesResponseSchema(exercises=exercises))
+
+    def create_exercise(self, request: Request, current_user: UserSchema) -> Response:
+        data = validate_fields(CreateExerciseRequestSchema, parse_json(request), "body")
+        self.get_or_404(self.storage.courses, data["course_id"], "Course")
+
+        exercise = ExerciseSchema(id=generate_id(), **data)
+        self.storage.add_exercise(exercise)
+        return build_response(CreateExerciseResponseSchema(exercise=exercise))
+
+    def get_exercise(
+        self, request: Request, current_user: UserSchema, exercise_id: str
+    ) -> Response:
+        exercise = self.get_or_404(self.storage.exercises, exercise_id, "Exercise")
+        return build_response(GetExerciseResponseSchema(exercise=exercise))
+
+    def update_exercise(
+        self, request: Request, current_user: UserSchema, exercise_id: str
+    ) -> Response:
+        exercise = self.get_or_404(self.storage.exercises, exercise_id, "Exercise")
+        data = validate_fields(
+            UpdateExerciseRequestSchema, parse_json(request), "body", partial=True
+        )
+        updated = update_record(exercise, data)
+        self.storage.replace_exercise(updated)
+        return build_response(UpdateExerciseResponseSchema(exercise=updated))
+
+    def delete_exercise(
+        self, request: Request, current_user: UserSchema, exercise_id: str
+    ) -> Response:
+        self.get_or_404(self.storage.exercises, exercise_id, "Exercise")
+        self.storage.delete_exercise(exercise_id)
+        return Response(HTTPStatus.OK)
+
+
+@lru_cache(maxsize=None)
+def get_fake_backend() -> FakeBackend:
+    """
+    Функция возвращает общий для процесса фейковый сервер.
+
+    Данные живут в памяти процесса: у каждого воркера xdist свой сервер.
+
+    :return: Объект FakeBackend.
+    """
+    return FakeBackend()
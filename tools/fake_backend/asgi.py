@@ -0,0 +1,61 @@
+from httpx import Request
+
+from tools.fake_backend.app import FakeBackend, get_fake_backend
+
+
+class FakeBackendASGIApp:
+    """
+    ASGI-обёртка над FakeBackend.
+
+    Позволяет поднять фейковый сервер как отдельный процесс, например
+    uvicorn tools.fake_backend.asgi:app --port 8000, или подключить его к клиентам
+    через httpx.ASGITransport. Данные хранятся в памяти процесса сервера.
+    """
+
+    def __init__(self, backend: FakeBackend):
+        """
+        :param backend: Обработчик запросов.
+        """
+        self.backend = backend
+
+    async def __call__(self, scope: dict, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        if scope["type"] != "http":
+            return
+
+        body = bytearray()
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body", False):
+                break
+
+        headers = [(name.decode(), value.decode()) for name, value in scope["headers"]]
+        host = dict(headers).get("host") or "{}:{}".format(*scope["server"])
+        path = f"{scope.get('root_path', '')}{scope['path']}"
+        url = f"{scope.get('scheme', 'http')}://{host}{path}"
+        if scope.get("query_string"):
+            url = f"{url}?{scope['query_string'].decode()}"
+
+        request = Request(scope["method"], url, headers=headers, content=bytes(body))
+        response = self.backend(request)
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": response.headers.raw,
+            }
+        )
+        await send({"type": "http.response.body", "body": response.content})
+
+
+app = FakeBackendASGIApp(get_fake_backend())
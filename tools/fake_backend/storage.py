@@ -0,0 +1,177 @@
+import threading
+import uuid
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from clients.courses.courses_schema import CourseSchema
+from clients.exercises.exercises_schema import ExerciseSchema
+from clients.files.files_schema import FileSchema
+from clients.users.users_schema import UserSchema
+
+
+class StoredFileSchema(BaseModel):
+    """
+    Описание структуры загруженного файла вместе с содержимым.
+    """
+
+    file: FileSchema
+    content: bytes
+    content_type: str
+
+
+class StoredCourseSchema(BaseModel):
+    """
+    Описание структуры курса в хранилище: вместо вложенных объектов хранятся ссылки.
+    """
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: str
+    title: str
+    max_score: int = Field(alias="maxScore")
+    min_score: int = Field(alias="minScore")
+    description: str
+    estimated_time: str = Field(alias="estimatedTime")
+    preview_file_id: str = Field(alias="previewFileId")
+    created_by_user_id: str = Field(alias="createdByUserId")
+
+
+def generate_id() -> str:
+    return str(uuid.uuid4())
+
+
+class FakeStorage:
+    """
+    Хранилище фейкового сервера в памяти.
+
+    Кроме словарей по идентификатору поддерживаются индексы для выборок, которые
+    делает API: пользователь по email, курсы по автору, упражнения по курсу, файл
+    по пути в /static. Индексы упорядочены по времени создания. Удаление каскадное,
+    как при внешних ключах в базе: вместе с пользователем удаляются его курсы,
+    вместе с курсом — упражнения. Методы не потокобезопасны сами по себе,
+    вызывающий код выполняет их под self.lock.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.users: dict[str, UserSchema] = {}
+        self.passwords: dict[str, str] = {}
+        self.files: dict[str, StoredFileSchema] = {}
+        self.courses: dict[str, StoredCourseSchema] = {}
+        self.exercises: dict[str, ExerciseSchema] = {}
+
+        self.user_ids_by_email: dict[str, str] = {}
+        self.file_ids_by_path: dict[tuple[str, str], str] = {}
+        # Вложенные словари используются как упорядоченные множества
+        self.course_ids_by_user: dict[str, dict[str, None]] = {}
+        self.course_ids_by_file: dict[str, dict[str, None]] = {}
+        self.exercise_ids_by_course: dict[str, dict[str, None]] = {}
+
+    # Пользователи
+
+    def add_user(self, user: UserSchema, password: str) -> None:
+        self.users[user.id] = user
+        self.passwords[user.id] = password
+        self.user_ids_by_email[user.email] = user.id
+
+    def replace_user(self, user: UserSchema) -> None:
+        previous = self.users[user.id]
+        del self.user_ids_by_email[previous.email]
+        self.user_ids_by_email[user.email] = user.id
+        self.users[user.id] = user
+
+    def delete_user(self, user_id: str) -> None:
+        user = self.users.pop(user_id)
+        del self.passwords[user_id]
+        del self.user_ids_by_email[user.email]
+        for course_id in list(self.course_ids_by_user.pop(user_id, {})):
+            self.delete_course(course_id)
+
+    def find_user_by_email(self, email: str) -> UserSchema | None:
+        user_id = self.user_ids_by_email.get(email)
+        return self.users[user_id] if user_id else None
+
+    # Файлы
+
+    def add_file(self, stored: StoredFileSchema) -> None:
+        file = stored.file
+        # Повторная загрузка по тому же пути подменяет содержимое в /static,
+        # но прежняя запись остаётся доступной по своему идентификатору
+        self.files[file.id] = stored
+        self.file_ids_by_path[(file.directory, file.filename)] = file.id
+
+    def delete_file(self, file_id: str) -> None:
+        file = self.files.pop(file_id).file
+        if self.file_ids_by_path.get((file.directory, file.filename)) == file_id:
+            del self.file_ids_by_path[(file.directory, file.filename)]
+        for course_id in list(self.course_ids_by_file.pop(file_id, {})):
+            self.delete_course(course_id)
+
+    def find_file_by_path(
+        self, directory: str, filename: str
+    ) -> StoredFileSchema | None:
+        file_id = self.file_ids_by_path.get((directory, filename))
+        return self.files.get(file_id) if file_id else None
+
+    # Курсы
+
+    def add_course(self, course: StoredCourseSchema) -> None:
+        self.courses[course.id] = course
+        user_courses = self.course_ids_by_user.setdefault(course.created_by_user_id, {})
+        user_courses[course.id] = None
+        file_courses = self.course_ids_by_file.setdefault(course.preview_file_id, {})
+        file_courses[course.id] = None
+
+    def replace_course(self, course: StoredCourseSchema) -> None:
+        self.courses[course.id] = course
+
+    def delete_course(self, course_id: str) -> None:
+        course = self.courses.pop(course_id)
+        self.course_ids_by_user.get(course.created_by_user_id, {}).pop(course_id, None)
+        self.course_ids_by_file.get(course.preview_file_id, {}).pop(course_id, None)
+        for exercise_id in self.exercise_ids_by_course.pop(course_id, {}):
+            del self.exercises[exercise_id]
+
+    def get_user_courses(self, user_id: str) -> list[StoredCourseSchema]:
+        return [
+            self.courses[course_id]
+            for course_id in self.course_ids_by_user.get(user_id, {})
+        ]
+
+    def build_course(self, course: StoredCourseSchema) -> CourseSchema:
+        """
+        Собирает курс с вложенными файлом превью и автором в том виде, в каком его отдаёт API.
+
+        :param course: Курс из хранилища.
+        :return: Курс по схеме ответа.
+        """
+        return CourseSchema.model_construct(
+            id=course.id,
+            title=course.title,
+            max_score=course.max_score,
+            min_score=course.min_score,
+            description=course.description,
+            estimated_time=course.estimated_time,
+            preview_file=self.files[course.preview_file_id].file,
+            created_by_user=self.users[course.created_by_user_id],
+        )
+
+    # Упражнения
+
+    def add_exercise(self, exercise: ExerciseSchema) -> None:
+        self.exercises[exercise.id] = exercise
+        course_exercises = self.exercise_ids_by_course.setdefault(exercise.course_id, {})
+        course_exercises[exercise.id] = None
+
+    def replace_exercise(self, exercise: ExerciseSchema) -> None:
+        self.exercises[exercise.id] = exercise
+
+    def delete_exercise(self, exercise_id: str) -> None:
+        exercise = self.exercises.pop(exercise_id)
+        self.exercise_ids_by_course.get(exercise.course_id, {}).pop(exercise_id, None)
+
+    def get_course_exercises(self, course_id: str) -> list[ExerciseSchema]:
+        return [
+            self.exercises[exercise_id]
+            for exercise_id in self.exercise_ids_by_course.get(course_id, {})
+        ]
@@ -0,0 +1,89 @@
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import time
+from typing import Literal
+
+from clients.authentication.authentication_schema import TokenSchema
+
+TokenType = Literal["access", "refresh"]
+
+# Время жизни токенов совпадает с JWT_ACCESS_TOKEN_EXPIRE и JWT_REFRESH_TOKEN_EXPIRE сервера
+ACCESS_TOKEN_TTL = 1800
+REFRESH_TOKEN_TTL = 5184000
+JWT_HEADER = {"alg": "HS256", "typ": "JWT"}
+
+
+def encode_segment(data: dict | bytes) -> str:
+    raw = data if isinstance(data, bytes) else json.dumps(data).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_segment(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+class TokenSigner:
+    """
+    Выпускает и проверяет JWT-токены фейкового сервера (HS256).
+
+    Ключ подписи случайный для каждого экземпляра, поэтому токены, выпущенные
+    в предыдущих запусках или другими воркерами, отклоняются с 401 — клиенты
+    в этом случае перелогиниваются так же, как с реальным сервером.
+    """
+
+    def __init__(self, secret: bytes | None = None):
+        """
+        :param secret: Ключ подписи (по умолчанию случайный).
+        """
+        self.secret = secret or secrets.token_bytes(32)
+
+    def issue(self, user_id: str) -> TokenSchema:
+        """
+        Выпускает пару access/refresh токенов для пользователя.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Пара токенов.
+        """
+        return TokenSchema(
+            tokenType="bearer",
+            accessToken=self.sign(user_id, "access", ACCESS_TOKEN_TTL),
+            refreshToken=self.sign(user_id, "refresh", REFRESH_TOKEN_TTL),
+        )
+
+    def sign(self, user_id: str, token_type: TokenType, ttl: int) -> str:
+        payload = {
+            "sub": user_id,
+            "type": token_type,
+            "exp": int(time.time()) + ttl,
+            # jti делает токены уникальными даже при выпуске в одну и ту же секунду
+            "jti": secrets.token_hex(8),
+        }
+        message = f"{encode_segment(JWT_HEADER)}.{encode_segment(payload)}"
+        signature = hmac.new(self.secret, message.encode(), hashlib.sha256).digest()
+        return f"{message}.{encode_segment(signature)}"
+
+    def verify(self, token: str, token_type: TokenType) -> str | None:
+        """
+        Проверяет подпись, тип и срок действия токена.
+
+        :param token: JWT-токен.
+        :param token_type: Ожидаемый тип токена.
+        :return: Идентификатор пользователя или None, если токен недействителен.
+        """
+        try:
+            message, signature = token.rsplit(".", 1)
+            expected = hmac.new(self.secret, message.encode(), hashlib.sha256).digest()
+            if not hmac.compare_digest(decode_segment(signature), expected):
+                return None
+
+            payload = json.loads(decode_segment(message.split(".", 1)[1]))
+        except (ValueError, IndexError):
+            return None
+
+        if payload.get("type") != token_type or payload.get("exp", 0) <= time.time():
+            return None
+
+        return payload.get("sub")
@@ -1,16 +1,137 @@
+import hashlib
+import itertools
+import random
+import secrets
+import string
+import threading
+from collections import deque
+from contextlib import contextmanager
+from functools import cached_property
+from typing import Callable, Hashable, Iterator, TypeVar
+
 from faker import Faker
 
+T = TypeVar("T")
+
+# Сколько значений каждого словаря заранее берётся из Faker
+VOCABULARY_SIZE = 1000
+VOCABULARY_SEED = 0
+# Длина токена раздела, который входит в каждый email
+PARTITION_LENGTH = 10
+# Сколько значений за раз генерируется в буфер для одиночных вызовов (0 — без буфера)
+PREFETCH_BLOCK_SIZE = 256
+
+# Маски версии и варианта UUID4 для 128-битного случайного числа
+UUID4_CLEAR_MASK = ~((0xF000 << 64) | (0xC000 << 48))
+UUID4_SET_BITS = (0x4000 << 64) | (0x8000 << 48)
+
+PASSWORD_LENGTH = 10
+PASSWORD_ALPHABETS = (
+    string.ascii_lowercase,
+    string.ascii_uppercase,
+    string.digits,
+    "!@#$%^&*()_+",
+)
+PASSWORD_CHARACTERS = "".join(PASSWORD_ALPHABETS)
+# Все варианты позиций обязательных символов в пароле
+PASSWORD_POSITIONS = tuple(
+    itertools.permutations(range(PASSWORD_LENGTH), len(PASSWORD_ALPHABETS))
+)
+
 
 class Fake:
     """
     Класс для генерации случайных тестовых данных с использованием библиотеки Faker.
+
+    Faker используется только один раз — для заполнения словарей (имена, слова, домены).
+    Сами значения собираются из этих словарей генератором random.Random, поэтому
+    пакетные методы (emails, integers и т.д.) строят тысячи значений за одну итерацию.
+    Одиночные методы при prefetch > 0 берут значения из заранее сгенерированных блоков.
+
+    После seed() последовательность значений воспроизводима. В каждый email входит
+    токен раздела и счётчик, поэтому потоки с разными разделами (воркеры, тесты)
+    никогда не выдают одинаковые email без блокировок и повторных попыток.
+    Токен раздела выводится из seed и run_id: при новом run_id те же seed дают те же
+    значения полей, но другие email, и повторный прогон не упирается в уже созданных
+    на сервере пользователей.
     """
 
-    def __init__(self, faker: Faker):
+    def __init__(
+        self,
+        faker: Faker,
+        vocabulary_size: int = VOCABULARY_SIZE,
+        prefetch: int = PREFETCH_BLOCK_SIZE,
+        run_id: str | None = None,
+    ):
         """
         :param faker: Экземпляр класса Faker, который будет использоваться для генерации данных.
+        :param vocabulary_size: Сколько значений каждого словаря взять из Faker.
+        :param prefetch: Размер блока для одиночных методов (0 — генерировать по одному значению).
+        :param run_id: Соль токена раздела email (по умолчанию случайная для процесса).
         """
         self.faker = faker
+        self.vocabulary_size = vocabulary_size
+        self.prefetch = prefetch
+        self.run_id = run_id or secrets.token_hex(8)
+        self.random = random.Random()
+        self.partition = f"{self.random.getrandbits(64):016x}"[:PARTITION_LENGTH]
+        self._email_counter = itertools.count()
+        self._buffers: dict[Hashable, deque] = {}
+        # Состояния отдельных потоков данных (см. stream), по seed потока
+        self._streams: dict[int | str, tuple] = {}
+        self._active_stream: int | str | None = None
+        self._vocabulary_lock = threading.Lock()
+
+    def seed(self, seed: int | str, partition: str | None = None) -> None:
+        """
+        Перезапускает поток данных с заданного seed.
+
+        :param seed: Seed генератора.
+        :param partition: Токен раздела для email. По умолчанию выводится из seed и run_id.
+        """
+        self.random.seed(get_seed(seed))
+        self.partition = (
+            partition
+            or f"{get_seed(seed, self.run_id, 'partition'):016x}"[:PARTITION_LENGTH]
+        )
+        self._email_counter = itertools.count()
+        self.flush()
+
+    @contextmanager
+    def stream(self, seed: int | str) -> Iterator[None]:
+        """
+        Временно переключается на отдельный поток данных, затем возвращает текущий.
+
+        Повторный вход в поток с тем же seed продолжает его с места остановки, поэтому
+        значения потока не зависят от того, из каких потоков и сколько значений
+        бралось между входами.
+
+        :param seed: Seed отдельного потока.
+        """
+        # Вложенный вход в уже активный поток ничего не переключает
+        if seed == self._active_stream:
+            yield
+            return
+
+        current, active = self._get_state(), self._active_stream
+        if (state := self._streams.get(seed)) is None:
+            self._buffers = {}
+            self.seed(seed)
+        else:
+            self._set_state(state)
+        self._active_stream = seed
+        try:
+            yield
+        finally:
+            self._streams[seed] = self._get_state()
+            self._set_state(current)
+            self._active_stream = active
+
+    def flush(self) -> None:
+        """
+        Сбрасывает заранее сгенерированные блоки значений.
+        """
+        self._buffers.clear()
 
     def text(self) -> str:
         """
@@ -18,7 +139,27 @@ class Fake:
 
         :return: Случайный текст.
         """
-        return self.faker.text()
+        return self._draw("text", self.texts)
+
+    def texts(self, count: int, max_length: int = 200) -> list[str]:
+        """
+        Генерирует список случайных текстов из нескольких предложений.
+
+        :param count: Количество значений.
+        :param max_length: Максимальная длина текста.
+        :return: Список случайных текстов.
+        """
+        sentence_counts = self.random.choices(range(2, 5), k=count)
+        sentences = self.sentences(sum(sentence_counts))
+
+        texts, start = [], 0
+        for sentence_count in sentence_counts:
+            text = " ".join(sentences[start : start + sentence_count])
+            start += sentence_count
+            if len(text) > max_length:
+                text = text[: text.rfind(" ", 0, max_length - 1)] + "."
+            texts.append(text)
+        return texts
 
     def uuid4(self) -> str:
         """
@@ -26,7 +167,24 @@ class Fake:
 
         :return: Случайный UUID4.
         """
-        return self.faker.uuid4()
+        return self._draw("uuid4", self.uuid4s)
+
+    def uuid4s(self, count: int) -> list[str]:
+        """
+        Генерирует список случайных UUID4.
+
+        :param count: Количество значений.
+        :return: Список случайных UUID4.
+        """
+        getrandbits = self.random.getrandbits
+        uuids = []
+        for _ in range(count):
+            # Выставляем биты версии 4 и варианта RFC 4122, как uuid.UUID(version=4)
+            value = f"{getrandbits(128) & UUID4_CLEAR_MASK | UUID4_SET_BITS:032x}"
+            uuids.append(
+                f"{value[:8]}-{value[8:12]}-{value[12:16]}-{value[16:20]}-{value[20:]}"
+            )
+        return uuids
 
     def email(self, domain: str | None = None) -> str:
         """
@@ -36,7 +194,31 @@ class Fake:
         Если не указан, будет использован случайный домен.
         :return: Случайный email.
         """
-        return self.faker.email(domain=domain)
+        return self._draw(("email", domain), lambda count: self.emails(count, domain))
+
+    def emails(self, count: int, domain: str | None = None) -> list[str]:
+        """
+        Генерирует список случайных email.
+
+        Локальная часть содержит токен раздела и порядковый номер, поэтому email
+        не повторяются ни внутри потока, ни между потоками с разными разделами.
+
+        :param count: Количество значений.
+        :param domain: Домен электронной почты. Если не указан, выбирается случайный.
+        :return: Список случайных email.
+        """
+        domains = (
+            [domain] * count
+            if domain
+            else self.random.choices(self._domains, k=count)
+        )
+        first_names = self.random.choices(self._email_names, k=count)
+        last_names = self.random.choices(self._email_names, k=count)
+        partition, counter = self.partition, self._email_counter
+        return [
+            f"{first_name}.{last_name}.{partition}.{next(counter):x}@{domain}"
+            for first_name, last_name, domain in zip(first_names, last_names, domains)
+        ]
 
     def sentence(self) -> str:
         """
@@ -44,7 +226,24 @@ class Fake:
 
         :return: Случайное предложение.
         """
-        return self.faker.sentence()
+        return self._draw("sentence", self.sentences)
+
+    def sentences(self, count: int) -> list[str]:
+        """
+        Генерирует список случайных предложений из 4–8 слов.
+
+        :param count: Количество значений.
+        :return: Список случайных предложений.
+        """
+        # Слова для всех предложений выбираются одним вызовом и затем нарезаются
+        lengths = self.random.choices(range(4, 9), k=count)
+        words = self.random.choices(self._words, k=sum(lengths))
+
+        sentences, start = [], 0
+        for length in lengths:
+            sentences.append(" ".join(words[start : start + length]).capitalize() + ".")
+            start += length
+        return sentences
 
     def password(self) -> str:
         """
@@ -52,7 +251,33 @@ class Fake:
 
         :return: Случайный пароль.
         """
-        return self.faker.password()
+        return self._draw("password", self.passwords)
+
+    def passwords(self, count: int) -> list[str]:
+        """
+        Генерирует список случайных паролей.
+
+        Как и Faker.password, каждый пароль содержит строчную и заглавную буквы,
+        цифру и спецсимвол.
+
+        :param count: Количество значений.
+        :return: Список случайных паролей.
+        """
+        choices = self.random.choices
+        # Все символы выбираются колонками, затем в случайные позиции каждого пароля
+        # подставляется по символу из каждого обязательного алфавита
+        characters = choices(PASSWORD_CHARACTERS, k=count * PASSWORD_LENGTH)
+        required = [choices(alphabet, k=count) for alphabet in PASSWORD_ALPHABETS]
+        positions = choices(PASSWORD_POSITIONS, k=count)
+
+        passwords = []
+        for index in range(count):
+            start = index * PASSWORD_LENGTH
+            password = characters[start : start + PASSWORD_LENGTH]
+            for position, column in zip(positions[index], required):
+                password[position] = column[index]
+            passwords.append("".join(password))
+        return passwords
 
     def last_name(self) -> str:
         """
@@ -60,7 +285,16 @@ class Fake:
 
         :return: Случайная фамилия.
         """
-        return self.faker.last_name()
+        return self._draw("last_name", self.last_names)
+
+    def last_names(self, count: int) -> list[str]:
+        """
+        Генерирует список случайных фамилий.
+
+        :param count: Количество значений.
+        :return: Список случайных фамилий.
+        """
+        return self.random.choices(self._last_names, k=count)
 
     def first_name(self) -> str:
         """
@@ -68,7 +302,16 @@ class Fake:
 
         :return: Случайное имя.
         """
-        return self.faker.first_name()
+        return self._draw("first_name", self.first_names)
+
+    def first_names(self, count: int) -> list[str]:
+        """
+        Генерирует список случайных имён.
+
+        :param count: Количество значений.
+        :return: Список случайных имён.
+        """
+        return self.random.choices(self._first_names, k=count)
 
     def middle_name(self) -> str:
         """
@@ -76,7 +319,16 @@ class Fake:
 
         :return: Случайное отчество.
         """
-        return self.faker.first_name()
+        return self._draw("middle_name", self.middle_names)
+
+    def middle_names(self, count: int) -> list[str]:
+        """
+        Генерирует список случайных отчеств/средних имён.
+
+        :param count: Количество значений.
+        :return: Список случайных отчеств.
+        """
+        return self.first_names(count)
 
     def estimated_time(self) -> str:
         """
@@ -84,7 +336,16 @@ class Fake:
 
         :return: Строка с предполагаемым временем.
         """
-        return f"{self.integer(1, 10)} weeks"
+        return self._draw("estimated_time", self.estimated_times)
+
+    def estimated_times(self, count: int) -> list[str]:
+        """
+        Генерирует список строк с предполагаемым временем.
+
+        :param count: Количество значений.
+        :return: Список строк с предполагаемым временем.
+        """
+        return [f"{weeks} weeks" for weeks in self.integers(count, 1, 10)]
 
     def integer(self, start: int = 1, end: int = 100) -> int:
         """
@@ -94,7 +355,20 @@ class Fake:
         :param end: Конец диапазона (включительно).
         :return: Случайное целое число.
         """
-        return self.faker.random_int(start, end)
+        return self._draw(
+            ("integer", start, end), lambda count: self.integers(count, start, end)
+        )
+
+    def integers(self, count: int, start: int = 1, end: int = 100) -> list[int]:
+        """
+        Генерирует список случайных целых чисел в заданном диапазоне.
+
+        :param count: Количество значений.
+        :param start: Начало диапазона (включительно).
+        :param end: Конец диапазона (включительно).
+        :return: Список случайных целых чисел.
+        """
+        return self.random.choices(range(start, end + 1), k=count)
 
     def max_score(self) -> int:
         """
@@ -104,6 +378,15 @@ class Fake:
         """
         return self.integer(50, 100)
 
+    def max_scores(self, count: int) -> list[int]:
+        """
+        Генерирует список случайных максимальных баллов в диапазоне от 50 до 100.
+
+        :param count: Количество значений.
+        :return: Список случайных баллов.
+        """
+        return self.integers(count, 50, 100)
+
     def min_score(self) -> int:
         """
         Генерирует случайный минимальный балл в диапазоне от 1 до 30.
@@ -112,6 +395,84 @@ class Fake:
         """
         return self.integer(1, 30)
 
+    def min_scores(self, count: int) -> list[int]:
+        """
+        Генерирует список случайных минимальных баллов в диапазоне от 1 до 30.
+
+        :param count: Количество значений.
+        :return: Список случайных баллов.
+        """
+        return self.integers(count, 1, 30)
+
+    def _draw(self, key: Hashable, generate: Callable[[int], list[T]]) -> T:
+        if not self.prefetch:
+            return generate(1)[0]
+
+        # deque.popleft атомарен, поэтому буфер можно разбирать из нескольких потоков
+        while True:
+            buffer = self._buffers.get(key)
+            if buffer is None:
+                buffer = self._buffers.setdefault(key, deque())
+            try:
+                return buffer.popleft()
+            except IndexError:
+                buffer.extend(generate(self.prefetch))
+
+    def _get_state(self) -> tuple:
+        return (
+            self.random.getstate(),
+            self.partition,
+            self._email_counter,
+            self._buffers,
+        )
+
+    def _set_state(self, state: tuple) -> None:
+        random_state, self.partition, self._email_counter, self._buffers = state
+        self.random.setstate(random_state)
+
+    def _vocabulary(self, generate: Callable[[], str]) -> tuple[str, ...]:
+        # Словари строятся из фиксированного seed и сортируются, чтобы во всех процессах
+        # они совпадали и последовательности значений зависели только от self.random
+        with self._vocabulary_lock:
+            self.faker.seed_instance(VOCABULARY_SEED)
+            return tuple(sorted({generate() for _ in range(self.vocabulary_size)}))
+
+    @cached_property
+    def _words(self) -> tuple[str, ...]:
+        return tuple(sorted(set(self.faker.get_words_list())))
+
+    @cached_property
+    def _first_names(self) -> tuple[str, ...]:
+        return self._vocabulary(self.faker.first_name)
+
+    @cached_property
+    def _last_names(self) -> tuple[str, ...]:
+        return self._vocabulary(self.faker.last_name)
+
+    @cached_property
+    def _email_names(self) -> tuple[str, ...]:
+        # В локальной части email оставляем только ASCII-буквы
+        names = {
+            "".join(filter(str.isascii, name)).lower()
+            for name in self._first_names + self._last_names
+        }
+        return tuple(sorted(name for name in names if name))
+
+    @cached_property
+    def _domains(self) -> tuple[str, ...]:
+        return self._vocabulary(self.faker.free_email_domain)
+
+
+def get_seed(*parts: int | str) -> int:
+    """
+    Функция детерминированно выводит 64-битный seed из нескольких частей.
+
+    :param parts: Например, seed прогона, node id теста и номер попытки.
+    :return: Seed, одинаковый во всех процессах для одних и тех же частей.
+    """
+    key = "\0".join(str(part) for part in parts).encode()
+    return int.from_bytes(hashlib.sha256(key).digest()[:8], "big")
+
 
 # Создаем экземпляр класса Fake с использованием Faker
 fake = Fake(faker=Faker())
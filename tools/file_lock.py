@@ -0,0 +1,100 @@
+import os
+import time
+from pathlib import Path
+
+# Через сколько секунд брошенной считается блокировка на удаление устаревшего lock-файла.
+# Её держат доли миллисекунды, поэтому она остаётся только после падения процесса
+BREAK_LOCK_STALE_AFTER = 10
+
+
+class FileLock:
+    """
+    Межпроцессная блокировка на основе lock-файла.
+
+    Работает одинаково на Linux, macOS и Windows, поэтому подходит для синхронизации
+    воркеров pytest-xdist, которые работают с общими файлами.
+    """
+
+    def __init__(self, path: str | Path, timeout: float = 60, stale_after: float = 120):
+        """
+        :param path: Путь к lock-файлу.
+        :param timeout: Максимальное время ожидания блокировки в секундах.
+        :param stale_after: Через сколько секунд lock-файл считается брошенным упавшим процессом.
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self.stale_after = stale_after
+
+    def acquire(self) -> None:
+        """
+        Захватывает блокировку, ожидая её освобождения другими процессами.
+
+        :raises TimeoutError: Если блокировку не удалось получить за timeout секунд.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        deadline = time.monotonic() + self.timeout
+
+        while True:
+            if self._create(self.path):
+                return
+            self._remove_if_stale()
+
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Не удалось получить блокировку: {self.path}")
+            time.sleep(0.01)
+
+    def release(self) -> None:
+        """
+        Освобождает блокировку.
+        """
+        self.path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _create(path: Path) -> bool:
+        try:
+            descriptor = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+
+        os.write(descriptor, str(os.getpid()).encode())
+        os.close(descriptor)
+        return True
+
+    def _remove_if_stale(self) -> None:
+        try:
+            stale = self.path.stat()
+        except FileNotFoundError:
+            return
+
+        if time.time() - stale.st_mtime > self.stale_after:
+            self._break(stale)
+
+    def _break(self, stale: os.stat_result) -> None:
+        # Устаревший lock-файл могут одновременно увидеть несколько процессов. Если первый
+        # удалит его и захватит блокировку, второй не должен удалить уже новый файл, поэтому
+        # удаление выполняется под отдельной блокировкой и только если на месте тот же файл
+        break_path = self.path.with_name(f"{self.path.name}.break")
+        if not self._create(break_path):
+            try:
+                if time.time() - break_path.stat().st_mtime > BREAK_LOCK_STALE_AFTER:
+                    break_path.unlink(missing_ok=True)
+            except FileNotFoundError:
+                pass
+            return
+
+        try:
+            current = self.path.stat()
+            same_file = current.st_ino == stale.st_ino
+            if same_file and current.st_mtime_ns == stale.st_mtime_ns:
+                self.path.unlink()
+        except FileNotFoundError:
+            pass
+        finally:
+            break_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.release()
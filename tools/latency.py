@@ -0,0 +1,150 @@
+from collections import defaultdict
+
+from clients.api_client import RequestRecord
+from tools.routes import get_route_template
+
+# Точность гистограммы: 2^7 под-интервалов на каждую степень двойки,
+# относительная погрешность значения не больше 1/128 (< 0.8%)
+SUB_BUCKET_BITS = 8
+SUB_BUCKET_HALF = 1 << (SUB_BUCKET_BITS - 1)
+# Перцентили, которые выводятся в отчётах
+REPORT_PERCENTILES = (50, 90, 99, 99.9)
+
+
+class LatencyHistogram:
+    """
+    Компактная лог-линейная гистограмма задержек в стиле HDR Histogram.
+
+    Значения хранятся в микросекундах в разреженных интервалах, ширина которых растёт
+    вместе со значением, поэтому объём памяти ограничен и не зависит от числа измерений.
+    Гистограммы можно объединять, в том числе полученные с разных воркеров xdist.
+    """
+
+    def __init__(self, counts: dict[int, int] | None = None):
+        """
+        :param counts: Количество значений в каждом интервале.
+        """
+        self.counts: defaultdict[int, int] = defaultdict(int, counts or {})
+        self.total = sum(self.counts.values())
+
+    @staticmethod
+    def get_bucket(value: int) -> int:
+        shift = max(value.bit_length() - SUB_BUCKET_BITS, 0)
+        return shift * SUB_BUCKET_HALF + (value >> shift)
+
+    @staticmethod
+    def get_bucket_upper_value(bucket: int) -> int:
+        if bucket < 2 * SUB_BUCKET_HALF:
+            return bucket
+
+        shift = (bucket >> (SUB_BUCKET_BITS - 1)) - 1
+        mantissa = bucket - shift * SUB_BUCKET_HALF
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        """
+        Добавляет измерение в гистограмму.
+
+        :param seconds: Задержка в секундах.
+        """
+        self.counts[self.get_bucket(max(int(seconds * 1_000_000), 0))] += 1
+        self.total += 1
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Добавляет к гистограмме значения другой гистограммы.
+
+        :param other: Объединяемая гистограмма.
+        """
+        for bucket, count in other.counts.items():
+            self.counts[bucket] += count
+        self.total += other.total
+
+    def percentile(self, percent: float) -> float:
+        """
+        Вычисляет перцентиль.
+
+        :param percent: Перцентиль от 0 до 100.
+        :return: Значение перцентиля в секундах (верхняя граница интервала).
+        """
+        if not self.total:
+            return 0.0
+
+        threshold = max(percent / 100 * self.total, 1)
+        cumulative = 0
+        for bucket in sorted(self.counts):
+            cumulative += self.counts[bucket]
+            if cumulative >= threshold:
+                return self.get_bucket_upper_value(bucket) / 1_000_000
+
+        return self.get_bucket_upper_value(max(self.counts)) / 1_000_000
+
+    def to_dict(self) -> dict[str, int]:
+        # Ключи-строки, чтобы состояние можно было сохранить в JSON
+        return {str(bucket): count for bucket, count in self.counts.items()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, int]) -> "LatencyHistogram":
+        return cls({int(bucket): count for bucket, count in data.items()})
+
+
+class LatencyRecorder:
+    """
+    Сборщик задержек по методу и шаблону маршрута, например "GET /api/v1/courses/{course_id}".
+    Подписывается на запросы через add_request_listener.
+    """
+
+    def __init__(self):
+        self.histograms: defaultdict[str, LatencyHistogram] = defaultdict(
+            LatencyHistogram
+        )
+
+    def __call__(self, record: RequestRecord) -> None:
+        endpoint = f"{record.method} {get_route_template(record.path)}"
+        self.histograms[endpoint].record(record.elapsed)
+
+    def merge(self, other: "LatencyRecorder") -> None:
+        for endpoint, histogram in other.histograms.items():
+            self.histograms[endpoint].merge(histogram)
+
+    def to_dict(self) -> dict[str, dict[str, int]]:
+        return {
+            endpoint: histogram.to_dict()
+            for endpoint, histogram in self.histograms.items()
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, dict[str, int]]) -> "LatencyRecorder":
+        recorder = cls()
+        for endpoint, histogram in data.items():
+            recorder.histograms[endpoint] = LatencyHistogram.from_dict(histogram)
+        return recorder
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """
+        Формирует перцентили задержек по каждому эндпоинту.
+
+        :return: Словарь вида {endpoint: {"count": ..., "p50": ..., ...}} со значениями в миллисекундах.
+        """
+        return {
+            endpoint: {"count": histogram.total}
+            | {
+                f"p{value:g}": round(histogram.percentile(value) * 1000, 3)
+                for value in REPORT_PERCENTILES
+            }
+            for endpoint, histogram in sorted(self.histograms.items())
+        }
+
+
+def format_table(rows: list[list[str]]) -> list[str]:
+    """
+    Функция форматирует строки в таблицу с выровненными колонками.
+
+    :param rows: Строки таблицы, первая строка — заголовок.
+    :return: Строки для вывода.
+    """
+    widths = [max(len(row[index]) for row in rows) for index in range(len(rows[0]))]
+    return [
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+        for row in rows
+    ]
@@ -0,0 +1,60 @@
+import argparse
+import asyncio
+
+from clients.http_transport import close_async_http_transports
+from tools.load.runner import LoadRunner, StageSchema
+from tools.load.scenarios import SCENARIOS, create_load_context
+
+
+def parse_weighted(value: str) -> tuple[str, float]:
+    name, _, weight = value.partition(":")
+    if name not in SCENARIOS:
+        raise argparse.ArgumentTypeError(
+            f"Неизвестный сценарий {name}, доступные: {', '.join(SCENARIOS)}"
+        )
+    return name, float(weight or 1)
+
+
+def parse_stage(value: str) -> StageSchema:
+    duration, _, rate = value.partition(":")
+    return StageSchema(duration=float(duration), rate=float(rate))
+
+
+async def main(args: argparse.Namespace) -> None:
+    # Этапы проверяются до создания данных на сервере
+    runner = LoadRunner(
+        scenarios=dict(args.scenario),
+        stages=args.stage,
+        concurrency=args.concurrency,
+    )
+    try:
+        context = await create_load_context(args.upload_file)
+        stats = await runner.run(context)
+    finally:
+        await close_async_http_transports()
+
+    print(stats.report())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.load", description="Нагрузочный прогон на типизированных клиентах"
+    )
+    parser.add_argument(
+        "--scenario",
+        type=parse_weighted,
+        action="append",
+        required=True,
+        help="Сценарий и его вес в формате name[:weight], например get_user_me:3",
+    )
+    parser.add_argument(
+        "--stage",
+        type=parse_stage,
+        action="append",
+        required=True,
+        help="Этап нагрузки в формате seconds:rate, например 30:50 — разгон до 50 rps за 30 секунд",
+    )
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--upload-file", default="./testdata/files/image.png")
+
+    asyncio.run(main(parser.parse_args()))
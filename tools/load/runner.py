@@ -0,0 +1,124 @@
+import asyncio
+import random
+import time
+
+from httpx import HTTPError
+from pydantic import BaseModel, Field
+
+from clients.api_client import add_request_listener, remove_request_listener
+from tools.load.scenarios import SCENARIOS, LoadContext
+from tools.load.stats import LoadStats
+
+
+class StageSchema(BaseModel):
+    """
+    Описание структуры этапа нагрузки: за duration секунд интенсивность
+    линейно меняется от значения предыдущего этапа до rate запросов в секунду.
+    """
+
+    duration: float = Field(gt=0)
+    rate: float = Field(ge=0)
+
+
+class LoadRunner:
+    """
+    Генератор нагрузки по открытой модели: итерации сценариев запускаются
+    с заданной интенсивностью (пуассоновский поток) независимо от скорости ответов.
+    Если одновременно выполняется concurrency итераций, новые прибытия отбрасываются
+    и учитываются в отчёте как dropped.
+    """
+
+    def __init__(
+        self,
+        scenarios: dict[str, float],
+        stages: list[StageSchema],
+        concurrency: int,
+        stats: LoadStats | None = None,
+    ):
+        """
+        :param scenarios: Названия сценариев из SCENARIOS и их веса.
+        :param stages: Этапы нагрузки.
+        :param concurrency: Максимальное количество одновременно выполняемых итераций.
+        :param stats: Сборщик статистики.
+        :raises ValueError: Если ни на одном этапе интенсивность не больше нуля.
+        """
+        if not any(stage.rate > 0 for stage in stages):
+            raise ValueError("Хотя бы у одного этапа нагрузки rate должен быть больше нуля")
+
+        self.scenarios = [SCENARIOS[name] for name in scenarios]
+        self.weights = list(scenarios.values())
+        self.stages = stages
+        self.concurrency = concurrency
+        self.stats = stats or LoadStats()
+
+    def get_rate(self, elapsed: float) -> float | None:
+        """
+        Возвращает интенсивность нагрузки в момент времени elapsed.
+
+        :param elapsed: Время с начала прогона в секундах.
+        :return: Запросов в секунду или None, если все этапы завершены.
+        """
+        start_rate = 0.0
+        for stage in self.stages:
+            if elapsed < stage.duration:
+                return start_rate + (stage.rate - start_rate) * elapsed / stage.duration
+            elapsed -= stage.duration
+            start_rate = stage.rate
+
+        return None
+
+    async def run(self, context: LoadContext) -> LoadStats:
+        """
+        Выполняет нагрузочный прогон.
+
+        :param context: Общие данные и клиенты сценариев.
+        :return: Собранная статистика.
+        """
+        in_flight: set[asyncio.Task] = set()
+        # Интенсивность меняется во времени, поэтому прибытия генерируем методом прореживания:
+        # пуассоновский поток с максимальной интенсивностью, из которого каждое прибытие
+        # принимается с вероятностью rate(t) / max_rate
+        max_rate = max(stage.rate for stage in self.stages)
+        add_request_listener(self.stats)
+        self.stats.started_at = time.monotonic()
+
+        # Прибытия планируются по абсолютным часам: если цикл отстал (медленные ответы,
+        # загруженный event loop), следующие прибытия не сдвигаются — иначе под нагрузкой
+        # интенсивность падала бы и возникал coordinated omission
+        next_at = self.stats.started_at
+
+        try:
+            while True:
+                next_at += random.expovariate(max_rate)
+                await asyncio.sleep(max(0.0, next_at - time.monotonic()))
+                rate = self.get_rate(next_at - self.stats.started_at)
+                if rate is None:
+                    break
+                if random.random() * max_rate > rate:
+                    continue
+
+                if len(in_flight) >= self.concurrency:
+                    self.stats.dropped += 1
+                    continue
+
+                [scenario] = random.choices(self.scenarios, self.weights)
+                task = asyncio.create_task(self._iterate(scenario, context))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+
+            await asyncio.gather(*in_flight)
+        finally:
+            remove_request_listener(self.stats)
+
+        return self.stats
+
+    async def _iterate(self, scenario, context: LoadContext) -> None:
+        try:
+            await scenario(context)
+        except HTTPError:
+            # Ошибки запросов уже учтены в статистике через request_listeners
+            pass
+        except Exception as error:
+            # Ошибки самого сценария (KeyError, ошибки валидации и т.п.) до request_listeners
+            # не доходят, поэтому учитываются отдельно
+            self.stats.add_scenario_error(scenario.__name__, error)
@@ -0,0 +1,163 @@
+from typing import Awaitable, Callable
+
+from clients.courses.courses_client import AsyncCoursesClient, get_async_courses_client
+from clients.courses.courses_schema import (
+    CreateCourseRequestSchema,
+    GetCoursesQuerySchema,
+)
+from clients.exercises.exercises_client import (
+    AsyncExercisesClient,
+    get_async_exercises_client,
+)
+from clients.exercises.exercises_schema import (
+    CreateExerciseRequestSchema,
+    GetExercisesQuerySchema,
+)
+from clients.files.files_client import AsyncFilesClient, get_async_files_client
+from clients.files.files_schema import CreateFileRequestSchema
+from clients.private_http_builder import AuthenticationUserSchema
+from clients.users.private_users_client import (
+    AsyncPrivateUsersClient,
+    get_async_private_users_client,
+)
+from clients.users.public_users_client import (
+    AsyncPublicUsersClient,
+    get_async_public_users_client,
+)
+from clients.users.users_schema import CreateUserRequestSchema
+from tools.factory import EntityFactory, SeedPlanSchema
+
+
+class LoadContext:
+    """
+    Данные и клиенты, общие для всех итераций сценариев нагрузочного прогона.
+    """
+
+    def __init__(
+        self,
+        user_id: str,
+        file_id: str,
+        course_id: str,
+        exercise_id: str,
+        upload_file: str,
+        public_users_client: AsyncPublicUsersClient,
+        private_users_client: AsyncPrivateUsersClient,
+        files_client: AsyncFilesClient,
+        courses_client: AsyncCoursesClient,
+        exercises_client: AsyncExercisesClient,
+    ):
+        self.user_id = user_id
+        self.file_id = file_id
+        self.course_id = course_id
+        self.exercise_id = exercise_id
+        self.upload_file = upload_file
+        self.public_users_client = public_users_client
+        self.private_users_client = private_users_client
+        self.files_client = files_client
+        self.courses_client = courses_client
+        self.exercises_client = exercises_client
+
+
+async def create_load_context(upload_file: str) -> LoadContext:
+    """
+    Функция создаёт пользователя, файл, курс и упражнение, с которыми работают сценарии.
+
+    :param upload_file: Путь к файлу для загрузки.
+    :return: Готовый к использованию LoadContext.
+    """
+    plan = SeedPlanSchema(upload_file=upload_file)
+    [user] = await EntityFactory(on_progress=None).seed(plan)
+    [course] = user.courses
+
+    authentication_user = AuthenticationUserSchema(
+        email=user.request.email, password=user.request.password
+    )
+    return LoadContext(
+        user_id=user.response.user.id,
+        file_id=course.file.file.id,
+        course_id=course.course.course.id,
+        exercise_id=course.exercises[0].exercise.id,
+        upload_file=upload_file,
+        public_users_client=get_async_public_users_client(),
+        private_users_client=await get_async_private_users_client(authentication_user),
+        files_client=await get_async_files_client(authentication_user),
+        courses_client=await get_async_courses_client(authentication_user),
+        exercises_client=await get_async_exercises_client(authentication_user),
+    )
+
+
+async def create_user(context: LoadContext) -> None:
+    await context.public_users_client.create_user_api(CreateUserRequestSchema())
+
+
+async def get_user_me(context: LoadContext) -> None:
+    await context.private_users_client.get_user_me_api()
+
+
+async def get_user(context: LoadContext) -> None:
+    await context.private_users_client.get_user_api(context.user_id)
+
+
+async def create_file(context: LoadContext) -> None:
+    await context.files_client.create_file_api(
+        CreateFileRequestSchema(upload_file=context.upload_file)
+    )
+
+
+async def get_file(context: LoadContext) -> None:
+    await context.files_client.get_file_api(context.file_id)
+
+
+async def create_course(context: LoadContext) -> None:
+    await context.courses_client.create_course_api(
+        CreateCourseRequestSchema(
+            preview_file_id=context.file_id, created_by_user_id=context.user_id
+        )
+    )
+
+
+async def get_course(context: LoadContext) -> None:
+    await context.courses_client.get_course_api(context.course_id)
+
+
+async def get_courses(context: LoadContext) -> None:
+    await context.courses_client.get_courses_api(
+        GetCoursesQuerySchema(user_id=context.user_id)
+    )
+
+
+async def create_exercise(context: LoadContext) -> None:
+    await context.exercises_client.create_exercise_api(
+        CreateExerciseRequestSchema(course_id=context.course_id)
+    )
+
+
+async def get_exercise(context: LoadContext) -> None:
+    await context.exercises_client.get_exercise_api(context.exercise_id)
+
+
+async def get_exercises(context: LoadContext) -> None:
+    await context.exercises_client.get_exercises_api(
+        GetExercisesQuerySchema(courseId=context.course_id)
+    )
+
+
+Scenario = Callable[[LoadContext], Awaitable[None]]
+
+# Доступные сценарии: одна итерация сценария — один вызов метода типизированного клиента
+SCENARIOS: dict[str, Scenario] = {
+    scenario.__name__: scenario
+    for scenario in (
+        create_user,
+        get_user_me,
+        get_user,
+        create_file,
+        get_file,
+        create_course,
+        get_course,
+        get_courses,
+        create_exercise,
+        get_exercise,
+        get_exercises,
+    )
+}
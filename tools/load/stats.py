@@ -0,0 +1,75 @@
+import time
+from collections import defaultdict
+
+from clients.api_client import RequestRecord
+from tools.latency import REPORT_PERCENTILES, LatencyHistogram, format_table
+from tools.routes import get_route_template
+
+
+class EndpointStats:
+    """
+    Накопленная статистика запросов к одному эндпоинту.
+    """
+
+    def __init__(self):
+        self.histogram = LatencyHistogram()
+        self.errors = 0
+
+    def add(self, record: RequestRecord) -> None:
+        self.histogram.record(record.elapsed)
+        if record.error is not None or record.status_code >= 400:
+            self.errors += 1
+
+
+class LoadStats:
+    """
+    Сборщик статистики нагрузочного прогона: пропускная способность и перцентили задержек
+    по каждому эндпоинту. Подписывается на запросы через add_request_listener.
+    """
+
+    def __init__(self):
+        self.endpoints: defaultdict[str, EndpointStats] = defaultdict(EndpointStats)
+        self.dropped = 0
+        # "сценарий: тип исключения" -> количество ошибок, не связанных с запросами
+        self.scenario_errors: defaultdict[str, int] = defaultdict(int)
+        self.started_at = time.monotonic()
+
+    def __call__(self, record: RequestRecord) -> None:
+        endpoint = f"{record.method} {get_route_template(record.path)}"
+        self.endpoints[endpoint].add(record)
+
+    def add_scenario_error(self, scenario: str, error: Exception) -> None:
+        self.scenario_errors[f"{scenario}: {type(error).__name__}"] += 1
+
+    def report(self) -> str:
+        """
+        Формирует текстовый отчёт по эндпоинтам.
+
+        :return: Таблица со статистикой.
+        """
+        duration = max(time.monotonic() - self.started_at, 1e-9)
+        rows = [
+            ["endpoint", "requests", "errors", "rps"]
+            + [f"p{value:g}, ms" for value in REPORT_PERCENTILES]
+        ]
+
+        for endpoint, stats in sorted(self.endpoints.items()):
+            histogram = stats.histogram
+            rows.append(
+                [
+                    endpoint,
+                    str(histogram.total),
+                    str(stats.errors),
+                    f"{histogram.total / duration:.1f}",
+                ]
+                + [
+                    f"{histogram.percentile(value) * 1000:.1f}"
+                    for value in REPORT_PERCENTILES
+                ]
+            )
+
+        lines = format_table(rows)
+        lines.append(f"duration: {duration:.1f}s, dropped arrivals: {self.dropped}")
+        for error, count in sorted(self.scenario_errors.items()):
+            lines.append(f"scenario error {error}: {count}")
+        return "\n".join(lines)
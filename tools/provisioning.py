@@ -0,0 +1,102 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import Any, Callable
+
+from tools.fakers import fake
+
+# Количество потоков, в которых одновременно выполняются независимые шаги подготовки данных
+PROVISIONING_WORKERS = 8
+
+
+@lru_cache(maxsize=None)
+def get_provisioning_executor() -> ThreadPoolExecutor:
+    """
+    Функция создаёт общий для процесса пул потоков для подготовки тестовых данных.
+
+    :return: Готовый к использованию ThreadPoolExecutor.
+    """
+    return ThreadPoolExecutor(
+        max_workers=PROVISIONING_WORKERS, thread_name_prefix="provisioning"
+    )
+
+
+class ProvisioningGraph:
+    """
+    Граф зависимостей тестовых данных (пользователь → файл → курс → упражнение).
+
+    Каждый узел — функция, которая получает результаты своих зависимостей в виде
+    именованных аргументов. Независимые узлы выполняются одновременно, поэтому время
+    подготовки определяется самой длинной цепочкой, а не суммой всех шагов.
+    Результаты узлов запоминаются и переиспользуются в рамках графа.
+    """
+
+    def __init__(
+        self, executor: ThreadPoolExecutor | None = None, fake_seed: int | None = None
+    ):
+        """
+        :param executor: Пул потоков для выполнения узлов. По умолчанию используется общий пул.
+        :param fake_seed: Seed собственного потока тестовых данных графа (общий граф группы
+            shared_setup). По умолчанию узлы берут данные из потока текущего теста.
+        """
+        self.executor = executor or get_provisioning_executor()
+        self.fake_seed = fake_seed
+        self.nodes: dict[str, tuple[Callable[..., Any], tuple[str, ...]]] = {}
+        self.results: dict[str, Any] = {}
+
+    def add(
+        self, name: str, func: Callable[..., Any], depends_on: tuple[str, ...] = ()
+    ) -> None:
+        """
+        Добавляет узел в граф.
+
+        :param name: Название узла, оно же имя аргумента для зависимых узлов.
+        :param func: Функция, создающая значение узла.
+        :param depends_on: Названия узлов, результаты которых нужны функции.
+        """
+        self.nodes[name] = (func, depends_on)
+
+    def resolve(self, name: str) -> Any:
+        """
+        Вычисляет узел вместе со всеми его зависимостями.
+
+        :param name: Название узла.
+        :return: Результат функции узла.
+        """
+        pending = self._collect(name)
+        running: dict[Future, str] = {}
+
+        # Вызывающий поток ждёт узлы, поэтому пока активен поток графа,
+        # данные Faker берутся только из него
+        stream = (
+            nullcontext() if self.fake_seed is None else fake.stream(self.fake_seed)
+        )
+        with stream:
+            # Планирование выполняется в вызывающем потоке, воркеры никогда не ждут друг друга
+            while pending or running:
+                for node in list(pending):
+                    func, depends_on = self.nodes[node]
+                    if all(dependency in self.results for dependency in depends_on):
+                        kwargs = {
+                            dependency: self.results[dependency]
+                            for dependency in depends_on
+                        }
+                        running[self.executor.submit(func, **kwargs)] = node
+                        pending.remove(node)
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self.results[running.pop(future)] = future.result()
+
+        return self.results[name]
+
+    def _collect(self, name: str) -> list[str]:
+        if name in self.results:
+            return []
+
+        _, depends_on = self.nodes[name]
+        nodes = [name]
+        for dependency in depends_on:
+            nodes.extend(node for node in self._collect(dependency) if node not in nodes)
+
+        return nodes
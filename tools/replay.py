@@ -0,0 +1,207 @@
+import argparse
+import asyncio
+import json
+import re
+import time
+from pathlib import Path
+from typing import Iterable
+
+from pydantic import HttpUrl
+
+from clients.api_client import (
+    AsyncAPIClient,
+    add_request_listener,
+    remove_request_listener,
+)
+from clients.http_transport import close_async_http_transports
+from clients.private_http_builder import (
+    AuthenticationUserSchema,
+    get_async_private_http_client,
+)
+from clients.public_http_builder import get_async_public_http_client
+from config import settings
+from tools.load.stats import LoadStats
+from tools.traffic import (
+    TRAFFIC_LOG_PATH,
+    TrafficRecordSchema,
+    get_resource_ids,
+    read_traffic,
+)
+
+# Маршруты, из тел которых берутся учётные данные пользователей журнала
+CREDENTIALS_ROUTES = frozenset({"/api/v1/users", "/api/v1/authentication/login"})
+UUID_PATTERN = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+
+
+class TrafficReplayer:
+    """
+    Воспроизводит журнал трафика с исходными интервалами между запросами или быстрее.
+
+    Журнал читается лениво. Запросы отправляются конкурентно, не более concurrency
+    одновременно: если все слоты заняты, чтение журнала ждёт (запросы не отбрасываются).
+    Идентификаторы, созданные при записи, заменяются идентификаторами, которые вернул
+    целевой сервер, а приватные запросы выполняются от имени тех же пользователей —
+    их учётные данные берутся из записанных запросов создания пользователя и логина.
+    Запросы одного пользователя выполняются строго по порядку, чтобы, например,
+    курс не создавался раньше самого пользователя.
+    """
+
+    def __init__(
+        self, speed: float, concurrency: int, stats: LoadStats | None = None
+    ):
+        """
+        :param speed: Во сколько раз ускорить воспроизведение (0 — без пауз между запросами).
+        :param concurrency: Максимальное количество одновременных запросов.
+        :param stats: Сборщик статистики.
+        """
+        self.speed = speed
+        self.concurrency = concurrency
+        self.stats = stats or LoadStats()
+        self.skipped = 0
+        self.credentials: dict[str, str] = {}
+        self.ids: dict[str, str] = {}
+        self._user_locks: dict[str, asyncio.Lock] = {}
+
+    async def run(self, records: Iterable[TrafficRecordSchema]) -> LoadStats:
+        """
+        Воспроизводит запросы журнала.
+
+        :param records: Строки журнала в порядке записи.
+        :return: Собранная статистика.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        in_flight: set[asyncio.Task] = set()
+        first_timestamp: float | None = None
+        add_request_listener(self.stats)
+        self.stats.started_at = time.monotonic()
+
+        try:
+            for record in records:
+                user = record.user or self.remember_credentials(record)
+
+                if self.speed > 0:
+                    first_timestamp = first_timestamp or record.timestamp
+                    due = (record.timestamp - first_timestamp) / self.speed
+                    delay = due - (time.monotonic() - self.stats.started_at)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                await semaphore.acquire()
+                task = asyncio.create_task(self._replay_in_order(record, user))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+                task.add_done_callback(lambda _: semaphore.release())
+
+            await asyncio.gather(*in_flight)
+        finally:
+            remove_request_listener(self.stats)
+
+        return self.stats
+
+    def remember_credentials(self, record: TrafficRecordSchema) -> str | None:
+        """
+        Запоминает учётные данные из запроса создания пользователя или логина.
+
+        :param record: Строка журнала.
+        :return: Email пользователя или None, если запрос не содержит учётных данных.
+        """
+        if record.method != "POST" or record.route not in CREDENTIALS_ROUTES:
+            return None
+
+        try:
+            body = json.loads(record.body or "")
+            self.credentials[body["email"]] = body["password"]
+            return body["email"]
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    def substitute_ids(self, value: str) -> str:
+        return UUID_PATTERN.sub(lambda match: self.ids.get(match[0], match[0]), value)
+
+    async def _replay_in_order(
+        self, record: TrafficRecordSchema, user: str | None
+    ) -> None:
+        if user is None:
+            return await self._replay(record)
+
+        # asyncio.Lock пропускает ожидающих в порядке очереди, то есть в порядке журнала
+        lock = self._user_locks.setdefault(user, asyncio.Lock())
+        async with lock:
+            await self._replay(record)
+
+    async def _replay(self, record: TrafficRecordSchema) -> None:
+        # Тела загрузок файлов отправлялись потоком и в журнал не попадают
+        if record.body is None and record.method in ("POST", "PATCH", "PUT"):
+            self.skipped += 1
+            return
+
+        if record.user is None:
+            client = AsyncAPIClient(get_async_public_http_client())
+        elif password := self.credentials.get(record.user):
+            client = AsyncAPIClient(
+                await get_async_private_http_client(
+                    AuthenticationUserSchema(email=record.user, password=password)
+                )
+            )
+        else:
+            self.skipped += 1
+            return
+
+        url = self.substitute_ids(record.path)
+        if record.query:
+            url = f"{url}?{self.substitute_ids(record.query)}"
+
+        content = self.substitute_ids(record.body).encode() if record.body else None
+        headers = {"Content-Type": record.content_type} if record.content_type else None
+        try:
+            response = await client.request(
+                record.method, url, content=content, headers=headers
+            )
+        except Exception:
+            # Ошибки запросов уже учтены в статистике через request_listeners
+            return
+
+        if record.response_ids and response.is_success:
+            try:
+                new_ids = get_resource_ids(response.json())
+            except ValueError:
+                return
+            self.ids.update(zip(record.response_ids, new_ids))
+
+
+async def main(args: argparse.Namespace) -> None:
+    if args.base_url:
+        settings.http_client.url = HttpUrl(args.base_url)
+
+    replayer = TrafficReplayer(speed=args.speed, concurrency=args.concurrency)
+    try:
+        stats = await replayer.run(read_traffic(args.path))
+    finally:
+        await close_async_http_transports()
+
+    print(stats.report())
+    print(f"skipped requests: {replayer.skipped}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.replay",
+        description="Воспроизведение журнала трафика, записанного с pytest --traffic-log",
+    )
+    parser.add_argument("path", type=Path, nargs="?", default=TRAFFIC_LOG_PATH)
+    parser.add_argument(
+        "--base-url",
+        default=None,
+        help="Целевой сервер (по умолчанию HTTP_CLIENT.URL из настроек)",
+    )
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1,
+        help="Ускорение относительно исходных интервалов, например 10; 0 — без пауз",
+    )
+    parser.add_argument("--concurrency", type=int, default=100)
+
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,30 @@
+import re
+from functools import lru_cache
+
+# Идентификаторы в URL: UUID или числовые значения
+IDENTIFIER_PATTERN = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$"
+)
+
+
+@lru_cache(maxsize=4096)
+def get_route_template(path: str) -> str:
+    """
+    Функция приводит путь запроса к шаблону маршрута.
+
+    Идентификаторы заменяются именованными параметрами по названию коллекции,
+    например /api/v1/courses/<uuid> превращается в /api/v1/courses/{course_id}.
+
+    :param path: Путь запроса (query-параметры отбрасываются).
+    :return: Шаблон маршрута.
+    """
+    segments = path.split("?", 1)[0].split("/")
+
+    for index, segment in enumerate(segments):
+        if index and IDENTIFIER_PATTERN.match(segment):
+            collection = segments[index - 1]
+            # users -> user_id, courses -> course_id, exercises -> exercise_id
+            name = collection[:-1] if collection.endswith("s") else collection
+            segments[index] = f"{{{name or 'resource'}_id}}"
+
+    return "/".join(segments)
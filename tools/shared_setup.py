@@ -0,0 +1,63 @@
+import time
+from typing import Any, Callable, TypeVar
+
+import pytest
+from _pytest.nodes import Item
+
+from tools.fakers import fake
+
+T = TypeVar("T")
+
+
+class SharedSetupGroup:
+    """
+    Общие тестовые данные группы тестов с маркером shared_setup.
+
+    Значения создаются лениво при первом обращении любого теста группы и затем
+    переиспользуются остальными тестами, пока группу не сбросит тест с маркером mutating.
+    Данные Faker для значений берутся из собственного потока группы (fake.stream), поэтому
+    не зависят от того, какой тест группы выполнился первым.
+    """
+
+    def __init__(self, name: str, fake_seed: int):
+        """
+        :param name: Название группы из маркера shared_setup.
+        :param fake_seed: Seed потока тестовых данных группы.
+        """
+        self.name = name
+        self.fake_seed = fake_seed
+        self.values: dict[str, Any] = {}
+        # Суммарное время создания значений — по нему планировщик xdist оценивает группу
+        self.setup_seconds = 0.0
+
+    def get_or_create(self, key: str, factory: Callable[[], T]) -> T:
+        """
+        Возвращает значение группы, создавая его при первом обращении.
+
+        :param key: Название значения, например user или provisioning_graph.
+        :param factory: Функция, создающая значение.
+        :return: Общее для группы значение.
+        """
+        if key not in self.values:
+            started_at = time.perf_counter()
+            with fake.stream(self.fake_seed):
+                self.values[key] = factory()
+            self.setup_seconds += time.perf_counter() - started_at
+        return self.values[key]
+
+
+shared_setup_groups_key = pytest.StashKey[dict[str, SharedSetupGroup]]()
+
+
+def get_shared_setup_name(item: Item) -> str | None:
+    """
+    Функция определяет группу shared_setup теста.
+
+    :param item: Тест.
+    :return: Название группы из маркера (без аргумента — класс или модуль теста)
+        или None, если тест не входит в группу либо требует нового пользователя (fresh_user).
+    """
+    marker = item.get_closest_marker("shared_setup")
+    if marker is None or item.get_closest_marker("fresh_user"):
+        return None
+    return str(marker.args[0]) if marker.args else item.parent.nodeid
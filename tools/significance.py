@@ -0,0 +1,65 @@
+import math
+import statistics
+
+
+def mann_whitney_u(current: list[float], baseline: list[float]) -> float:
+    """
+    Функция выполняет односторонний U-критерий Манна-Уитни.
+
+    Проверяет гипотезу, что значения current систематически больше значений baseline.
+    Используется нормальная аппроксимация с поправкой на связки и на непрерывность.
+
+    :param current: Текущие измерения.
+    :param baseline: Исторические измерения.
+    :return: p-value: чем оно меньше, тем увереннее current больше baseline.
+    """
+    n1, n2 = len(current), len(baseline)
+    if not n1 or not n2:
+        return 1.0
+
+    # Ранжируем объединённую выборку, связкам присваиваем средний ранг
+    values = sorted((value, index < n1) for index, value in enumerate(current + baseline))
+    rank_sum = 0.0
+    tie_correction = 0.0
+    start = 0
+    while start < len(values):
+        end = start
+        while end + 1 < len(values) and values[end + 1][0] == values[start][0]:
+            end += 1
+
+        rank = (start + end) / 2 + 1
+        rank_sum += rank * sum(1 for _, is_current in values[start : end + 1] if is_current)
+        tied = end - start + 1
+        tie_correction += tied**3 - tied
+        start = end + 1
+
+    u = rank_sum - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_correction / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return 1 - statistics.NormalDist().cdf(z)
+
+
+# Коэффициент, приводящий MAD к стандартному отклонению нормального распределения
+MAD_SCALE = 1.4826
+
+
+def robust_upper_limit(baseline: list[float], k: float) -> float:
+    """
+    Функция вычисляет верхнюю границу нормы для одиночного измерения: median + k·MAD.
+
+    U-критерий для одного текущего измерения бесполезен: при n1=1 минимально
+    достижимое p-value около 0.058 для 20 прогонов истории и 0.045 даже для 100.
+    Медиана и MAD устойчивы к единичным выбросам в истории.
+
+    :param baseline: Исторические измерения.
+    :param k: Во сколько (масштабированных) MAD измерение может превышать медиану.
+    :return: Граница, выше которой измерение считается аномальным.
+    """
+    median = statistics.median(baseline)
+    mad = statistics.median(abs(value - median) for value in baseline)
+    return median + k * MAD_SCALE * mad
@@ -0,0 +1,165 @@
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterator
+
+from httpx import RequestNotRead
+from pydantic import BaseModel, Field, ValidationError
+
+from clients.api_client import RequestRecord
+from clients.authentication.authentication_flow import USER_EXTENSION
+from tools.routes import get_route_template
+
+# Журнал по умолчанию лежит в отдельной папке: requests.jsonl в корне репозитория
+# занят другими инструментами и в .gitignore
+TRAFFIC_LOG_PATH = Path("traffic/requests.jsonl")
+# Сколько строк накапливается в памяти перед записью в файл
+TRAFFIC_LOG_FLUSH_SIZE = 100
+
+
+class TrafficRecordSchema(BaseModel):
+    """
+    Описание структуры строки журнала трафика.
+    """
+
+    # Unix-время начала запроса
+    timestamp: float
+    method: str
+    route: str
+    path: str
+    query: str = ""
+    content_type: str | None = None
+    # Тело запроса в виде текста; None, если тело отправлялось потоком (загрузка файлов)
+    body: str | None = None
+    # Email пользователя, от имени которого выполнялся запрос (None — публичный запрос)
+    user: str | None = None
+    status_code: int | None = None
+    elapsed: float
+    # Идентификаторы из ответа на создание: при воспроизведении они заменяются новыми
+    response_ids: list[str] = Field(default_factory=list)
+
+
+def get_resource_ids(data: Any) -> list[str]:
+    """
+    Функция собирает значения всех полей "id" в JSON в порядке обхода.
+
+    :param data: Разобранный JSON.
+    :return: Список идентификаторов.
+    """
+    if isinstance(data, dict):
+        ids = [str(data["id"])] if "id" in data else []
+        for key, value in data.items():
+            if key != "id":
+                ids.extend(get_resource_ids(value))
+        return ids
+
+    if isinstance(data, list):
+        return [value for item in data for value in get_resource_ids(item)]
+
+    return []
+
+
+def build_traffic_record(record: RequestRecord) -> TrafficRecordSchema | None:
+    """
+    Функция строит строку журнала по выполненному запросу.
+
+    :param record: Запрос из request_listeners.
+    :return: Строка журнала или None, если запрос завершился ошибкой без ответа.
+    """
+    if record.response is None:
+        return None
+
+    request, response = record.response.request, record.response
+    try:
+        body = request.content.decode() if request.content else None
+    except (RequestNotRead, UnicodeDecodeError):
+        body = None
+
+    response_ids = []
+    if request.method == "POST" and response.is_success:
+        try:
+            response_ids = get_resource_ids(response.json())
+        except ValueError:
+            pass
+
+    return TrafficRecordSchema(
+        timestamp=time.time() - record.elapsed,
+        method=record.method,
+        route=get_route_template(record.path),
+        path=record.path,
+        query=request.url.query.decode(),
+        content_type=request.headers.get("content-type"),
+        body=body,
+        user=request.extensions.get(USER_EXTENSION),
+        status_code=record.status_code,
+        elapsed=record.elapsed,
+        response_ids=response_ids,
+    )
+
+
+class TrafficLog:
+    """
+    Журнал трафика в формате JSON Lines: по строке на каждый запрос APIClient.
+
+    Подписывается на запросы через add_request_listener. Строки накапливаются пачками
+    и дозаписываются одним вызовом write в файл, открытый на добавление, поэтому
+    в один журнал могут писать несколько процессов (воркеры xdist).
+    """
+
+    def __init__(self, path: Path = TRAFFIC_LOG_PATH):
+        """
+        :param path: Путь к файлу журнала.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._pending: list[str] = []
+
+    def __call__(self, record: RequestRecord) -> None:
+        traffic_record = build_traffic_record(record)
+        if traffic_record is None:
+            return
+
+        with self._lock:
+            self._pending.append(f"{traffic_record.model_dump_json()}\n")
+            if len(self._pending) < TRAFFIC_LOG_FLUSH_SIZE:
+                return
+            pending, self._pending = self._pending, []
+
+        self._write(pending)
+
+    def flush(self) -> None:
+        """
+        Записывает накопленные строки в файл.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if pending:
+            self._write(pending)
+
+    def _write(self, lines: list[str]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        descriptor = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            data = memoryview("".join(lines).encode())
+            while data:
+                data = data[os.write(descriptor, data) :]
+        finally:
+            os.close(descriptor)
+
+
+def read_traffic(path: Path) -> Iterator[TrafficRecordSchema]:
+    """
+    Функция лениво читает журнал трафика построчно.
+
+    :param path: Путь к файлу журнала.
+    :return: Итератор строк журнала; пустые и повреждённые строки пропускаются.
+    """
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                yield TrafficRecordSchema.model_validate_json(line)
+            except ValidationError:
+                continue